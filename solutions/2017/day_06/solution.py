@@ -3,6 +3,7 @@
 import csv
 
 from ...base import StrSplitSolution
+from ...utils.cycles import find_cycle
 
 
 class Solution(StrSplitSolution):
@@ -26,13 +27,8 @@ class Solution(StrSplitSolution):
         return arr
 
     def solve(self):
-        arr = self._parse_tsv()[0]  # don't mutate input
-        seen = [arr[:]]
+        banks = tuple(self._parse_tsv()[0])
 
-        while True:  # python could use a do-while
-            arr = self.redistribute(arr)
-            if arr in seen:
-                break
-            seen.append(arr[:])
+        cycle = find_cycle(banks, lambda b: tuple(self.redistribute(list(b))))
 
-        return (len(seen), len(seen) - seen.index(arr))
+        return (cycle.start + cycle.length, cycle.length)
@@ -1,21 +1,7 @@
 # prompt: https://adventofcode.com/2017/day/11
 
-from collections import defaultdict
-
 from ...base import BaseSolution, InputTypes
-
-# these totally cancel each other out
-OPPOSITES = [
-    ("sw", "n", "nw"),
-    ("se", "n", "ne"),
-    ("nw", "s", "sw"),
-    ("nw", "ne", "n"),
-    ("sw", "se", "s"),
-    ("ne", "s", "se"),
-    ("n", "s"),
-    ("ne", "sw"),
-    ("nw", "se"),
-]
+from ...utils.hex import FLAT_DIRECTIONS, distance, path
 
 
 class Solution(BaseSolution):
@@ -31,34 +17,8 @@ class Solution(BaseSolution):
         return InputTypes.STRSPLIT
 
     def solve(self):
-        self.counts = defaultdict(int)
-        max_dist = 0
-        for d in self.input:
-            self.counts[d] += 1
-            self.cancel()
-            max_dist = max(self.distance(), max_dist)
-
-        return (self.distance(), max_dist)
-
-    def distance(self):
-        return sum(self.counts.values())
-
-    def cancel(self):
-        # cancels out opposites
-        while True:
-            changed = False
-
-            for pair in OPPOSITES:
-                change = min(self.counts[pair[0]], self.counts[pair[1]])
-                if change:
-                    changed = True
-
-                    # don't change the result, if there is one
-                    for d in pair[:2]:
-                        self.counts[d] -= change
-
-                    if len(pair) == 3:
-                        self.counts[pair[2]] += change
+        # hex coordinates make distance a quick calculation,
+        # so there's no need to cancel out opposite steps as we go
+        positions = path(",".join(self.input), FLAT_DIRECTIONS)
 
-            if not changed:
-                break
+        return (distance(positions[-1]), max(map(distance, positions)))
@@ -1,6 +1,7 @@
 # prompt: https://adventofcode.com/2017/day/12
 
 from ...base import BaseSolution, InputTypes
+from ...utils.components import DisjointSet
 
 
 class Solution(BaseSolution):
@@ -11,15 +12,6 @@ class Solution(BaseSolution):
     def input_type(self):
         return InputTypes.STRSPLIT
 
-    def recurse_connections(self, i, res=None):
-        if res is None:
-            res = set()
-        if i not in res:
-            res.add(i)
-            for n in self.tree[i]:
-                self.recurse_connections(n, res)
-        return res
-
     def build_map(self, input_):
         res = []
         for line in input_:
@@ -30,14 +22,9 @@ class Solution(BaseSolution):
     def solve(self):
         self.tree = self.build_map(self.input)
 
-        groups = [self.recurse_connections(0)]
-
-        already_seen = set(groups[0])
-
-        for i in range(len(self.tree)):
-            if i not in already_seen:
-                groups.append(self.recurse_connections(i))
-                already_seen.update(groups[-1])
-                already_seen.add(i)
+        programs = DisjointSet(len(self.tree))
+        for i, connections in self.tree.items():
+            for n in connections:
+                programs.union(i, n)
 
-        return (len(groups[0]), len(groups))
+        return (programs.component_size(0), programs.num_components)
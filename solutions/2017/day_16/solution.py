@@ -3,6 +3,7 @@
 from collections import deque
 
 from ...base import BaseSolution, InputTypes
+from ...utils.cycles import fast_forward
 
 
 class Solution(BaseSolution):
@@ -31,21 +32,7 @@ class Solution(BaseSolution):
             l[j] = t
             return "".join(l)
 
-        programs = "".join([chr(i) for i in range(97, 97 + 16)])
-        seen = []
-
-        for n in range(num_dances):
-            # using a dict with the result pre-calculated worked, but was way too slow
-            # if programs in seen:
-            #     programs = seen[programs]
-            #     continue
-
-            # instead, once we're in a loop, we don't have to keep doing it; we know the outcome
-            # what we don't know is how long the loop is, but we can know where in the sequence we'll be after 1bil tries
-            if programs in seen:
-                return seen[num_dances % n]
-            seen.append(programs)
-
+        def dance(programs):
             for i in self.input:
                 if i[0] == "s":
                     d = deque(programs)
@@ -61,5 +48,9 @@ class Solution(BaseSolution):
                     )
                 else:
                     raise BaseException("who knows")
+            return programs
+
+        programs = "".join([chr(i) for i in range(97, 97 + 16)])
 
-        return "".join(programs)
+        # once we're in a loop, we don't have to keep dancing; we know where in the loop we'll be after 1bil tries
+        return fast_forward(programs, dance, num_dances)
@@ -2,7 +2,7 @@
 
 from itertools import product
 
-from ..intcode import IntcodeComputer, IntcodeSolution
+from ..intcode import IntcodeComputer, IntcodeFunction, IntcodeSolution
 
 
 class Solution(IntcodeSolution):
@@ -19,13 +19,10 @@ class Solution(IntcodeSolution):
     def part_2(self):
         target = 19_690_720
 
+        # the noun and verb go in addresses 1 and 2, the result comes out of 0
+        program = IntcodeFunction(self.input, memory_args=(1, 2), returns=(0,))
         for noun, verb in product(range(100), range(100)):
-            computer = IntcodeComputer(self.input)
-            computer.program[1] = noun
-            computer.program[2] = verb
-            computer.run()
-            result = computer.program[0]
-            if result == target:
+            if program(noun, verb) == (target,):
                 return 100 * noun + verb
 
         raise RuntimeError("oh no")
@@ -1,8 +1,8 @@
 # prompt: https://adventofcode.com/2019/day/7
 
-from itertools import cycle, permutations
+from itertools import permutations
 
-from ..intcode import STOP_REASON, IntcodeComputer, IntcodeSolution
+from ..intcode import IntcodeComputer, IntcodeNetwork, IntcodeSolution, pipeline
 
 
 class Solution(IntcodeSolution):
@@ -26,19 +26,14 @@ class Solution(IntcodeSolution):
         max_signal = -9999
 
         for sequence in permutations([5, 6, 7, 8, 9], 5):
-            last_output = 0
-            cpu = [
-                IntcodeComputer(self.input, inputs=[setting]) for setting in sequence
-            ]
-
-            for computer in cycle(cpu):
-                computer.add_input(last_output)
-                finished = computer.run(num_outputs=1) == STOP_REASON.HALTED
-                last_output = computer.output[-1]
-                if finished:
-                    # make sure to take the output of amplifier E
-                    last_output = cpu[-1].output[-1]
-                    break
-            max_signal = max(max_signal, last_output)
+            network = IntcodeNetwork(
+                [IntcodeComputer(self.input, inputs=[setting]) for setting in sequence],
+                pipeline,
+            )
+            network.send(0, [0])
+            # runs until every amplifier halts
+            network.run()
+            # make sure to take the output of amplifier E
+            max_signal = max(max_signal, network.last_packet[len(sequence) - 1][0])
 
         return max_signal
@@ -9,14 +9,14 @@ class Solution(IntcodeSolution):
     _day = 9
 
     def part_1(self):
-        computer = IntcodeComputer(self.input, inputs=[1])
+        computer = IntcodeComputer(self.input, inputs=[1], jit=True)
         computer.run()
         assert len(computer.output) == 1
         return computer.output[0]
 
     @slow
     def part_2(self):
-        computer = IntcodeComputer(self.input, inputs=[2])
+        computer = IntcodeComputer(self.input, inputs=[2], jit=True)
         computer.run()
         assert len(computer.output) == 1
         return computer.output[0]
@@ -2,9 +2,10 @@
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Set
 
-from ..intcode import STOP_REASON, IntcodeComputer, IntcodeSolution
+from ...utils.graphs import GridPoint
+from ...utils.sparse_grid import ChunkedGrid
+from ..intcode import IntcodeComputer, IntcodeSolution, tuple_sink
 
 
 class Direction(Enum):
@@ -23,57 +24,59 @@ CHANGE_SET = {
 }
 
 
+# panel colors; panels that have never been painted are 0 (and black)
+BLACK = 1
+WHITE = 2
+
+
 @dataclass(frozen=True)
 class Point:
     x: int
     y: int
 
+    @property
+    def panel(self) -> GridPoint:
+        """
+        where this is in `Robot.panels`. `y` points up, so it's flipped to make rows read top to bottom
+        """
+        return -self.y, self.x
+
 
 class Robot:
     def __init__(self, program, start_white=False):
-        self.brain = IntcodeComputer(program)  # starts on black
+        # starts on black
+        self.brain = IntcodeComputer(
+            program,
+            input_provider=self.camera,
+            output_sink=tuple_sink(2, self.paint_and_move),
+        )
         self.location = Point(0, 0)
-        self.painted_panels: Set[Point] = set()
-        self.white_panels: Set[Point] = set()
+        # every panel that's been painted, by color. The robot paints its first panel
+        # right away, so starting it white doesn't change the count
+        self.panels = ChunkedGrid()
         if start_white:
-            self.white_panels.add(self.location)
+            self.panels[self.location.panel] = WHITE
         self._dir_index = 0
 
     def run(self):
-        while not self.step():
-            pass
-        return len(self.painted_panels)
-
-    def step(self):
-        self.brain.add_input(1 if self.location in self.white_panels else 0)
-        halted = self.brain.run(num_outputs=2) == STOP_REASON.HALTED
-        [paint_color, direction] = self.brain.output[-2:]
-
-        if paint_color == 1:
-            self.white_panels.add(self.location)
-        else:
-            self.white_panels.discard(self.location)
-        self.painted_panels.add(self.location)
+        # the robot reads the camera and paints as it goes, until it halts
+        self.brain.run()
+        return len(self.panels)
+
+    def camera(self) -> int:
+        return 1 if self.panels[self.location.panel] == WHITE else 0
+
+    def paint_and_move(self, paint_color: int, direction: int):
+        self.panels[self.location.panel] = WHITE if paint_color == 1 else BLACK
         self.rotate_and_move(direction)
-        return halted
 
     def rotate_and_move(self, direction):
         self._rotate(direction)
         self._move()
 
     def print_panels(self):
-        min_x = min(point.x for point in self.painted_panels)
-        min_y = min(point.y for point in self.painted_panels)
-        max_x = max(point.x for point in self.painted_panels)
-        max_y = max(point.y for point in self.painted_panels)
-
-        for y in range(max_y, min_y - 1, -1):
-            for x in range(min_x, max_x + 1):
-                if Point(x, y) in self.white_panels:
-                    print("#", end="")
-                else:
-                    print(" ", end="")
-            print()
+        # unpainted, black, white
+        print(self.panels.render("  #"))
 
     def _rotate(self, direction):
         """Rotate 90deg in either direction"""
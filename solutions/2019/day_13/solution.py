@@ -2,9 +2,10 @@
 
 
 from dataclasses import dataclass
+from typing import Dict, Tuple
 
 from ...base import slow
-from ..intcode import STOP_REASON, IntcodeComputer, IntcodeSolution
+from ..intcode import STOP_REASON, IntcodeComputer, IntcodeSolution, tuple_sink
 
 CHARS = [" ", "X", "B", "_", "o"]
 
@@ -21,7 +22,7 @@ class Solution(IntcodeSolution):
     _day = 13
 
     def part_1(self):
-        computer = IntcodeComputer(self.input)
+        computer = IntcodeComputer(self.input, jit=True)
         computer.run()
         tiles = []
         chunk_size = 3
@@ -34,23 +35,25 @@ class Solution(IntcodeSolution):
     @slow
     def part_2(self):
         # the game works, but there's a little bit of input lag? so it's hard to play
-        computer = IntcodeComputer(self.input)
-        computer.program[0] = 2
+        screen: Dict[Tuple[int, int], int] = {}
         score = 0
+
+        def draw(x: int, y: int, tile_type: int):
+            nonlocal score
+            if x == -1 and y == 0:
+                score = tile_type
+            else:
+                screen[(x, y)] = tile_type
+
+        computer = IntcodeComputer(
+            self.input, jit=True, output_sink=tuple_sink(3, draw)
+        )
+        computer.program[0] = 2
         computer.run(
             num_outputs=24 * 36 * 3
         )  # screen dimensions x 3, to seed the initial outputs
         while True:
             halted = computer.run(num_outputs=3) == STOP_REASON.HALTED
-            screen = {}
-            chunk_size = 3
-            # only really have to check new frames here, not the whole thing every time
-            for i in range(0, len(computer.output), chunk_size):
-                x, y, tile_type = computer.output[i : i + chunk_size]
-                if x == -1 and y == 0:
-                    score = tile_type
-                    continue
-                screen[(x, y)] = tile_type
 
             print("Score:", score)
             for y in range(24):
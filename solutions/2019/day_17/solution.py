@@ -80,19 +80,16 @@ class Solution(IntcodeSolution):
         # B = R,12,L,8,L,4,L,4
         # C = L,8,R,6,L,6
 
-        def ascii_input(line: str):
-            return [*map(ord, line), ord("\n")]
-
-        inputs = [
-            *ascii_input("B,C,B,C,A,B,A,B,A,C"),
-            *ascii_input("L,8,L,4,R,12,L,6,L,4"),
-            *ascii_input("R,12,L,8,L,4,L,4"),
-            *ascii_input("L,8,R,6,L,6"),
-            *ascii_input("n"),
-        ]
-
-        computer = IntcodeComputer(self.input, inputs=inputs)
+        computer = IntcodeComputer(self.input)
         computer.program[0] = 2
+        for line in (
+            "B,C,B,C,A,B,A,B,A,C",
+            "L,8,L,4,R,12,L,6,L,4",
+            "R,12,L,8,L,4,L,4",
+            "L,8,R,6,L,6",
+            "n",
+        ):
+            computer.add_input(line)
 
         computer.run()
 
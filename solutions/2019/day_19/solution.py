@@ -1,24 +1,24 @@
 # prompt: https://adventofcode.com/2019/day/19
 
-from ..intcode import IntcodeComputer, IntcodeSolution
+from functools import cached_property
+from itertools import product
+
+from ..intcode import IntcodeFunction, IntcodeSolution
 
 
 class Solution(IntcodeSolution):
     _year = 2019
     _day = 19
 
+    @cached_property
+    def drone(self) -> IntcodeFunction:
+        return IntcodeFunction(self.input)
+
     def is_in_tractor(self, x: int, y: int) -> int:
-        computer = IntcodeComputer(self.input, inputs=[x, y])
-        computer.run()
-        return computer.output[-1]
+        return self.drone(x, y)[-1]
 
     def part_1(self):
-        results = 0
-        for x in range(50):
-            for y in range(50):
-                results += self.is_in_tractor(x, y)
-
-        return results
+        return sum(out[-1] for out in self.drone.map(product(range(50), range(50))))
 
     def part_2(self):
         # cribbed https://www.reddit.com/r/adventofcode/comments/ecogl3/2019_day_19_solutions/fbcu8yk/
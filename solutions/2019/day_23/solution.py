@@ -1,61 +1,65 @@
 # prompt: https://adventofcode.com/2019/day/23
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
-from ..intcode import STOP_REASON, IntcodeComputer, IntcodeSolution
+from ..intcode import IntcodeComputer, IntcodeNetwork, IntcodeSolution, Packet
+
+NAT_ADDRESS = 255
 
 
 class Solution(IntcodeSolution):
     _year = 2019
     _day = 23
 
+    def build_network(self, nat) -> IntcodeNetwork:
+        """
+        Packets are `(to, x, y)`. Anything for the NAT is handed to `nat` instead of being delivered.
+        """
+
+        def router(network: IntcodeNetwork, _source: int, packet: Packet):
+            to, x, y = packet
+            if to == NAT_ADDRESS:
+                nat(network, x, y)
+            else:
+                network.send(to, (x, y))
+
+        return IntcodeNetwork(
+            [
+                IntcodeComputer(
+                    self.input, inputs=[address], default_input=-1, jit=True
+                )
+                for address in range(50)
+            ],
+            router,
+            packet_size=3,
+        )
+
     def part_1(self):
-        vms = [
-            IntcodeComputer(self.input, inputs=[address], default_input=-1)
-            for address in range(50)
-        ]
+        first_y: List[int] = []
 
-        while True:
-            for vm in vms:
-                vm.run(num_outputs=3, num_inputs=1)
-                maybe_output: Optional[Tuple[int, int, int]] = vm.output[-3:]
-                if not maybe_output:
-                    continue
-                to, x, y = maybe_output
-                if to == 255:
-                    return y
+        def nat(network: IntcodeNetwork, _x: int, y: int):
+            first_y.append(y)
+            network.stop()
 
-                vms[to].add_input([x, y])
+        self.build_network(nat).run()
+        return first_y[0]
 
     def part_2(self):
-        vms = [
-            IntcodeComputer(self.input, inputs=[address], default_input=-1)
-            for address in range(50)
-        ]
-
         nat_mem: Optional[Tuple[int, int]] = None
         last_sent: Optional[Tuple[int, int]] = None
 
-        while True:
-            for vm in vms:
-                stopped_reason = vm.run(num_outputs=3, num_inputs=1)
+        def nat(_network: IntcodeNetwork, x: int, y: int):
+            nonlocal nat_mem
+            nat_mem = (x, y)
 
-                if stopped_reason == STOP_REASON.NUM_INPUT:
-                    # stopped because we took an input, don't look for output
-                    continue
-
-                to, x, y = vm.output[-3:]
-
-                if to == 255:
-                    nat_mem = (x, y)
-                else:
-                    vms[to].add_input([x, y])
-
-            if all(vm.idle for vm in vms):
-                # network is idle, send the special packet to 0
-                vms[0].add_input(nat_mem)
+        network = self.build_network(nat)
+        while True:
+            # runs until the network is idle
+            network.run()
+            assert nat_mem, "network went idle before anything was sent to the NAT"
 
-                if last_sent and last_sent[1] == nat_mem[1]:
-                    return nat_mem[1]
+            if last_sent and last_sent[1] == nat_mem[1]:
+                return nat_mem[1]
 
-                last_sent = nat_mem
+            network.send(0, nat_mem)
+            last_sent = nat_mem
@@ -1,4831 +0,0 @@
-# FOR DAY 25 ONLY
-#
-# this is a memory dump of my intcode computer standing at the entrance holding all the items
-# Moved it here to keep the actual solution slim
-
-STATE = {
-    0: 109,
-    1: 4789,
-    2: 21101,
-    3: 3124,
-    4: 0,
-    5: 1,
-    6: 21102,
-    7: 1,
-    8: 13,
-    9: 0,
-    10: 1105,
-    11: 1,
-    12: 1424,
-    13: 21102,
-    14: 1,
-    15: 166,
-    16: 1,
-    17: 21101,
-    18: 24,
-    19: 0,
-    20: 0,
-    21: 1105,
-    22: 1,
-    23: 1234,
-    24: 21102,
-    25: 1,
-    26: 31,
-    27: 0,
-    28: 1105,
-    29: 1,
-    30: 1984,
-    31: 1106,
-    32: 0,
-    33: 13,
-    34: 6,
-    35: 4,
-    36: 3,
-    37: 2,
-    38: 52,
-    39: 51,
-    40: 21,
-    41: 4,
-    42: 28,
-    43: 56,
-    44: 55,
-    45: 3,
-    46: 19,
-    47: -9,
-    48: -10,
-    49: 47,
-    50: 89,
-    51: 88,
-    52: 90,
-    53: 90,
-    54: 6,
-    55: 77,
-    56: 73,
-    57: 85,
-    58: 71,
-    59: 1,
-    60: 76,
-    61: 68,
-    62: 63,
-    63: 65,
-    64: 22,
-    65: -27,
-    66: 70,
-    67: 76,
-    68: 81,
-    69: 87,
-    70: 5,
-    71: 105,
-    72: 105,
-    73: 107,
-    74: 108,
-    75: 95,
-    76: 4,
-    77: 97,
-    78: 92,
-    79: 109,
-    80: 109,
-    81: 5,
-    82: 110,
-    83: 105,
-    84: 110,
-    85: 108,
-    86: 95,
-    87: 4,
-    88: 115,
-    89: 96,
-    90: 109,
-    91: 109,
-    92: 13,
-    93: -3,
-    94: 59,
-    95: 101,
-    96: 85,
-    97: 92,
-    98: 97,
-    99: 13,
-    100: 84,
-    101: 80,
-    102: 92,
-    103: 78,
-    104: 34,
-    105: -15,
-    106: 26,
-    107: -16,
-    108: 46,
-    109: 88,
-    110: 72,
-    111: 79,
-    112: 84,
-    113: 0,
-    114: 72,
-    115: 76,
-    116: -3,
-    117: 85,
-    118: 74,
-    119: 79,
-    120: 75,
-    121: -8,
-    122: 64,
-    123: 68,
-    124: 75,
-    125: 57,
-    126: 65,
-    127: 70,
-    128: 64,
-    129: 66,
-    130: 72,
-    131: 8,
-    132: -41,
-    133: 32,
-    134: -22,
-    135: 56,
-    136: 77,
-    137: 82,
-    138: -4,
-    139: 60,
-    140: 76,
-    141: 62,
-    142: 70,
-    143: -2,
-    144: 74,
-    145: -11,
-    146: 55,
-    147: 52,
-    148: 68,
-    149: 67,
-    150: 73,
-    151: 56,
-    152: 60,
-    153: 52,
-    154: -20,
-    155: 44,
-    156: 56,
-    157: 66,
-    158: -24,
-    159: 48,
-    160: 58,
-    161: 42,
-    162: 49,
-    163: 54,
-    164: -16,
-    165: -53,
-    166: 10,
-    167: 0,
-    168: 56,
-    169: 99,
-    170: 96,
-    171: 95,
-    172: 82,
-    173: 94,
-    174: 83,
-    175: 45,
-    176: -9,
-    177: 23,
-    178: -13,
-    179: 61,
-    180: 85,
-    181: 88,
-    182: 74,
-    183: 71,
-    184: 82,
-    185: 73,
-    186: 79,
-    187: 73,
-    188: 89,
-    189: 67,
-    190: 65,
-    191: -4,
-    192: 62,
-    193: 73,
-    194: 70,
-    195: 69,
-    196: 56,
-    197: 68,
-    198: 57,
-    199: 2,
-    200: -35,
-    201: 24,
-    202: -14,
-    203: 64,
-    204: 85,
-    205: 90,
-    206: 4,
-    207: 70,
-    208: 67,
-    209: 79,
-    210: 7,
-    211: 83,
-    212: -2,
-    213: 68,
-    214: 75,
-    215: -5,
-    216: 78,
-    217: 65,
-    218: 57,
-    219: 75,
-    220: -10,
-    221: 76,
-    222: 53,
-    223: 76,
-    224: 0,
-    225: -37,
-    226: 31,
-    227: -21,
-    228: 57,
-    229: 78,
-    230: 83,
-    231: -3,
-    232: 64,
-    233: 74,
-    234: 72,
-    235: 0,
-    236: 76,
-    237: -9,
-    238: 73,
-    239: 58,
-    240: 57,
-    241: -13,
-    242: 70,
-    243: 57,
-    244: 49,
-    245: 67,
-    246: -18,
-    247: 54,
-    248: 64,
-    249: 48,
-    250: 55,
-    251: -23,
-    252: 48,
-    253: 44,
-    254: 56,
-    255: 42,
-    256: -14,
-    257: -51,
-    258: 14,
-    259: -4,
-    260: 74,
-    261: 95,
-    262: 100,
-    263: 14,
-    264: 97,
-    265: 77,
-    266: 86,
-    267: 79,
-    268: 9,
-    269: 92,
-    270: 79,
-    271: 75,
-    272: 5,
-    273: 27,
-    274: -17,
-    275: 61,
-    276: 82,
-    277: 87,
-    278: 1,
-    279: 68,
-    280: 78,
-    281: 76,
-    282: 4,
-    283: 80,
-    284: -5,
-    285: 66,
-    286: 58,
-    287: 78,
-    288: 60,
-    289: -10,
-    290: 73,
-    291: 60,
-    292: 52,
-    293: 70,
-    294: -15,
-    295: 57,
-    296: 67,
-    297: 51,
-    298: 58,
-    299: -6,
-    300: -43,
-    301: 14,
-    302: -4,
-    303: 74,
-    304: 95,
-    305: 100,
-    306: 14,
-    307: 81,
-    308: 94,
-    309: 90,
-    310: 90,
-    311: 9,
-    312: 92,
-    313: 79,
-    314: 75,
-    315: 5,
-    316: 60,
-    317: -50,
-    318: 23,
-    319: 42,
-    320: 38,
-    321: -32,
-    322: 38,
-    323: 39,
-    324: 30,
-    325: 42,
-    326: 47,
-    327: -38,
-    328: 30,
-    329: 36,
-    330: 28,
-    331: 25,
-    332: 41,
-    333: 38,
-    334: 34,
-    335: 31,
-    336: 18,
-    337: 23,
-    338: 29,
-    339: 19,
-    340: 33,
-    341: -52,
-    342: 20,
-    343: 29,
-    344: -55,
-    345: 27,
-    346: 27,
-    347: 27,
-    348: 8,
-    349: 15,
-    350: -61,
-    351: 22,
-    352: 16,
-    353: -64,
-    354: 24,
-    355: 13,
-    356: 18,
-    357: -54,
-    358: -69,
-    359: -70,
-    360: -14,
-    361: 7,
-    362: 12,
-    363: -74,
-    364: -8,
-    365: -11,
-    366: 1,
-    367: -71,
-    368: 5,
-    369: -80,
-    370: -4,
-    371: -3,
-    372: 3,
-    373: -15,
-    374: -84,
-    375: -85,
-    376: -109,
-    377: 29,
-    378: -19,
-    379: 59,
-    380: 80,
-    381: 85,
-    382: -1,
-    383: 82,
-    384: 62,
-    385: 71,
-    386: 64,
-    387: -6,
-    388: 77,
-    389: 64,
-    390: 60,
-    391: -10,
-    392: 62,
-    393: 66,
-    394: 57,
-    395: 59,
-    396: 63,
-    397: 57,
-    398: 67,
-    399: 51,
-    400: -19,
-    401: 56,
-    402: 58,
-    403: 57,
-    404: 57,
-    405: -10,
-    406: -47,
-    407: 44,
-    408: -34,
-    409: 39,
-    410: 58,
-    411: 54,
-    412: -16,
-    413: 60,
-    414: 61,
-    415: 57,
-    416: 64,
-    417: 48,
-    418: 56,
-    419: -23,
-    420: 52,
-    421: 40,
-    422: 60,
-    423: 38,
-    424: -28,
-    425: 44,
-    426: 53,
-    427: -31,
-    428: 55,
-    429: 32,
-    430: 55,
-    431: -35,
-    432: 48,
-    433: 42,
-    434: 41,
-    435: -39,
-    436: 32,
-    437: 38,
-    438: 42,
-    439: -42,
-    440: -44,
-    441: 12,
-    442: 33,
-    443: 38,
-    444: -48,
-    445: 28,
-    446: 19,
-    447: 25,
-    448: 32,
-    449: -52,
-    450: -76,
-    451: -77,
-    452: 59,
-    453: -49,
-    454: 13,
-    455: 55,
-    456: -30,
-    457: 42,
-    458: 51,
-    459: -33,
-    460: 49,
-    461: 50,
-    462: 32,
-    463: 31,
-    464: 31,
-    465: 39,
-    466: 36,
-    467: 48,
-    468: -42,
-    469: 24,
-    470: 35,
-    471: 32,
-    472: 34,
-    473: 29,
-    474: 21,
-    475: 35,
-    476: 19,
-    477: 25,
-    478: 37,
-    479: -53,
-    480: 14,
-    481: 10,
-    482: 26,
-    483: 18,
-    484: -57,
-    485: -59,
-    486: -3,
-    487: 18,
-    488: 23,
-    489: -63,
-    490: 1,
-    491: 17,
-    492: 3,
-    493: -67,
-    494: 1,
-    495: -4,
-    496: 14,
-    497: -2,
-    498: 6,
-    499: -73,
-    500: -8,
-    501: 14,
-    502: -76,
-    503: -12,
-    504: -78,
-    505: -40,
-    506: 2,
-    507: 4,
-    508: -13,
-    509: -82,
-    510: -106,
-    511: -107,
-    512: 35,
-    513: -25,
-    514: 53,
-    515: 74,
-    516: 79,
-    517: 0,
-    518: 74,
-    519: 60,
-    520: -10,
-    521: 65,
-    522: 53,
-    523: 72,
-    524: 64,
-    525: 52,
-    526: 56,
-    527: 52,
-    528: 50,
-    529: -19,
-    530: 53,
-    531: 57,
-    532: 62,
-    533: 56,
-    534: -24,
-    535: 58,
-    536: 54,
-    537: 38,
-    538: 39,
-    539: 40,
-    540: -29,
-    541: -31,
-    542: 2,
-    543: 56,
-    544: 35,
-    545: -34,
-    546: -58,
-    547: -59,
-    548: 138,
-    549: -128,
-    550: -74,
-    551: -108,
-    552: -33,
-    553: -31,
-    554: -26,
-    555: -44,
-    556: -101,
-    557: -114,
-    558: -33,
-    559: -37,
-    560: -51,
-    561: -39,
-    562: -35,
-    563: -47,
-    564: -54,
-    565: -122,
-    566: -37,
-    567: -45,
-    568: -52,
-    569: -59,
-    570: -58,
-    571: -128,
-    572: -46,
-    573: -65,
-    574: -42,
-    575: -49,
-    576: -133,
-    577: -132,
-    578: -102,
-    579: -60,
-    580: -68,
-    581: -56,
-    582: -55,
-    583: -139,
-    584: -141,
-    585: -106,
-    586: -61,
-    587: -65,
-    588: -72,
-    589: -78,
-    590: -64,
-    591: -148,
-    592: -70,
-    593: -72,
-    594: -151,
-    595: -68,
-    596: -81,
-    597: -81,
-    598: -72,
-    599: -156,
-    600: -74,
-    601: -86,
-    602: -86,
-    603: -80,
-    604: -161,
-    605: -97,
-    606: -81,
-    607: -95,
-    608: -165,
-    609: -94,
-    610: -98,
-    611: -103,
-    612: -83,
-    613: -97,
-    614: -102,
-    615: -90,
-    616: -173,
-    617: -90,
-    618: -103,
-    619: -111,
-    620: -99,
-    621: -178,
-    622: -95,
-    623: -108,
-    624: -112,
-    625: -182,
-    626: -115,
-    627: -115,
-    628: -101,
-    629: -117,
-    630: -120,
-    631: -104,
-    632: -120,
-    633: -122,
-    634: -191,
-    635: -106,
-    636: -128,
-    637: -118,
-    638: -110,
-    639: -127,
-    640: -196,
-    641: -196,
-    642: -199,
-    643: -135,
-    644: -123,
-    645: -134,
-    646: -203,
-    647: -115,
-    648: -126,
-    649: -121,
-    650: -207,
-    651: -143,
-    652: -127,
-    653: -141,
-    654: -211,
-    655: -143,
-    656: -139,
-    657: -145,
-    658: -148,
-    659: -132,
-    660: -148,
-    661: -150,
-    662: -219,
-    663: -154,
-    664: -156,
-    665: -155,
-    666: -148,
-    667: -224,
-    668: -141,
-    669: -147,
-    670: -227,
-    671: -144,
-    672: -157,
-    673: -161,
-    674: -231,
-    675: -165,
-    676: -161,
-    677: -165,
-    678: -168,
-    679: -161,
-    680: -157,
-    681: -159,
-    682: -166,
-    683: -162,
-    684: -157,
-    685: -228,
-    686: -265,
-    687: 138,
-    688: -128,
-    689: -74,
-    690: -108,
-    691: -33,
-    692: -31,
-    693: -26,
-    694: -44,
-    695: -101,
-    696: -114,
-    697: -33,
-    698: -37,
-    699: -51,
-    700: -39,
-    701: -35,
-    702: -47,
-    703: -54,
-    704: -122,
-    705: -37,
-    706: -45,
-    707: -52,
-    708: -59,
-    709: -58,
-    710: -128,
-    711: -46,
-    712: -65,
-    713: -42,
-    714: -49,
-    715: -133,
-    716: -132,
-    717: -102,
-    718: -60,
-    719: -68,
-    720: -56,
-    721: -55,
-    722: -139,
-    723: -141,
-    724: -106,
-    725: -61,
-    726: -65,
-    727: -72,
-    728: -78,
-    729: -64,
-    730: -148,
-    731: -70,
-    732: -72,
-    733: -151,
-    734: -68,
-    735: -81,
-    736: -81,
-    737: -72,
-    738: -156,
-    739: -74,
-    740: -86,
-    741: -86,
-    742: -80,
-    743: -161,
-    744: -97,
-    745: -81,
-    746: -95,
-    747: -165,
-    748: -90,
-    749: -94,
-    750: -97,
-    751: -97,
-    752: -86,
-    753: -102,
-    754: -90,
-    755: -173,
-    756: -90,
-    757: -103,
-    758: -111,
-    759: -99,
-    760: -178,
-    761: -95,
-    762: -108,
-    763: -112,
-    764: -182,
-    765: -115,
-    766: -115,
-    767: -101,
-    768: -117,
-    769: -120,
-    770: -104,
-    771: -120,
-    772: -122,
-    773: -191,
-    774: -106,
-    775: -128,
-    776: -118,
-    777: -110,
-    778: -127,
-    779: -196,
-    780: -196,
-    781: -199,
-    782: -135,
-    783: -123,
-    784: -134,
-    785: -203,
-    786: -115,
-    787: -126,
-    788: -121,
-    789: -207,
-    790: -143,
-    791: -127,
-    792: -141,
-    793: -211,
-    794: -143,
-    795: -139,
-    796: -145,
-    797: -148,
-    798: -132,
-    799: -148,
-    800: -150,
-    801: -219,
-    802: -154,
-    803: -156,
-    804: -155,
-    805: -148,
-    806: -224,
-    807: -141,
-    808: -147,
-    809: -227,
-    810: -144,
-    811: -157,
-    812: -161,
-    813: -231,
-    814: -165,
-    815: -161,
-    816: -165,
-    817: -168,
-    818: -161,
-    819: -157,
-    820: -159,
-    821: -166,
-    822: -162,
-    823: -157,
-    824: -228,
-    825: -265,
-    826: 263,
-    827: -253,
-    828: -199,
-    829: -233,
-    830: -158,
-    831: -156,
-    832: -151,
-    833: -169,
-    834: -226,
-    835: -239,
-    836: -158,
-    837: -162,
-    838: -176,
-    839: -164,
-    840: -160,
-    841: -172,
-    842: -179,
-    843: -247,
-    844: -162,
-    845: -170,
-    846: -177,
-    847: -184,
-    848: -183,
-    849: -253,
-    850: -171,
-    851: -190,
-    852: -167,
-    853: -174,
-    854: -258,
-    855: -257,
-    856: -227,
-    857: -183,
-    858: -197,
-    859: -187,
-    860: -175,
-    861: -182,
-    862: -193,
-    863: -184,
-    864: -268,
-    865: -202,
-    866: -191,
-    867: -194,
-    868: -192,
-    869: -197,
-    870: -205,
-    871: -191,
-    872: -207,
-    873: -276,
-    874: -278,
-    875: -222,
-    876: -201,
-    877: -196,
-    878: -282,
-    879: -206,
-    880: -219,
-    881: -196,
-    882: -286,
-    883: -207,
-    884: -206,
-    885: -210,
-    886: -223,
-    887: -222,
-    888: -223,
-    889: -225,
-    890: -280,
-    891: -293,
-    892: -296,
-    893: -232,
-    894: -220,
-    895: -231,
-    896: -300,
-    897: -212,
-    898: -223,
-    899: -218,
-    900: -304,
-    901: -236,
-    902: -228,
-    903: -223,
-    904: -239,
-    905: -227,
-    906: -310,
-    907: -227,
-    908: -240,
-    909: -244,
-    910: -314,
-    911: -248,
-    912: -237,
-    913: -250,
-    914: -243,
-    915: -239,
-    916: -247,
-    917: -237,
-    918: -308,
-    919: -345,
-    920: -273,
-    921: -260,
-    922: -248,
-    923: -243,
-    924: -263,
-    925: -329,
-    926: -252,
-    927: -252,
-    928: -248,
-    929: -260,
-    930: -267,
-    931: -266,
-    932: -253,
-    933: -337,
-    934: -249,
-    935: -260,
-    936: -255,
-    937: -259,
-    938: -342,
-    939: -260,
-    940: -267,
-    941: -280,
-    942: -270,
-    943: -271,
-    944: -348,
-    945: -281,
-    946: -268,
-    947: -272,
-    948: -279,
-    949: -285,
-    950: -342,
-    951: -355,
-    952: -280,
-    953: -278,
-    954: -279,
-    955: -284,
-    956: -277,
-    957: -361,
-    958: -282,
-    959: -278,
-    960: -274,
-    961: -275,
-    962: -290,
-    963: -298,
-    964: -300,
-    965: -369,
-    966: -300,
-    967: -292,
-    968: -290,
-    969: -373,
-    970: -309,
-    971: -375,
-    972: -299,
-    973: -298,
-    974: -301,
-    975: -310,
-    976: -302,
-    977: -297,
-    978: -370,
-    979: -383,
-    980: -302,
-    981: -316,
-    982: -321,
-    983: -311,
-    984: -315,
-    985: -299,
-    986: -321,
-    987: -308,
-    988: -392,
-    989: -306,
-    990: -322,
-    991: -330,
-    992: -312,
-    993: -397,
-    994: -326,
-    995: -334,
-    996: -317,
-    997: -401,
-    998: -330,
-    999: -338,
-    1000: -324,
-    1001: -325,
-    1002: -337,
-    1003: -329,
-    1004: -339,
-    1005: -341,
-    1006: -398,
-    1007: -411,
-    1008: -347,
-    1009: -335,
-    1010: -346,
-    1011: -415,
-    1012: -334,
-    1013: -352,
-    1014: -350,
-    1015: -346,
-    1016: -341,
-    1017: -338,
-    1018: -422,
-    1019: -334,
-    1020: -345,
-    1021: -340,
-    1022: -344,
-    1023: -427,
-    1024: -345,
-    1025: -357,
-    1026: -357,
-    1027: -351,
-    1028: -432,
-    1029: -365,
-    1030: -361,
-    1031: -353,
-    1032: -367,
-    1033: -370,
-    1034: -354,
-    1035: -363,
-    1036: -351,
-    1037: -427,
-    1038: -464,
-    1039: -441,
-    1040: -397,
-    1041: -373,
-    1042: -434,
-    1043: -447,
-    1044: -376,
-    1045: -380,
-    1046: -374,
-    1047: -375,
-    1048: -373,
-    1049: -452,
-    1050: -454,
-    1051: -398,
-    1052: -377,
-    1053: -372,
-    1054: -458,
-    1055: -376,
-    1056: -388,
-    1057: -382,
-    1058: -377,
-    1059: -387,
-    1060: -396,
-    1061: -465,
-    1062: -400,
-    1063: -398,
-    1064: -468,
-    1065: -404,
-    1066: -404,
-    1067: -395,
-    1068: -403,
-    1069: -473,
-    1070: -390,
-    1071: -396,
-    1072: -476,
-    1073: -406,
-    1074: -409,
-    1075: -395,
-    1076: -480,
-    1077: -408,
-    1078: -404,
-    1079: -483,
-    1080: -418,
-    1081: -396,
-    1082: -486,
-    1083: -403,
-    1084: -399,
-    1085: -409,
-    1086: -417,
-    1087: -413,
-    1088: -421,
-    1089: -493,
-    1090: 37,
-    1091: -5,
-    1092: 73,
-    1093: 71,
-    1094: -8,
-    1095: 75,
-    1096: 62,
-    1097: 58,
-    1098: -12,
-    1099: 62,
-    1100: 55,
-    1101: 74,
-    1102: 64,
-    1103: 48,
-    1104: 50,
-    1105: -19,
-    1106: 45,
-    1107: 63,
-    1108: -22,
-    1109: 61,
-    1110: 48,
-    1111: 44,
-    1112: -26,
-    1113: 50,
-    1114: 37,
-    1115: 44,
-    1116: 48,
-    1117: -31,
-    1118: 33,
-    1119: 40,
-    1120: 48,
-    1121: 41,
-    1122: 43,
-    1123: 30,
-    1124: 37,
-    1125: -25,
-    1126: -38,
-    1127: -63,
-    1128: 4457,
-    1129: 0,
-    1130: 109,
-    1131: 7,
-    1132: 21101,
-    1133: 0,
-    1134: 0,
-    1135: -2,
-    1136: 22208,
-    1137: -2,
-    1138: -5,
-    1139: -1,
-    1140: 1205,
-    1141: -1,
-    1142: 1169,
-    1143: 22202,
-    1144: -2,
-    1145: -4,
-    1146: 1,
-    1147: 22201,
-    1148: 1,
-    1149: -6,
-    1150: 1,
-    1151: 21202,
-    1152: -2,
-    1153: 1,
-    1154: 2,
-    1155: 21101,
-    1156: 0,
-    1157: 1162,
-    1158: 0,
-    1159: 2105,
-    1160: 1,
-    1161: -3,
-    1162: 21201,
-    1163: -2,
-    1164: 1,
-    1165: -2,
-    1166: 1105,
-    1167: 1,
-    1168: 1136,
-    1169: 109,
-    1170: -7,
-    1171: 2106,
-    1172: 0,
-    1173: 0,
-    1174: 109,
-    1175: 6,
-    1176: 2101,
-    1177: 0,
-    1178: -5,
-    1179: 1182,
-    1180: 20101,
-    1181: 0,
-    1182: 166,
-    1183: -2,
-    1184: 21102,
-    1185: 1,
-    1186: 0,
-    1187: -3,
-    1188: 21201,
-    1189: -5,
-    1190: 1,
-    1191: -5,
-    1192: 22208,
-    1193: -3,
-    1194: -2,
-    1195: -1,
-    1196: 1205,
-    1197: -1,
-    1198: 1229,
-    1199: 2201,
-    1200: -5,
-    1201: -3,
-    1202: 1205,
-    1203: 20101,
-    1204: 0,
-    1205: 176,
-    1206: 1,
-    1207: 22101,
-    1208: 0,
-    1209: -3,
-    1210: 2,
-    1211: 22101,
-    1212: 0,
-    1213: -2,
-    1214: 3,
-    1215: 21101,
-    1216: 0,
-    1217: 1222,
-    1218: 0,
-    1219: 2106,
-    1220: 0,
-    1221: -4,
-    1222: 21201,
-    1223: -3,
-    1224: 1,
-    1225: -3,
-    1226: 1106,
-    1227: 0,
-    1228: 1192,
-    1229: 109,
-    1230: -6,
-    1231: 2106,
-    1232: 0,
-    1233: 0,
-    1234: 109,
-    1235: 2,
-    1236: 21202,
-    1237: -1,
-    1238: 1,
-    1239: 1,
-    1240: 21101,
-    1241: 0,
-    1242: 1256,
-    1243: 2,
-    1244: 21102,
-    1245: 1,
-    1246: 1251,
-    1247: 0,
-    1248: 1106,
-    1249: 0,
-    1250: 1174,
-    1251: 109,
-    1252: -2,
-    1253: 2106,
-    1254: 0,
-    1255: 0,
-    1256: 109,
-    1257: 5,
-    1258: 22201,
-    1259: -4,
-    1260: -3,
-    1261: -1,
-    1262: 22201,
-    1263: -2,
-    1264: -1,
-    1265: -1,
-    1266: 204,
-    1267: -1,
-    1268: 109,
-    1269: -5,
-    1270: 2105,
-    1271: 1,
-    1272: 0,
-    1273: 109,
-    1274: 3,
-    1275: 1201,
-    1276: -2,
-    1277: 0,
-    1278: 1280,
-    1279: 1006,
-    1280: 4463,
-    1281: 1303,
-    1282: 104,
-    1283: 45,
-    1284: 104,
-    1285: 32,
-    1286: 1201,
-    1287: -1,
-    1288: 66,
-    1289: 1291,
-    1290: 21002,
-    1291: 67,
-    1292: 1,
-    1293: 1,
-    1294: 21102,
-    1295: 1,
-    1296: 1301,
-    1297: 0,
-    1298: 1105,
-    1299: 1,
-    1300: 1234,
-    1301: 104,
-    1302: 10,
-    1303: 109,
-    1304: -3,
-    1305: 2105,
-    1306: 1,
-    1307: 0,
-    1308: 0,
-    1309: 4457,
-    1310: 109,
-    1311: 2,
-    1312: 1201,
-    1313: -1,
-    1314: 0,
-    1315: 1309,
-    1316: 1101,
-    1317: 0,
-    1318: 0,
-    1319: 1308,
-    1320: 21102,
-    1321: 4601,
-    1322: 1,
-    1323: 1,
-    1324: 21101,
-    1325: 0,
-    1326: 13,
-    1327: 2,
-    1328: 21101,
-    1329: 0,
-    1330: 4,
-    1331: 3,
-    1332: 21102,
-    1333: 1353,
-    1334: 1,
-    1335: 4,
-    1336: 21101,
-    1337: 0,
-    1338: 1343,
-    1339: 0,
-    1340: 1105,
-    1341: 1,
-    1342: 1130,
-    1343: 21001,
-    1344: 1308,
-    1345: 0,
-    1346: -1,
-    1347: 109,
-    1348: -2,
-    1349: 2106,
-    1350: 0,
-    1351: 0,
-    1352: 83,
-    1353: 109,
-    1354: 3,
-    1355: 1202,
-    1356: -2,
-    1357: 1,
-    1358: 1360,
-    1359: 20008,
-    1360: 4649,
-    1361: 1309,
-    1362: -1,
-    1363: 1206,
-    1364: -1,
-    1365: 1419,
-    1366: 1005,
-    1367: 1308,
-    1368: 1398,
-    1369: 1101,
-    1370: 0,
-    1371: 1,
-    1372: 1308,
-    1373: 21008,
-    1374: 1309,
-    1375: -1,
-    1376: -1,
-    1377: 1206,
-    1378: -1,
-    1379: 1387,
-    1380: 21101,
-    1381: 0,
-    1382: 106,
-    1383: 1,
-    1384: 1106,
-    1385: 0,
-    1386: 1391,
-    1387: 21101,
-    1388: 92,
-    1389: 0,
-    1390: 1,
-    1391: 21101,
-    1392: 0,
-    1393: 1398,
-    1394: 0,
-    1395: 1106,
-    1396: 0,
-    1397: 1234,
-    1398: 104,
-    1399: 45,
-    1400: 104,
-    1401: 32,
-    1402: 1201,
-    1403: -2,
-    1404: 1,
-    1405: 1407,
-    1406: 21002,
-    1407: 4634,
-    1408: 1,
-    1409: 1,
-    1410: 21102,
-    1411: 1417,
-    1412: 1,
-    1413: 0,
-    1414: 1105,
-    1415: 1,
-    1416: 1234,
-    1417: 104,
-    1418: 10,
-    1419: 109,
-    1420: -3,
-    1421: 2106,
-    1422: 0,
-    1423: 0,
-    1424: 109,
-    1425: 3,
-    1426: 1202,
-    1427: -2,
-    1428: 1,
-    1429: 1128,
-    1430: 21102,
-    1431: 34,
-    1432: 1,
-    1433: 1,
-    1434: 21102,
-    1435: 1,
-    1436: 1441,
-    1437: 0,
-    1438: 1105,
-    1439: 1,
-    1440: 1234,
-    1441: 1001,
-    1442: 1128,
-    1443: 0,
-    1444: 1446,
-    1445: 21002,
-    1446: 4457,
-    1447: 1,
-    1448: 1,
-    1449: 21102,
-    1450: 1,
-    1451: 1456,
-    1452: 0,
-    1453: 1105,
-    1454: 1,
-    1455: 1234,
-    1456: 21101,
-    1457: 41,
-    1458: 0,
-    1459: 1,
-    1460: 21101,
-    1461: 0,
-    1462: 1467,
-    1463: 0,
-    1464: 1105,
-    1465: 1,
-    1466: 1234,
-    1467: 1001,
-    1468: 1128,
-    1469: 1,
-    1470: 1472,
-    1471: 21002,
-    1472: 4458,
-    1473: 1,
-    1474: 1,
-    1475: 21102,
-    1476: 1482,
-    1477: 1,
-    1478: 0,
-    1479: 1105,
-    1480: 1,
-    1481: 1234,
-    1482: 21101,
-    1483: 0,
-    1484: 46,
-    1485: 1,
-    1486: 21101,
-    1487: 0,
-    1488: 1493,
-    1489: 0,
-    1490: 1106,
-    1491: 0,
-    1492: 1234,
-    1493: 21001,
-    1494: 1128,
-    1495: 3,
-    1496: 1,
-    1497: 21101,
-    1498: 4,
-    1499: 0,
-    1500: 2,
-    1501: 21102,
-    1502: 1,
-    1503: 1,
-    1504: 3,
-    1505: 21101,
-    1506: 1273,
-    1507: 0,
-    1508: 4,
-    1509: 21101,
-    1510: 0,
-    1511: 1516,
-    1512: 0,
-    1513: 1106,
-    1514: 0,
-    1515: 1130,
-    1516: 20101,
-    1517: 0,
-    1518: 1128,
-    1519: 1,
-    1520: 21102,
-    1521: 1,
-    1522: 1527,
-    1523: 0,
-    1524: 1106,
-    1525: 0,
-    1526: 1310,
-    1527: 1001,
-    1528: 1128,
-    1529: 2,
-    1530: 1533,
-    1531: 20102,
-    1532: 1,
-    1533: 4459,
-    1534: -1,
-    1535: 1206,
-    1536: -1,
-    1537: 1545,
-    1538: 21101,
-    1539: 1545,
-    1540: 0,
-    1541: 0,
-    1542: 2105,
-    1543: 1,
-    1544: -1,
-    1545: 109,
-    1546: -3,
-    1547: 2106,
-    1548: 0,
-    1549: 0,
-    1550: 109,
-    1551: 0,
-    1552: 99,
-    1553: 109,
-    1554: 2,
-    1555: 1101,
-    1556: 0,
-    1557: 0,
-    1558: 1550,
-    1559: 21101,
-    1560: 4601,
-    1561: 0,
-    1562: 1,
-    1563: 21101,
-    1564: 13,
-    1565: 0,
-    1566: 2,
-    1567: 21101,
-    1568: 4,
-    1569: 0,
-    1570: 3,
-    1571: 21101,
-    1572: 0,
-    1573: 1664,
-    1574: 4,
-    1575: 21102,
-    1576: 1582,
-    1577: 1,
-    1578: 0,
-    1579: 1106,
-    1580: 0,
-    1581: 1130,
-    1582: 2,
-    1583: 2486,
-    1584: 1352,
-    1585: 1551,
-    1586: 1101,
-    1587: 0,
-    1588: 0,
-    1589: 1552,
-    1590: 21002,
-    1591: 1550,
-    1592: 1,
-    1593: 1,
-    1594: 21101,
-    1595: 0,
-    1596: 33,
-    1597: 2,
-    1598: 21102,
-    1599: 1,
-    1600: 1702,
-    1601: 3,
-    1602: 21102,
-    1603: 1,
-    1604: 1609,
-    1605: 0,
-    1606: 1106,
-    1607: 0,
-    1608: 2722,
-    1609: 21007,
-    1610: 1552,
-    1611: 0,
-    1612: -1,
-    1613: 1205,
-    1614: -1,
-    1615: 1630,
-    1616: 20107,
-    1617: 0,
-    1618: 1552,
-    1619: -1,
-    1620: 1205,
-    1621: -1,
-    1622: 1637,
-    1623: 21102,
-    1624: 1,
-    1625: 1630,
-    1626: 0,
-    1627: 1106,
-    1628: 0,
-    1629: 1752,
-    1630: 21101,
-    1631: 548,
-    1632: 0,
-    1633: 1,
-    1634: 1105,
-    1635: 1,
-    1636: 1641,
-    1637: 21102,
-    1638: 687,
-    1639: 1,
-    1640: 1,
-    1641: 21101,
-    1642: 1648,
-    1643: 0,
-    1644: 0,
-    1645: 1106,
-    1646: 0,
-    1647: 1234,
-    1648: 21101,
-    1649: 4457,
-    1650: 0,
-    1651: 1,
-    1652: 21101,
-    1653: 1659,
-    1654: 0,
-    1655: 0,
-    1656: 1106,
-    1657: 0,
-    1658: 1424,
-    1659: 109,
-    1660: -2,
-    1661: 2105,
-    1662: 1,
-    1663: 0,
-    1664: 109,
-    1665: 4,
-    1666: 21202,
-    1667: -2,
-    1668: -1,
-    1669: -2,
-    1670: 2101,
-    1671: 0,
-    1672: -3,
-    1673: 1675,
-    1674: 21008,
-    1675: 0,
-    1676: -1,
-    1677: -1,
-    1678: 1206,
-    1679: -1,
-    1680: 1697,
-    1681: 1201,
-    1682: -3,
-    1683: 2,
-    1684: 1687,
-    1685: 20101,
-    1686: -27,
-    1687: 0,
-    1688: -3,
-    1689: 22201,
-    1690: -3,
-    1691: -2,
-    1692: -3,
-    1693: 2001,
-    1694: 1550,
-    1695: -3,
-    1696: 1550,
-    1697: 109,
-    1698: -4,
-    1699: 2105,
-    1700: 1,
-    1701: 0,
-    1702: 109,
-    1703: 5,
-    1704: 21008,
-    1705: 1552,
-    1706: 0,
-    1707: -1,
-    1708: 1206,
-    1709: -1,
-    1710: 1747,
-    1711: 1201,
-    1712: -3,
-    1713: 1901,
-    1714: 1717,
-    1715: 20102,
-    1716: 1,
-    1717: 0,
-    1718: -2,
-    1719: 1205,
-    1720: -4,
-    1721: 1736,
-    1722: 20207,
-    1723: -2,
-    1724: 1551,
-    1725: -1,
-    1726: 1205,
-    1727: -1,
-    1728: 1747,
-    1729: 1102,
-    1730: -1,
-    1731: 1,
-    1732: 1552,
-    1733: 1106,
-    1734: 0,
-    1735: 1747,
-    1736: 22007,
-    1737: 1551,
-    1738: -2,
-    1739: -1,
-    1740: 1205,
-    1741: -1,
-    1742: 1747,
-    1743: 1102,
-    1744: 1,
-    1745: 1,
-    1746: 1552,
-    1747: 109,
-    1748: -5,
-    1749: 2106,
-    1750: 0,
-    1751: 0,
-    1752: 109,
-    1753: 1,
-    1754: 21101,
-    1755: 826,
-    1756: 0,
-    1757: 1,
-    1758: 21101,
-    1759: 0,
-    1760: 1765,
-    1761: 0,
-    1762: 1105,
-    1763: 1,
-    1764: 1234,
-    1765: 20101,
-    1766: 0,
-    1767: 1550,
-    1768: 1,
-    1769: 21102,
-    1770: 1776,
-    1771: 1,
-    1772: 0,
-    1773: 1106,
-    1774: 0,
-    1775: 2863,
-    1776: 21101,
-    1777: 0,
-    1778: 1090,
-    1779: 1,
-    1780: 21101,
-    1781: 0,
-    1782: 1787,
-    1783: 0,
-    1784: 1106,
-    1785: 0,
-    1786: 1234,
-    1787: 99,
-    1788: 1106,
-    1789: 0,
-    1790: 1787,
-    1791: 109,
-    1792: -1,
-    1793: 2106,
-    1794: 0,
-    1795: 0,
-    1796: 109,
-    1797: 1,
-    1798: 21101,
-    1799: 0,
-    1800: 512,
-    1801: 1,
-    1802: 21101,
-    1803: 1809,
-    1804: 0,
-    1805: 0,
-    1806: 1106,
-    1807: 0,
-    1808: 1234,
-    1809: 99,
-    1810: 1106,
-    1811: 0,
-    1812: 1809,
-    1813: 109,
-    1814: -1,
-    1815: 2105,
-    1816: 1,
-    1817: 0,
-    1818: 109,
-    1819: 1,
-    1820: 1102,
-    1821: 1,
-    1822: 1,
-    1823: 1129,
-    1824: 109,
-    1825: -1,
-    1826: 2105,
-    1827: 1,
-    1828: 0,
-    1829: 109,
-    1830: 1,
-    1831: 21102,
-    1832: 1,
-    1833: 377,
-    1834: 1,
-    1835: 21102,
-    1836: 1842,
-    1837: 1,
-    1838: 0,
-    1839: 1105,
-    1840: 1,
-    1841: 1234,
-    1842: 1106,
-    1843: 0,
-    1844: 1831,
-    1845: 109,
-    1846: -1,
-    1847: 2106,
-    1848: 0,
-    1849: 0,
-    1850: 109,
-    1851: 1,
-    1852: 21102,
-    1853: 407,
-    1854: 1,
-    1855: 1,
-    1856: 21102,
-    1857: 1,
-    1858: 1863,
-    1859: 0,
-    1860: 1106,
-    1861: 0,
-    1862: 1234,
-    1863: 99,
-    1864: 1106,
-    1865: 0,
-    1866: 1863,
-    1867: 109,
-    1868: -1,
-    1869: 2106,
-    1870: 0,
-    1871: 0,
-    1872: 109,
-    1873: 1,
-    1874: 21102,
-    1875: 452,
-    1876: 1,
-    1877: 1,
-    1878: 21102,
-    1879: 1885,
-    1880: 1,
-    1881: 0,
-    1882: 1105,
-    1883: 1,
-    1884: 1234,
-    1885: 99,
-    1886: 1106,
-    1887: 0,
-    1888: 1885,
-    1889: 109,
-    1890: -1,
-    1891: 2105,
-    1892: 1,
-    1893: 0,
-    1894: 1941,
-    1895: 1947,
-    1896: 1953,
-    1897: 1958,
-    1898: 1965,
-    1899: 1972,
-    1900: 1978,
-    1901: 7541,
-    1902: 7707,
-    1903: 7831,
-    1904: 7921,
-    1905: 7539,
-    1906: 7254,
-    1907: 7792,
-    1908: 7728,
-    1909: 7452,
-    1910: 7493,
-    1911: 7644,
-    1912: 7479,
-    1913: 7803,
-    1914: 7696,
-    1915: 7507,
-    1916: 7886,
-    1917: 7354,
-    1918: 7757,
-    1919: 7697,
-    1920: 7392,
-    1921: 7257,
-    1922: 7846,
-    1923: 7244,
-    1924: 7377,
-    1925: 7312,
-    1926: 7841,
-    1927: 7922,
-    1928: 7296,
-    1929: 7452,
-    1930: 7872,
-    1931: 7931,
-    1932: 7307,
-    1933: 7641,
-    1934: 2281,
-    1935: 2468,
-    1936: 2418,
-    1937: 2450,
-    1938: 2487,
-    1939: 2125,
-    1940: 2505,
-    1941: 5,
-    1942: 95,
-    1943: 108,
-    1944: 104,
-    1945: 104,
-    1946: 23,
-    1947: 5,
-    1948: 96,
-    1949: 91,
-    1950: 108,
-    1951: 108,
-    1952: 1,
-    1953: 4,
-    1954: 101,
-    1955: 105,
-    1956: 112,
-    1957: 3,
-    1958: 6,
-    1959: 104,
-    1960: 104,
-    1961: 106,
-    1962: 107,
-    1963: 94,
-    1964: -1,
-    1965: 6,
-    1966: 109,
-    1967: 104,
-    1968: 109,
-    1969: 107,
-    1970: 94,
-    1971: -1,
-    1972: 5,
-    1973: 111,
-    1974: 91,
-    1975: 100,
-    1976: 93,
-    1977: 23,
-    1978: 5,
-    1979: 114,
-    1980: 95,
-    1981: 108,
-    1982: 108,
-    1983: 1,
-    1984: 109,
-    1985: 3,
-    1986: 21102,
-    1987: 1,
-    1988: 1993,
-    1989: 0,
-    1990: 1106,
-    1991: 0,
-    1992: 2634,
-    1993: 1006,
-    1994: 1129,
-    1995: 2010,
-    1996: 21101,
-    1997: 316,
-    1998: 0,
-    1999: 1,
-    2000: 21102,
-    2001: 1,
-    2002: 2007,
-    2003: 0,
-    2004: 1105,
-    2005: 1,
-    2006: 1234,
-    2007: 1106,
-    2008: 0,
-    2009: 2076,
-    2010: 21101,
-    2011: 0,
-    2012: 0,
-    2013: -1,
-    2014: 1201,
-    2015: -1,
-    2016: 1894,
-    2017: 2019,
-    2018: 21001,
-    2019: 1900,
-    2020: 0,
-    2021: 1,
-    2022: 21101,
-    2023: 0,
-    2024: 0,
-    2025: 2,
-    2026: 21102,
-    2027: 0,
-    2028: 1,
-    2029: 3,
-    2030: 21101,
-    2031: 0,
-    2032: 2037,
-    2033: 0,
-    2034: 1105,
-    2035: 1,
-    2036: 2525,
-    2037: 1206,
-    2038: 1,
-    2039: 2054,
-    2040: 1201,
-    2041: -1,
-    2042: 1934,
-    2043: 2050,
-    2044: 21101,
-    2045: 0,
-    2046: 2051,
-    2047: 0,
-    2048: 106,
-    2049: 0,
-    2050: 1940,
-    2051: 1106,
-    2052: 0,
-    2053: 2076,
-    2054: 21201,
-    2055: -1,
-    2056: 1,
-    2057: -1,
-    2058: 21207,
-    2059: -1,
-    2060: 7,
-    2061: -2,
-    2062: 1205,
-    2063: -2,
-    2064: 2014,
-    2065: 21102,
-    2066: 1,
-    2067: 177,
-    2068: 1,
-    2069: 21101,
-    2070: 2076,
-    2071: 0,
-    2072: 0,
-    2073: 1105,
-    2074: 1,
-    2075: 1234,
-    2076: 109,
-    2077: -3,
-    2078: 2105,
-    2079: 1,
-    2080: 0,
-    2081: 109,
-    2082: 3,
-    2083: 2001,
-    2084: 1128,
-    2085: -2,
-    2086: 2089,
-    2087: 20101,
-    2088: 0,
-    2089: 4413,
-    2090: -1,
-    2091: 1205,
-    2092: -1,
-    2093: 2108,
-    2094: 21101,
-    2095: 201,
-    2096: 0,
-    2097: 1,
-    2098: 21102,
-    2099: 1,
-    2100: 2105,
-    2101: 0,
-    2102: 1105,
-    2103: 1,
-    2104: 1234,
-    2105: 1106,
-    2106: 0,
-    2107: 2119,
-    2108: 21202,
-    2109: -1,
-    2110: 1,
-    2111: 1,
-    2112: 21102,
-    2113: 1,
-    2114: 2119,
-    2115: 0,
-    2116: 1106,
-    2117: 0,
-    2118: 1424,
-    2119: 109,
-    2120: -3,
-    2121: 2106,
-    2122: 0,
-    2123: 0,
-    2124: 1,
-    2125: 109,
-    2126: 1,
-    2127: 1102,
-    2128: 0,
-    2129: 1,
-    2130: 2124,
-    2131: 21101,
-    2132: 4601,
-    2133: 0,
-    2134: 1,
-    2135: 21102,
-    2136: 1,
-    2137: 13,
-    2138: 2,
-    2139: 21101,
-    2140: 0,
-    2141: 4,
-    2142: 3,
-    2143: 21102,
-    2144: 2173,
-    2145: 1,
-    2146: 4,
-    2147: 21102,
-    2148: 2154,
-    2149: 1,
-    2150: 0,
-    2151: 1106,
-    2152: 0,
-    2153: 1130,
-    2154: 1005,
-    2155: 2124,
-    2156: 2168,
-    2157: 21101,
-    2158: 0,
-    2159: 226,
-    2160: 1,
-    2161: 21101,
-    2162: 2168,
-    2163: 0,
-    2164: 0,
-    2165: 1106,
-    2166: 0,
-    2167: 1234,
-    2168: 109,
-    2169: -1,
-    2170: 2105,
-    2171: 1,
-    2172: 0,
-    2173: 109,
-    2174: 3,
-    2175: 1005,
-    2176: 2124,
-    2177: 2275,
-    2178: 1201,
-    2179: -2,
-    2180: 0,
-    2181: 2183,
-    2182: 20008,
-    2183: 4617,
-    2184: 1128,
-    2185: -1,
-    2186: 1206,
-    2187: -1,
-    2188: 2275,
-    2189: 1201,
-    2190: -2,
-    2191: 1,
-    2192: 2195,
-    2193: 20101,
-    2194: 0,
-    2195: 4618,
-    2196: -1,
-    2197: 22101,
-    2198: 0,
-    2199: -1,
-    2200: 1,
-    2201: 21101,
-    2202: 5,
-    2203: 0,
-    2204: 2,
-    2205: 21101,
-    2206: 1,
-    2207: 0,
-    2208: 3,
-    2209: 21102,
-    2210: 1,
-    2211: 2216,
-    2212: 0,
-    2213: 1105,
-    2214: 1,
-    2215: 2525,
-    2216: 1206,
-    2217: 1,
-    2218: 2275,
-    2219: 21102,
-    2220: 1,
-    2221: 258,
-    2222: 1,
-    2223: 21102,
-    2224: 1,
-    2225: 2230,
-    2226: 0,
-    2227: 1106,
-    2228: 0,
-    2229: 1234,
-    2230: 22101,
-    2231: 0,
-    2232: -1,
-    2233: 1,
-    2234: 21102,
-    2235: 2241,
-    2236: 1,
-    2237: 0,
-    2238: 1106,
-    2239: 0,
-    2240: 1234,
-    2241: 104,
-    2242: 46,
-    2243: 104,
-    2244: 10,
-    2245: 1102,
-    2246: 1,
-    2247: 1,
-    2248: 2124,
-    2249: 1201,
-    2250: -2,
-    2251: 0,
-    2252: 2256,
-    2253: 1102,
-    2254: -1,
-    2255: 1,
-    2256: 4617,
-    2257: 1201,
-    2258: -2,
-    2259: 3,
-    2260: 2262,
-    2261: 21002,
-    2262: 4620,
-    2263: 1,
-    2264: -1,
-    2265: 1206,
-    2266: -1,
-    2267: 2275,
-    2268: 21102,
-    2269: 1,
-    2270: 2275,
-    2271: 0,
-    2272: 2106,
-    2273: 0,
-    2274: -1,
-    2275: 109,
-    2276: -3,
-    2277: 2106,
-    2278: 0,
-    2279: 0,
-    2280: 0,
-    2281: 109,
-    2282: 1,
-    2283: 1102,
-    2284: 1,
-    2285: 0,
-    2286: 2280,
-    2287: 21102,
-    2288: 1,
-    2289: 4601,
-    2290: 1,
-    2291: 21101,
-    2292: 13,
-    2293: 0,
-    2294: 2,
-    2295: 21101,
-    2296: 0,
-    2297: 4,
-    2298: 3,
-    2299: 21101,
-    2300: 2329,
-    2301: 0,
-    2302: 4,
-    2303: 21102,
-    2304: 2310,
-    2305: 1,
-    2306: 0,
-    2307: 1105,
-    2308: 1,
-    2309: 1130,
-    2310: 1005,
-    2311: 2280,
-    2312: 2324,
-    2313: 21101,
-    2314: 273,
-    2315: 0,
-    2316: 1,
-    2317: 21102,
-    2318: 1,
-    2319: 2324,
-    2320: 0,
-    2321: 1106,
-    2322: 0,
-    2323: 1234,
-    2324: 109,
-    2325: -1,
-    2326: 2106,
-    2327: 0,
-    2328: 0,
-    2329: 109,
-    2330: 3,
-    2331: 1005,
-    2332: 2280,
-    2333: 2413,
-    2334: 1201,
-    2335: -2,
-    2336: 0,
-    2337: 2339,
-    2338: 21008,
-    2339: 0,
-    2340: -1,
-    2341: -1,
-    2342: 1206,
-    2343: -1,
-    2344: 2413,
-    2345: 1201,
-    2346: -2,
-    2347: 1,
-    2348: 2351,
-    2349: 20101,
-    2350: 0,
-    2351: 0,
-    2352: -1,
-    2353: 21202,
-    2354: -1,
-    2355: 1,
-    2356: 1,
-    2357: 21101,
-    2358: 0,
-    2359: 5,
-    2360: 2,
-    2361: 21102,
-    2362: 1,
-    2363: 1,
-    2364: 3,
-    2365: 21101,
-    2366: 2372,
-    2367: 0,
-    2368: 0,
-    2369: 1105,
-    2370: 1,
-    2371: 2525,
-    2372: 1206,
-    2373: 1,
-    2374: 2413,
-    2375: 21101,
-    2376: 0,
-    2377: 301,
-    2378: 1,
-    2379: 21101,
-    2380: 2386,
-    2381: 0,
-    2382: 0,
-    2383: 1105,
-    2384: 1,
-    2385: 1234,
-    2386: 22101,
-    2387: 0,
-    2388: -1,
-    2389: 1,
-    2390: 21102,
-    2391: 1,
-    2392: 2397,
-    2393: 0,
-    2394: 1105,
-    2395: 1,
-    2396: 1234,
-    2397: 104,
-    2398: 46,
-    2399: 104,
-    2400: 10,
-    2401: 1102,
-    2402: 1,
-    2403: 1,
-    2404: 2280,
-    2405: 1201,
-    2406: -2,
-    2407: 0,
-    2408: 2412,
-    2409: 1001,
-    2410: 1128,
-    2411: 0,
-    2412: 0,
-    2413: 109,
-    2414: -3,
-    2415: 2106,
-    2416: 0,
-    2417: 0,
-    2418: 109,
-    2419: 1,
-    2420: 21102,
-    2421: 1,
-    2422: -1,
-    2423: 1,
-    2424: 21101,
-    2425: 2431,
-    2426: 0,
-    2427: 0,
-    2428: 1105,
-    2429: 1,
-    2430: 1310,
-    2431: 1205,
-    2432: 1,
-    2433: 2445,
-    2434: 21102,
-    2435: 133,
-    2436: 1,
-    2437: 1,
-    2438: 21102,
-    2439: 2445,
-    2440: 1,
-    2441: 0,
-    2442: 1106,
-    2443: 0,
-    2444: 1234,
-    2445: 109,
-    2446: -1,
-    2447: 2105,
-    2448: 1,
-    2449: 0,
-    2450: 109,
-    2451: 1,
-    2452: 21101,
-    2453: 3,
-    2454: 0,
-    2455: 1,
-    2456: 21101,
-    2457: 2463,
-    2458: 0,
-    2459: 0,
-    2460: 1106,
-    2461: 0,
-    2462: 2081,
-    2463: 109,
-    2464: -1,
-    2465: 2105,
-    2466: 1,
-    2467: 0,
-    2468: 109,
-    2469: 1,
-    2470: 21101,
-    2471: 4,
-    2472: 0,
-    2473: 1,
-    2474: 21102,
-    2475: 2481,
-    2476: 1,
-    2477: 0,
-    2478: 1105,
-    2479: 1,
-    2480: 2081,
-    2481: 109,
-    2482: -1,
-    2483: 2105,
-    2484: 1,
-    2485: 0,
-    2486: 95,
-    2487: 109,
-    2488: 1,
-    2489: 21101,
-    2490: 0,
-    2491: 5,
-    2492: 1,
-    2493: 21102,
-    2494: 1,
-    2495: 2500,
-    2496: 0,
-    2497: 1105,
-    2498: 1,
-    2499: 2081,
-    2500: 109,
-    2501: -1,
-    2502: 2105,
-    2503: 1,
-    2504: 0,
-    2505: 109,
-    2506: 1,
-    2507: 21102,
-    2508: 6,
-    2509: 1,
-    2510: 1,
-    2511: 21102,
-    2512: 1,
-    2513: 2518,
-    2514: 0,
-    2515: 1105,
-    2516: 1,
-    2517: 2081,
-    2518: 109,
-    2519: -1,
-    2520: 2106,
-    2521: 0,
-    2522: 0,
-    2523: 0,
-    2524: 1,
-    2525: 109,
-    2526: 5,
-    2527: 1202,
-    2528: -3,
-    2529: 1,
-    2530: 2523,
-    2531: 1101,
-    2532: 0,
-    2533: 1,
-    2534: 2524,
-    2535: 21202,
-    2536: -4,
-    2537: 1,
-    2538: 1,
-    2539: 21102,
-    2540: 1,
-    2541: 2585,
-    2542: 2,
-    2543: 21101,
-    2544: 2550,
-    2545: 0,
-    2546: 0,
-    2547: 1105,
-    2548: 1,
-    2549: 1174,
-    2550: 1206,
-    2551: -2,
-    2552: 2576,
-    2553: 2101,
-    2554: 0,
-    2555: -4,
-    2556: 2558,
-    2557: 2001,
-    2558: 4685,
-    2559: -3,
-    2560: 2566,
-    2561: 101,
-    2562: 3094,
-    2563: 2566,
-    2564: 2566,
-    2565: 21008,
-    2566: 3102,
-    2567: -1,
-    2568: -1,
-    2569: 1205,
-    2570: -1,
-    2571: 2576,
-    2572: 1102,
-    2573: 1,
-    2574: 0,
-    2575: 2524,
-    2576: 21002,
-    2577: 2524,
-    2578: 1,
-    2579: -4,
-    2580: 109,
-    2581: -5,
-    2582: 2106,
-    2583: 0,
-    2584: 0,
-    2585: 109,
-    2586: 5,
-    2587: 22201,
-    2588: -4,
-    2589: -3,
-    2590: -4,
-    2591: 22201,
-    2592: -4,
-    2593: -2,
-    2594: -4,
-    2595: 21208,
-    2596: -4,
-    2597: 10,
-    2598: -1,
-    2599: 1206,
-    2600: -1,
-    2601: 2606,
-    2602: 21102,
-    2603: -1,
-    2604: 1,
-    2605: -4,
-    2606: 201,
-    2607: -3,
-    2608: 2523,
-    2609: 2616,
-    2610: 1001,
-    2611: 2616,
-    2612: 3094,
-    2613: 2616,
-    2614: 20102,
-    2615: 1,
-    2616: 3098,
-    2617: -1,
-    2618: 22208,
-    2619: -4,
-    2620: -1,
-    2621: -1,
-    2622: 1205,
-    2623: -1,
-    2624: 2629,
-    2625: 1102,
-    2626: 1,
-    2627: 0,
-    2628: 2524,
-    2629: 109,
-    2630: -5,
-    2631: 2106,
-    2632: 0,
-    2633: 0,
-    2634: 109,
-    2635: 4,
-    2636: 21102,
-    2637: 1,
-    2638: 3094,
-    2639: 1,
-    2640: 21101,
-    2641: 30,
-    2642: 0,
-    2643: 2,
-    2644: 21102,
-    2645: 1,
-    2646: 1,
-    2647: 3,
-    2648: 21102,
-    2649: 2706,
-    2650: 1,
-    2651: 4,
-    2652: 21102,
-    2653: 2659,
-    2654: 1,
-    2655: 0,
-    2656: 1105,
-    2657: 1,
-    2658: 1130,
-    2659: 21101,
-    2660: 0,
-    2661: 0,
-    2662: -3,
-    2663: 203,
-    2664: -2,
-    2665: 21208,
-    2666: -2,
-    2667: 10,
-    2668: -1,
-    2669: 1205,
-    2670: -1,
-    2671: 2701,
-    2672: 21207,
-    2673: -2,
-    2674: 0,
-    2675: -1,
-    2676: 1205,
-    2677: -1,
-    2678: 2663,
-    2679: 21207,
-    2680: -3,
-    2681: 29,
-    2682: -1,
-    2683: 1206,
-    2684: -1,
-    2685: 2663,
-    2686: 2101,
-    2687: 3094,
-    2688: -3,
-    2689: 2693,
-    2690: 1202,
-    2691: -2,
-    2692: 1,
-    2693: 3097,
-    2694: 21201,
-    2695: -3,
-    2696: 1,
-    2697: -3,
-    2698: 1106,
-    2699: 0,
-    2700: 2663,
-    2701: 109,
-    2702: -4,
-    2703: 2105,
-    2704: 1,
-    2705: 0,
-    2706: 109,
-    2707: 2,
-    2708: 1201,
-    2709: -1,
-    2710: 0,
-    2711: 2715,
-    2712: 1101,
-    2713: 0,
-    2714: -1,
-    2715: 3123,
-    2716: 109,
-    2717: -2,
-    2718: 2106,
-    2719: 0,
-    2720: 0,
-    2721: 0,
-    2722: 109,
-    2723: 5,
-    2724: 1202,
-    2725: -2,
-    2726: 1,
-    2727: 2721,
-    2728: 21207,
-    2729: -4,
-    2730: 0,
-    2731: -1,
-    2732: 1206,
-    2733: -1,
-    2734: 2739,
-    2735: 21102,
-    2736: 0,
-    2737: 1,
-    2738: -4,
-    2739: 22101,
-    2740: 0,
-    2741: -4,
-    2742: 1,
-    2743: 21201,
-    2744: -3,
-    2745: 0,
-    2746: 2,
-    2747: 21102,
-    2748: 1,
-    2749: 1,
-    2750: 3,
-    2751: 21101,
-    2752: 2758,
-    2753: 0,
-    2754: 0,
-    2755: 1105,
-    2756: 1,
-    2757: 2763,
-    2758: 109,
-    2759: -5,
-    2760: 2105,
-    2761: 1,
-    2762: 0,
-    2763: 109,
-    2764: 6,
-    2765: 21207,
-    2766: -4,
-    2767: 1,
-    2768: -1,
-    2769: 1206,
-    2770: -1,
-    2771: 2786,
-    2772: 22207,
-    2773: -5,
-    2774: -3,
-    2775: -1,
-    2776: 1206,
-    2777: -1,
-    2778: 2786,
-    2779: 22101,
-    2780: 0,
-    2781: -5,
-    2782: -5,
-    2783: 1106,
-    2784: 0,
-    2785: 2858,
-    2786: 21202,
-    2787: -5,
-    2788: 1,
-    2789: 1,
-    2790: 21201,
-    2791: -4,
-    2792: -1,
-    2793: 2,
-    2794: 21202,
-    2795: -3,
-    2796: 2,
-    2797: 3,
-    2798: 21102,
-    2799: 1,
-    2800: 2805,
-    2801: 0,
-    2802: 1106,
-    2803: 0,
-    2804: 2763,
-    2805: 22102,
-    2806: 1,
-    2807: 1,
-    2808: -5,
-    2809: 21101,
-    2810: 1,
-    2811: 0,
-    2812: -2,
-    2813: 22207,
-    2814: -5,
-    2815: -3,
-    2816: -1,
-    2817: 1206,
-    2818: -1,
-    2819: 2824,
-    2820: 21102,
-    2821: 1,
-    2822: 0,
-    2823: -2,
-    2824: 22202,
-    2825: -3,
-    2826: -2,
-    2827: -3,
-    2828: 22107,
-    2829: 0,
-    2830: -4,
-    2831: -1,
-    2832: 1206,
-    2833: -1,
-    2834: 2850,
-    2835: 21201,
-    2836: -2,
-    2837: 0,
-    2838: 1,
-    2839: 21201,
-    2840: -4,
-    2841: -1,
-    2842: 2,
-    2843: 21102,
-    2844: 1,
-    2845: 2850,
-    2846: 0,
-    2847: 105,
-    2848: 1,
-    2849: 2721,
-    2850: 21202,
-    2851: -3,
-    2852: -1,
-    2853: -3,
-    2854: 22201,
-    2855: -5,
-    2856: -3,
-    2857: -5,
-    2858: 109,
-    2859: -6,
-    2860: 2106,
-    2861: 0,
-    2862: 0,
-    2863: 109,
-    2864: 3,
-    2865: 21208,
-    2866: -2,
-    2867: 0,
-    2868: -1,
-    2869: 1205,
-    2870: -1,
-    2871: 2902,
-    2872: 21207,
-    2873: -2,
-    2874: 0,
-    2875: -1,
-    2876: 1205,
-    2877: -1,
-    2878: 2882,
-    2879: 1106,
-    2880: 0,
-    2881: 2888,
-    2882: 104,
-    2883: 45,
-    2884: 21202,
-    2885: -2,
-    2886: -1,
-    2887: -2,
-    2888: 21201,
-    2889: -2,
-    2890: 0,
-    2891: 1,
-    2892: 21102,
-    2893: 1,
-    2894: 2899,
-    2895: 0,
-    2896: 1106,
-    2897: 0,
-    2898: 2909,
-    2899: 1105,
-    2900: 1,
-    2901: 2904,
-    2902: 104,
-    2903: 48,
-    2904: 109,
-    2905: -3,
-    2906: 2105,
-    2907: 1,
-    2908: 0,
-    2909: 109,
-    2910: 4,
-    2911: 21202,
-    2912: -3,
-    2913: 1,
-    2914: 1,
-    2915: 21101,
-    2916: 10,
-    2917: 0,
-    2918: 2,
-    2919: 21102,
-    2920: 2926,
-    2921: 1,
-    2922: 0,
-    2923: 1106,
-    2924: 0,
-    2925: 3010,
-    2926: 22102,
-    2927: 1,
-    2928: 1,
-    2929: -2,
-    2930: 21201,
-    2931: 2,
-    2932: 0,
-    2933: -1,
-    2934: 1206,
-    2935: -2,
-    2936: 2948,
-    2937: 21202,
-    2938: -2,
-    2939: 1,
-    2940: 1,
-    2941: 21101,
-    2942: 0,
-    2943: 2948,
-    2944: 0,
-    2945: 1106,
-    2946: 0,
-    2947: 2909,
-    2948: 22101,
-    2949: 48,
-    2950: -1,
-    2951: -1,
-    2952: 204,
-    2953: -1,
-    2954: 109,
-    2955: -4,
-    2956: 2106,
-    2957: 0,
-    2958: 0,
-    2959: 1,
-    2960: 2,
-    2961: 4,
-    2962: 8,
-    2963: 16,
-    2964: 32,
-    2965: 64,
-    2966: 128,
-    2967: 256,
-    2968: 512,
-    2969: 1024,
-    2970: 2048,
-    2971: 4096,
-    2972: 8192,
-    2973: 16384,
-    2974: 32768,
-    2975: 65536,
-    2976: 131072,
-    2977: 262144,
-    2978: 524288,
-    2979: 1048576,
-    2980: 2097152,
-    2981: 4194304,
-    2982: 8388608,
-    2983: 16777216,
-    2984: 33554432,
-    2985: 67108864,
-    2986: 134217728,
-    2987: 268435456,
-    2988: 536870912,
-    2989: 1073741824,
-    2990: 2147483648,
-    2991: 4294967296,
-    2992: 8589934592,
-    2993: 17179869184,
-    2994: 34359738368,
-    2995: 68719476736,
-    2996: 137438953472,
-    2997: 274877906944,
-    2998: 549755813888,
-    2999: 1099511627776,
-    3000: 2199023255552,
-    3001: 4398046511104,
-    3002: 8796093022208,
-    3003: 17592186044416,
-    3004: 35184372088832,
-    3005: 70368744177664,
-    3006: 140737488355328,
-    3007: 281474976710656,
-    3008: 562949953421312,
-    3009: 1125899906842624,
-    3010: 109,
-    3011: 8,
-    3012: 21101,
-    3013: 0,
-    3014: 0,
-    3015: -4,
-    3016: 21102,
-    3017: 1,
-    3018: 0,
-    3019: -3,
-    3020: 21101,
-    3021: 51,
-    3022: 0,
-    3023: -2,
-    3024: 21201,
-    3025: -2,
-    3026: -1,
-    3027: -2,
-    3028: 1201,
-    3029: -2,
-    3030: 2959,
-    3031: 3033,
-    3032: 21001,
-    3033: 0,
-    3034: 0,
-    3035: -1,
-    3036: 21202,
-    3037: -3,
-    3038: 2,
-    3039: -3,
-    3040: 22207,
-    3041: -7,
-    3042: -1,
-    3043: -5,
-    3044: 1205,
-    3045: -5,
-    3046: 3059,
-    3047: 21201,
-    3048: -3,
-    3049: 1,
-    3050: -3,
-    3051: 22102,
-    3052: -1,
-    3053: -1,
-    3054: -5,
-    3055: 22201,
-    3056: -7,
-    3057: -5,
-    3058: -7,
-    3059: 22207,
-    3060: -3,
-    3061: -6,
-    3062: -5,
-    3063: 1205,
-    3064: -5,
-    3065: 3078,
-    3066: 22102,
-    3067: -1,
-    3068: -6,
-    3069: -5,
-    3070: 22201,
-    3071: -3,
-    3072: -5,
-    3073: -3,
-    3074: 22201,
-    3075: -1,
-    3076: -4,
-    3077: -4,
-    3078: 1205,
-    3079: -2,
-    3080: 3024,
-    3081: 22101,
-    3082: 0,
-    3083: -4,
-    3084: -7,
-    3085: 21201,
-    3086: -3,
-    3087: 0,
-    3088: -6,
-    3089: 109,
-    3090: -8,
-    3091: 2105,
-    3092: 1,
-    3093: 0,
-    3094: -1,
-    3095: -1,
-    3096: -1,
-    3097: -1,
-    3098: -1,
-    3099: -1,
-    3100: -1,
-    3101: -1,
-    3102: -1,
-    3103: -1,
-    3104: -1,
-    3105: -1,
-    3106: -1,
-    3107: -1,
-    3108: -1,
-    3109: -1,
-    3110: -1,
-    3111: -1,
-    3112: -1,
-    3113: -1,
-    3114: -1,
-    3115: -1,
-    3116: -1,
-    3117: -1,
-    3118: -1,
-    3119: -1,
-    3120: -1,
-    3121: -1,
-    3122: -1,
-    3123: -1,
-    3124: 3131,
-    3125: 3143,
-    3126: 0,
-    3127: 3311,
-    3128: 3252,
-    3129: 0,
-    3130: 0,
-    3131: 11,
-    3132: 61,
-    3133: 105,
-    3134: 95,
-    3135: 94,
-    3136: 17,
-    3137: 50,
-    3138: 97,
-    3139: 83,
-    3140: 78,
-    3141: 79,
-    3142: 83,
-    3143: 108,
-    3144: -19,
-    3145: 2,
-    3146: 7,
-    3147: -79,
-    3148: -9,
-    3149: -2,
-    3150: 2,
-    3151: -83,
-    3152: -11,
-    3153: -7,
-    3154: -86,
-    3155: -3,
-    3156: -16,
-    3157: -7,
-    3158: -11,
-    3159: -6,
-    3160: -21,
-    3161: -21,
-    3162: -94,
-    3163: -30,
-    3164: -96,
-    3165: -25,
-    3166: -19,
-    3167: -23,
-    3168: -31,
-    3169: -101,
-    3170: -29,
-    3171: -25,
-    3172: -104,
-    3173: -21,
-    3174: -34,
-    3175: -38,
-    3176: -108,
-    3177: -39,
-    3178: -34,
-    3179: -32,
-    3180: -33,
-    3181: -31,
-    3182: -114,
-    3183: -43,
-    3184: -47,
-    3185: -35,
-    3186: -49,
-    3187: -105,
-    3188: -120,
-    3189: -69,
-    3190: -43,
-    3191: -123,
-    3192: -49,
-    3193: -56,
-    3194: -57,
-    3195: -47,
-    3196: -128,
-    3197: -40,
-    3198: -51,
-    3199: -46,
-    3200: -50,
-    3201: -133,
-    3202: -51,
-    3203: -63,
-    3204: -63,
-    3205: -57,
-    3206: -138,
-    3207: -69,
-    3208: -58,
-    3209: -62,
-    3210: -65,
-    3211: -143,
-    3212: -79,
-    3213: -69,
-    3214: -63,
-    3215: -68,
-    3216: -148,
-    3217: -79,
-    3218: -68,
-    3219: -82,
-    3220: -83,
-    3221: -63,
-    3222: -81,
-    3223: -77,
-    3224: -85,
-    3225: -145,
-    3226: -158,
-    3227: -75,
-    3228: -88,
-    3229: -92,
-    3230: -162,
-    3231: -91,
-    3232: -85,
-    3233: -89,
-    3234: -97,
-    3235: -167,
-    3236: -96,
-    3237: -104,
-    3238: -87,
-    3239: -171,
-    3240: -106,
-    3241: -104,
-    3242: -105,
-    3243: -97,
-    3244: -176,
-    3245: -94,
-    3246: -109,
-    3247: -114,
-    3248: -104,
-    3249: -112,
-    3250: -114,
-    3251: -169,
-    3252: 3259,
-    3253: 3282,
-    3254: 0,
-    3255: 0,
-    3256: 3403,
-    3257: 3792,
-    3258: 3124,
-    3259: 22,
-    3260: 50,
-    3261: 88,
-    3262: 92,
-    3263: 7,
-    3264: 41,
-    3265: 77,
-    3266: 83,
-    3267: 70,
-    3268: 81,
-    3269: 77,
-    3270: 65,
-    3271: 83,
-    3272: 67,
-    3273: -3,
-    3274: 34,
-    3275: 74,
-    3276: 79,
-    3277: 71,
-    3278: 76,
-    3279: 56,
-    3280: 63,
-    3281: 67,
-    3282: 28,
-    3283: 55,
-    3284: 82,
-    3285: 79,
-    3286: 70,
-    3287: 72,
-    3288: 78,
-    3289: 85,
-    3290: 9,
-    3291: -4,
-    3292: 68,
-    3293: 78,
-    3294: 0,
-    3295: 75,
-    3296: -9,
-    3297: 73,
-    3298: 73,
-    3299: 61,
-    3300: 63,
-    3301: 62,
-    3302: -15,
-    3303: 71,
-    3304: 62,
-    3305: 64,
-    3306: 56,
-    3307: 53,
-    3308: 57,
-    3309: 49,
-    3310: -9,
-    3311: 3318,
-    3312: 3326,
-    3313: 0,
-    3314: 3561,
-    3315: 0,
-    3316: 3124,
-    3317: 3940,
-    3318: 7,
-    3319: 65,
-    3320: 89,
-    3321: 99,
-    3322: 98,
-    3323: 108,
-    3324: 85,
-    3325: 108,
-    3326: 76,
-    3327: 8,
-    3328: 27,
-    3329: 27,
-    3330: 36,
-    3331: -48,
-    3332: 16,
-    3333: 32,
-    3334: 18,
-    3335: 13,
-    3336: -53,
-    3337: 18,
-    3338: 10,
-    3339: 27,
-    3340: -57,
-    3341: 8,
-    3342: 10,
-    3343: 9,
-    3344: 17,
-    3345: -62,
-    3346: 16,
-    3347: 16,
-    3348: 19,
-    3349: 7,
-    3350: 10,
-    3351: 5,
-    3352: 21,
-    3353: -1,
-    3354: -3,
-    3355: -72,
-    3356: -3,
-    3357: 5,
-    3358: 7,
-    3359: -76,
-    3360: 6,
-    3361: 1,
-    3362: -2,
-    3363: -11,
-    3364: 3,
-    3365: -10,
-    3366: -10,
-    3367: -6,
-    3368: -14,
-    3369: -59,
-    3370: -87,
-    3371: 1,
-    3372: -10,
-    3373: -5,
-    3374: -84,
-    3375: -10,
-    3376: -24,
-    3377: -94,
-    3378: -21,
-    3379: -11,
-    3380: -14,
-    3381: -14,
-    3382: -99,
-    3383: -22,
-    3384: -22,
-    3385: -18,
-    3386: -103,
-    3387: -23,
-    3388: -20,
-    3389: -33,
-    3390: -23,
-    3391: -39,
-    3392: -109,
-    3393: -27,
-    3394: -26,
-    3395: -30,
-    3396: -44,
-    3397: -114,
-    3398: -28,
-    3399: -44,
-    3400: -52,
-    3401: -34,
-    3402: -105,
-    3403: 3410,
-    3404: 3431,
-    3405: 0,
-    3406: 0,
-    3407: 3696,
-    3408: 3472,
-    3409: 3252,
-    3410: 20,
-    3411: 51,
-    3412: 84,
-    3413: 80,
-    3414: 93,
-    3415: 8,
-    3416: 62,
-    3417: 88,
-    3418: 70,
-    3419: 84,
-    3420: 83,
-    3421: 75,
-    3422: 79,
-    3423: 71,
-    3424: -1,
-    3425: 33,
-    3426: 66,
-    3427: 74,
-    3428: 79,
-    3429: 63,
-    3430: 75,
-    3431: 40,
-    3432: 32,
-    3433: 70,
-    3434: 77,
-    3435: -11,
-    3436: 57,
-    3437: 63,
-    3438: 69,
-    3439: 54,
-    3440: -16,
-    3441: 51,
-    3442: 61,
-    3443: -19,
-    3444: 69,
-    3445: 58,
-    3446: 63,
-    3447: -23,
-    3448: 63,
-    3449: 57,
-    3450: 39,
-    3451: 53,
-    3452: -28,
-    3453: 51,
-    3454: 52,
-    3455: 38,
-    3456: 51,
-    3457: 36,
-    3458: 44,
-    3459: 49,
-    3460: 47,
-    3461: -37,
-    3462: 41,
-    3463: 39,
-    3464: -40,
-    3465: 43,
-    3466: 30,
-    3467: 26,
-    3468: -44,
-    3469: 26,
-    3470: 33,
-    3471: -16,
-    3472: 3479,
-    3473: 3488,
-    3474: 0,
-    3475: 3403,
-    3476: 0,
-    3477: 0,
-    3478: 0,
-    3479: 8,
-    3480: 75,
-    3481: 96,
-    3482: 89,
-    3483: 96,
-    3484: 20,
-    3485: 53,
-    3486: 83,
-    3487: 106,
-    3488: 72,
-    3489: 11,
-    3490: 44,
-    3491: 38,
-    3492: 37,
-    3493: 35,
-    3494: 37,
-    3495: 38,
-    3496: 36,
-    3497: -48,
-    3498: 17,
-    3499: 29,
-    3500: 33,
-    3501: 20,
-    3502: -53,
-    3503: -4,
-    3504: 14,
-    3505: 12,
-    3506: -44,
-    3507: -12,
-    3508: 20,
-    3509: 23,
-    3510: 8,
-    3511: 6,
-    3512: -63,
-    3513: -14,
-    3514: 4,
-    3515: 7,
-    3516: 11,
-    3517: 0,
-    3518: 0,
-    3519: -1,
-    3520: 11,
-    3521: -72,
-    3522: 4,
-    3523: -5,
-    3524: -7,
-    3525: -3,
-    3526: -10,
-    3527: -5,
-    3528: -1,
-    3529: -11,
-    3530: -81,
-    3531: -17,
-    3532: -5,
-    3533: -16,
-    3534: -85,
-    3535: -4,
-    3536: -18,
-    3537: -17,
-    3538: -4,
-    3539: -14,
-    3540: -26,
-    3541: -10,
-    3542: -93,
-    3543: -12,
-    3544: -26,
-    3545: -23,
-    3546: -19,
-    3547: -30,
-    3548: -30,
-    3549: -31,
-    3550: -19,
-    3551: -102,
-    3552: -26,
-    3553: -35,
-    3554: -37,
-    3555: -33,
-    3556: -40,
-    3557: -35,
-    3558: -31,
-    3559: -41,
-    3560: -97,
-    3561: 3568,
-    3562: 3575,
-    3563: 0,
-    3564: 4011,
-    3565: 0,
-    3566: 3311,
-    3567: 3616,
-    3568: 6,
-    3569: 59,
-    3570: 107,
-    3571: 91,
-    3572: 88,
-    3573: 90,
-    3574: 90,
-    3575: 40,
-    3576: 38,
-    3577: 70,
-    3578: 68,
-    3579: 58,
-    3580: -12,
-    3581: 66,
-    3582: 56,
-    3583: -15,
-    3584: 68,
-    3585: 55,
-    3586: 51,
-    3587: -19,
-    3588: 47,
-    3589: 44,
-    3590: 44,
-    3591: 50,
-    3592: 54,
-    3593: 44,
-    3594: 58,
-    3595: 56,
-    3596: -28,
-    3597: 54,
-    3598: 39,
-    3599: 38,
-    3600: 45,
-    3601: -33,
-    3602: 50,
-    3603: 44,
-    3604: -36,
-    3605: 35,
-    3606: 27,
-    3607: 47,
-    3608: 29,
-    3609: -41,
-    3610: 38,
-    3611: 36,
-    3612: 43,
-    3613: 24,
-    3614: 36,
-    3615: -33,
-    3616: 3623,
-    3617: 3635,
-    3618: 0,
-    3619: 0,
-    3620: 3561,
-    3621: 0,
-    3622: 0,
-    3623: 11,
-    3624: 68,
-    3625: 86,
-    3626: 102,
-    3627: 87,
-    3628: 99,
-    3629: 102,
-    3630: 80,
-    3631: 98,
-    3632: 92,
-    3633: 94,
-    3634: 100,
-    3635: 60,
-    3636: 24,
-    3637: 43,
-    3638: 39,
-    3639: 51,
-    3640: 37,
-    3641: -33,
-    3642: 31,
-    3643: 47,
-    3644: 33,
-    3645: -37,
-    3646: 27,
-    3647: -39,
-    3648: 30,
-    3649: 28,
-    3650: 45,
-    3651: -43,
-    3652: 40,
-    3653: 24,
-    3654: 30,
-    3655: 22,
-    3656: 35,
-    3657: 18,
-    3658: 29,
-    3659: 29,
-    3660: 17,
-    3661: 30,
-    3662: -27,
-    3663: -55,
-    3664: 28,
-    3665: 15,
-    3666: 11,
-    3667: 30,
-    3668: -53,
-    3669: 21,
-    3670: 7,
-    3671: -63,
-    3672: 1,
-    3673: 11,
-    3674: 10,
-    3675: -67,
-    3676: -2,
-    3677: 10,
-    3678: 6,
-    3679: 13,
-    3680: -3,
-    3681: -5,
-    3682: -74,
-    3683: -7,
-    3684: 3,
-    3685: 10,
-    3686: 0,
-    3687: -67,
-    3688: -80,
-    3689: 3,
-    3690: -10,
-    3691: -4,
-    3692: 1,
-    3693: -14,
-    3694: -14,
-    3695: -73,
-    3696: 3703,
-    3697: 3714,
-    3698: 0,
-    3699: 3867,
-    3700: 4140,
-    3701: 0,
-    3702: 3403,
-    3703: 10,
-    3704: 68,
-    3705: 86,
-    3706: 106,
-    3707: 92,
-    3708: 89,
-    3709: 82,
-    3710: 100,
-    3711: 88,
-    3712: 93,
-    3713: 91,
-    3714: 77,
-    3715: 6,
-    3716: 38,
-    3717: 18,
-    3718: 36,
-    3719: 36,
-    3720: 33,
-    3721: -25,
-    3722: -52,
-    3723: -2,
-    3724: 30,
-    3725: 27,
-    3726: 9,
-    3727: 21,
-    3728: 10,
-    3729: 10,
-    3730: 8,
-    3731: -47,
-    3732: -62,
-    3733: -15,
-    3734: 12,
-    3735: 4,
-    3736: -1,
-    3737: 16,
-    3738: 1,
-    3739: -69,
-    3740: 13,
-    3741: 14,
-    3742: 8,
-    3743: 7,
-    3744: 2,
-    3745: 14,
-    3746: -76,
-    3747: 0,
-    3748: -9,
-    3749: -14,
-    3750: 3,
-    3751: 4,
-    3752: 0,
-    3753: -14,
-    3754: -7,
-    3755: -16,
-    3756: -8,
-    3757: -3,
-    3758: -5,
-    3759: -89,
-    3760: -20,
-    3761: -9,
-    3762: -13,
-    3763: -16,
-    3764: -94,
-    3765: -25,
-    3766: -23,
-    3767: -27,
-    3768: -14,
-    3769: -10,
-    3770: -100,
-    3771: -18,
-    3772: -18,
-    3773: -38,
-    3774: -22,
-    3775: -22,
-    3776: -106,
-    3777: -23,
-    3778: -29,
-    3779: -109,
-    3780: -28,
-    3781: -42,
-    3782: -45,
-    3783: -48,
-    3784: -38,
-    3785: -42,
-    3786: -50,
-    3787: -35,
-    3788: -53,
-    3789: -35,
-    3790: -51,
-    3791: -107,
-    3792: 3799,
-    3793: 3811,
-    3794: 0,
-    3795: 3252,
-    3796: 0,
-    3797: 0,
-    3798: 0,
-    3799: 11,
-    3800: 72,
-    3801: 87,
-    3802: 92,
-    3803: 87,
-    3804: 95,
-    3805: 83,
-    3806: 84,
-    3807: 14,
-    3808: 57,
-    3809: 77,
-    3810: 77,
-    3811: 55,
-    3812: 34,
-    3813: 55,
-    3814: 60,
-    3815: -26,
-    3816: 56,
-    3817: 41,
-    3818: 40,
-    3819: -30,
-    3820: 38,
-    3821: 54,
-    3822: 40,
-    3823: 34,
-    3824: 34,
-    3825: 42,
-    3826: 30,
-    3827: 31,
-    3828: -39,
-    3829: 32,
-    3830: 28,
-    3831: 40,
-    3832: 26,
-    3833: -44,
-    3834: 34,
-    3835: 24,
-    3836: -47,
-    3837: 32,
-    3838: 33,
-    3839: 29,
-    3840: 33,
-    3841: 27,
-    3842: 31,
-    3843: 35,
-    3844: 25,
-    3845: 13,
-    3846: -57,
-    3847: 22,
-    3848: 20,
-    3849: 16,
-    3850: 28,
-    3851: 15,
-    3852: 6,
-    3853: 18,
-    3854: -65,
-    3855: 2,
-    3856: 2,
-    3857: 15,
-    3858: 4,
-    3859: 1,
-    3860: 7,
-    3861: -72,
-    3862: 14,
-    3863: 5,
-    3864: 7,
-    3865: -1,
-    3866: -63,
-    3867: 3874,
-    3868: 3883,
-    3869: 0,
-    3870: 4068,
-    3871: 4278,
-    3872: 3696,
-    3873: 0,
-    3874: 8,
-    3875: 64,
-    3876: 102,
-    3877: 98,
-    3878: 100,
-    3879: 88,
-    3880: 88,
-    3881: 85,
-    3882: 92,
-    3883: 56,
-    3884: 27,
-    3885: 54,
-    3886: 51,
-    3887: 42,
-    3888: 51,
-    3889: 49,
-    3890: 39,
-    3891: -31,
-    3892: 51,
-    3893: 36,
-    3894: 35,
-    3895: 42,
-    3896: 47,
-    3897: -37,
-    3898: 46,
-    3899: 40,
-    3900: -40,
-    3901: 31,
-    3902: 23,
-    3903: 43,
-    3904: 25,
-    3905: -45,
-    3906: 30,
-    3907: 22,
-    3908: 22,
-    3909: 35,
-    3910: -50,
-    3911: 22,
-    3912: 32,
-    3913: -53,
-    3914: 25,
-    3915: 23,
-    3916: -56,
-    3917: 27,
-    3918: 14,
-    3919: 10,
-    3920: -60,
-    3921: -22,
-    3922: 11,
-    3923: 2,
-    3924: 14,
-    3925: 19,
-    3926: -66,
-    3927: -28,
-    3928: 14,
-    3929: 4,
-    3930: -2,
-    3931: -71,
-    3932: 11,
-    3933: -4,
-    3934: 10,
-    3935: 9,
-    3936: -3,
-    3937: 1,
-    3938: -7,
-    3939: -65,
-    3940: 3947,
-    3941: 3959,
-    3942: 0,
-    3943: 4407,
-    3944: 3311,
-    3945: 0,
-    3946: 0,
-    3947: 11,
-    3948: 58,
-    3949: 98,
-    3950: 90,
-    3951: 91,
-    3952: 95,
-    3953: 85,
-    3954: 84,
-    3955: 96,
-    3956: 86,
-    3957: 90,
-    3958: 82,
-    3959: 51,
-    3960: 38,
-    3961: 59,
-    3962: 64,
-    3963: -22,
-    3964: 60,
-    3965: 45,
-    3966: 44,
-    3967: -26,
-    3968: 38,
-    3969: -28,
-    3970: 58,
-    3971: 42,
-    3972: 42,
-    3973: 52,
-    3974: 36,
-    3975: 32,
-    3976: 44,
-    3977: 29,
-    3978: 45,
-    3979: 30,
-    3980: -39,
-    3981: 47,
-    3982: 32,
-    3983: 42,
-    3984: 29,
-    3985: -44,
-    3986: 35,
-    3987: 30,
-    3988: 18,
-    3989: 30,
-    3990: 34,
-    3991: -50,
-    3992: 19,
-    3993: 27,
-    3994: 29,
-    3995: -54,
-    3996: -4,
-    3997: 24,
-    3998: 25,
-    3999: 15,
-    4000: 19,
-    4001: 11,
-    4002: 7,
-    4003: 20,
-    4004: 16,
-    4005: 9,
-    4006: 3,
-    4007: -66,
-    4008: 19,
-    4009: -50,
-    4010: -55,
-    4011: 4018,
-    4012: 4032,
-    4013: 0,
-    4014: 0,
-    4015: 4182,
-    4016: 3561,
-    4017: 0,
-    4018: 13,
-    4019: 54,
-    4020: 100,
-    4021: 86,
-    4022: 103,
-    4023: 15,
-    4024: 63,
-    4025: 98,
-    4026: 77,
-    4027: 93,
-    4028: 94,
-    4029: 78,
-    4030: 90,
-    4031: 90,
-    4032: 35,
-    4033: 49,
-    4034: 68,
-    4035: 64,
-    4036: -6,
-    4037: 59,
-    4038: 61,
-    4039: 59,
-    4040: 73,
-    4041: -11,
-    4042: 53,
-    4043: 69,
-    4044: 55,
-    4045: -15,
-    4046: 49,
-    4047: 59,
-    4048: 58,
-    4049: -19,
-    4050: 64,
-    4051: 58,
-    4052: 57,
-    4053: -23,
-    4054: 59,
-    4055: 52,
-    4056: 39,
-    4057: 49,
-    4058: 48,
-    4059: -29,
-    4060: 40,
-    4061: 48,
-    4062: 50,
-    4063: -33,
-    4064: 55,
-    4065: 44,
-    4066: 49,
-    4067: -23,
-    4068: 4075,
-    4069: 4084,
-    4070: 0,
-    4071: 0,
-    4072: 0,
-    4073: 3867,
-    4074: 0,
-    4075: 8,
-    4076: 72,
-    4077: 88,
-    4078: 105,
-    4079: 104,
-    4080: 85,
-    4081: 90,
-    4082: 87,
-    4083: 100,
-    4084: 55,
-    4085: 29,
-    4086: 48,
-    4087: 44,
-    4088: 63,
-    4089: -20,
-    4090: 54,
-    4091: 40,
-    4092: -30,
-    4093: 34,
-    4094: -32,
-    4095: 43,
-    4096: 39,
-    4097: 49,
-    4098: 48,
-    4099: 39,
-    4100: 31,
-    4101: -39,
-    4102: 44,
-    4103: 46,
-    4104: 31,
-    4105: 40,
-    4106: 40,
-    4107: 44,
-    4108: -46,
-    4109: 18,
-    4110: 30,
-    4111: 19,
-    4112: -50,
-    4113: 32,
-    4114: 32,
-    4115: 12,
-    4116: 28,
-    4117: 29,
-    4118: 17,
-    4119: 21,
-    4120: 13,
-    4121: -59,
-    4122: 24,
-    4123: 18,
-    4124: -62,
-    4125: 13,
-    4126: 15,
-    4127: 14,
-    4128: 9,
-    4129: -67,
-    4130: -3,
-    4131: 7,
-    4132: 6,
-    4133: -71,
-    4134: -7,
-    4135: 3,
-    4136: -1,
-    4137: 0,
-    4138: -7,
-    4139: -63,
-    4140: 4147,
-    4141: 4155,
-    4142: 0,
-    4143: 0,
-    4144: 0,
-    4145: 0,
-    4146: 3696,
-    4147: 7,
-    4148: 68,
-    4149: 97,
-    4150: 107,
-    4151: 89,
-    4152: 93,
-    4153: 89,
-    4154: 97,
-    4155: 26,
-    4156: 43,
-    4157: 91,
-    4158: 73,
-    4159: 85,
-    4160: 91,
-    4161: 85,
-    4162: 72,
-    4163: 72,
-    4164: 76,
-    4165: 68,
-    4166: 3,
-    4167: 78,
-    4168: -6,
-    4169: 63,
-    4170: 74,
-    4171: 60,
-    4172: 59,
-    4173: 79,
-    4174: 57,
-    4175: 0,
-    4176: 54,
-    4177: 67,
-    4178: 57,
-    4179: 52,
-    4180: 50,
-    4181: -5,
-    4182: 4189,
-    4183: 4198,
-    4184: 0,
-    4185: 0,
-    4186: 4343,
-    4187: 0,
-    4188: 4011,
-    4189: 8,
-    4190: 59,
-    4191: 102,
-    4192: 104,
-    4193: 103,
-    4194: 93,
-    4195: 87,
-    4196: 97,
-    4197: 99,
-    4198: 79,
-    4199: 5,
-    4200: 24,
-    4201: 20,
-    4202: -50,
-    4203: 26,
-    4204: 17,
-    4205: 31,
-    4206: 11,
-    4207: 21,
-    4208: -56,
-    4209: 30,
-    4210: 7,
-    4211: 17,
-    4212: 16,
-    4213: 22,
-    4214: -62,
-    4215: 2,
-    4216: 14,
-    4217: 3,
-    4218: -66,
-    4219: 17,
-    4220: 4,
-    4221: 0,
-    4222: -70,
-    4223: 6,
-    4224: -3,
-    4225: 11,
-    4226: -9,
-    4227: 1,
-    4228: -76,
-    4229: -7,
-    4230: -2,
-    4231: 0,
-    4232: -1,
-    4233: 1,
-    4234: -82,
-    4235: -18,
-    4236: -2,
-    4237: -16,
-    4238: -86,
-    4239: -4,
-    4240: -12,
-    4241: -16,
-    4242: -19,
-    4243: -19,
-    4244: -8,
-    4245: -17,
-    4246: -5,
-    4247: -95,
-    4248: -28,
-    4249: -24,
-    4250: -28,
-    4251: -29,
-    4252: -31,
-    4253: -19,
-    4254: -33,
-    4255: -25,
-    4256: -20,
-    4257: -105,
-    4258: -39,
-    4259: -28,
-    4260: -32,
-    4261: -30,
-    4262: -28,
-    4263: -28,
-    4264: -98,
-    4265: -113,
-    4266: -67,
-    4267: -33,
-    4268: -116,
-    4269: -52,
-    4270: -36,
-    4271: -50,
-    4272: -120,
-    4273: -37,
-    4274: -50,
-    4275: -54,
-    4276: -35,
-    4277: -94,
-    4278: 4285,
-    4279: 4308,
-    4280: 0,
-    4281: 0,
-    4282: 0,
-    4283: 0,
-    4284: 3867,
-    4285: 22,
-    4286: 65,
-    4287: 74,
-    4288: 90,
-    4289: 87,
-    4290: 6,
-    4291: 41,
-    4292: 86,
-    4293: 76,
-    4294: 88,
-    4295: 70,
-    4296: 0,
-    4297: 44,
-    4298: 63,
-    4299: 70,
-    4300: 74,
-    4301: 79,
-    4302: 63,
-    4303: 71,
-    4304: 57,
-    4305: 69,
-    4306: 57,
-    4307: 58,
-    4308: 34,
-    4309: 39,
-    4310: 81,
-    4311: -4,
-    4312: 60,
-    4313: 74,
-    4314: 73,
-    4315: 61,
-    4316: 56,
-    4317: 72,
-    4318: 72,
-    4319: -12,
-    4320: 71,
-    4321: 65,
-    4322: -15,
-    4323: 50,
-    4324: 52,
-    4325: -18,
-    4326: 68,
-    4327: 59,
-    4328: 61,
-    4329: 53,
-    4330: 50,
-    4331: 54,
-    4332: 46,
-    4333: -26,
-    4334: 51,
-    4335: 51,
-    4336: 53,
-    4337: 47,
-    4338: 34,
-    4339: 44,
-    4340: 43,
-    4341: 55,
-    4342: -21,
-    4343: 4350,
-    4344: 4358,
-    4345: 0,
-    4346: 0,
-    4347: 0,
-    4348: 0,
-    4349: 4182,
-    4350: 7,
-    4351: 76,
-    4352: 108,
-    4353: 102,
-    4354: 104,
-    4355: 86,
-    4356: 91,
-    4357: 88,
-    4358: 48,
-    4359: 36,
-    4360: 55,
-    4361: 51,
-    4362: -19,
-    4363: 46,
-    4364: 58,
-    4365: 66,
-    4366: 46,
-    4367: 59,
-    4368: -25,
-    4369: 48,
-    4370: 58,
-    4371: 55,
-    4372: 55,
-    4373: -30,
-    4374: 36,
-    4375: 47,
-    4376: 45,
-    4377: 50,
-    4378: 30,
-    4379: 37,
-    4380: 41,
-    4381: -38,
-    4382: 38,
-    4383: 39,
-    4384: 41,
-    4385: 27,
-    4386: -43,
-    4387: 22,
-    4388: 34,
-    4389: 42,
-    4390: 22,
-    4391: 35,
-    4392: -35,
-    4393: -50,
-    4394: -51,
-    4395: -2,
-    4396: 16,
-    4397: 13,
-    4398: 30,
-    4399: 26,
-    4400: 26,
-    4401: 15,
-    4402: 27,
-    4403: 9,
-    4404: 15,
-    4405: 27,
-    4406: -49,
-    4407: 4414,
-    4408: 4422,
-    4409: 0,
-    4410: 0,
-    4411: 0,
-    4412: 3940,
-    4413: 4457,
-    4414: 7,
-    4415: 76,
-    4416: 108,
-    4417: 88,
-    4418: 88,
-    4419: 97,
-    4420: 89,
-    4421: 102,
-    4422: 34,
-    4423: 48,
-    4424: 66,
-    4425: 69,
-    4426: 73,
-    4427: 62,
-    4428: 62,
-    4429: 61,
-    4430: 73,
-    4431: 3,
-    4432: 72,
-    4433: 61,
-    4434: 77,
-    4435: 55,
-    4436: 53,
-    4437: -2,
-    4438: -17,
-    4439: 34,
-    4440: 53,
-    4441: 49,
-    4442: 68,
-    4443: -15,
-    4444: 59,
-    4445: 45,
-    4446: -25,
-    4447: 39,
-    4448: 49,
-    4449: 48,
-    4450: -29,
-    4451: 39,
-    4452: 46,
-    4453: 48,
-    4454: 51,
-    4455: 55,
-    4456: -21,
-    4457: 4464,
-    4458: 4484,
-    4459: 0,
-    4460: 4556,
-    4461: 4407,
-    4462: 0,
-    4463: 0,
-    4464: 19,
-    4465: 64,
-    4466: 81,
-    4467: 78,
-    4468: 95,
-    4469: 91,
-    4470: 81,
-    4471: 91,
-    4472: 95,
-    4473: 5,
-    4474: 39,
-    4475: 75,
-    4476: 71,
-    4477: 68,
-    4478: 75,
-    4479: 79,
-    4480: 77,
-    4481: 70,
-    4482: 74,
-    4483: 79,
-    4484: 71,
-    4485: 2,
-    4486: 38,
-    4487: -41,
-    4488: 42,
-    4489: 29,
-    4490: 25,
-    4491: -45,
-    4492: 32,
-    4493: 22,
-    4494: 40,
-    4495: 35,
-    4496: -50,
-    4497: 31,
-    4498: 27,
-    4499: 26,
-    4500: 23,
-    4501: -43,
-    4502: -56,
-    4503: 8,
-    4504: -58,
-    4505: 21,
-    4506: 22,
-    4507: 8,
-    4508: 21,
-    4509: 20,
-    4510: 21,
-    4511: 17,
-    4512: 3,
-    4513: -54,
-    4514: 15,
-    4515: 0,
-    4516: 8,
-    4517: 12,
-    4518: 1,
-    4519: 11,
-    4520: -1,
-    4521: 11,
-    4522: -7,
-    4523: -77,
-    4524: -8,
-    4525: -3,
-    4526: -1,
-    4527: -2,
-    4528: 0,
-    4529: -83,
-    4530: 3,
-    4531: -12,
-    4532: -10,
-    4533: -11,
-    4534: -88,
-    4535: -3,
-    4536: -21,
-    4537: -9,
-    4538: -19,
-    4539: -23,
-    4540: -5,
-    4541: -95,
-    4542: -7,
-    4543: -18,
-    4544: -13,
-    4545: -17,
-    4546: -100,
-    4547: -28,
-    4548: -34,
-    4549: -34,
-    4550: -26,
-    4551: -21,
-    4552: -33,
-    4553: -23,
-    4554: -19,
-    4555: -95,
-    4556: 4563,
-    4557: 4588,
-    4558: 1553,
-    4559: 0,
-    4560: 0,
-    4561: 4457,
-    4562: 0,
-    4563: 24,
-    4564: 56,
-    4565: 89,
-    4566: 75,
-    4567: 88,
-    4568: 87,
-    4569: 88,
-    4570: 84,
-    4571: 70,
-    4572: 13,
-    4573: 50,
-    4574: 67,
-    4575: 75,
-    4576: 79,
-    4577: 68,
-    4578: 78,
-    4579: 66,
-    4580: 78,
-    4581: 60,
-    4582: -10,
-    4583: 27,
-    4584: 64,
-    4585: 66,
-    4586: 65,
-    4587: 67,
-    4588: 12,
-    4589: 53,
-    4590: 97,
-    4591: 83,
-    4592: 93,
-    4593: 105,
-    4594: 105,
-    4595: 87,
-    4596: 91,
-    4597: 83,
-    4598: 25,
-    4599: 24,
-    4600: 23,
-    4601: -1,
-    4602: 4653,
-    4603: 28,
-    4604: 0,
-    4605: 4182,
-    4606: 4657,
-    4607: 28,
-    4608: 1850,
-    4609: -1,
-    4610: 4669,
-    4611: 157,
-    4612: 0,
-    4613: 3940,
-    4614: 4674,
-    4615: 30,
-    4616: 1796,
-    4617: -1,
-    4618: 4685,
-    4619: 35,
-    4620: 0,
-    4621: -1,
-    4622: 4689,
-    4623: 1073741856,
-    4624: 0,
-    4625: -1,
-    4626: 4703,
-    4627: 536870945,
-    4628: 0,
-    4629: -1,
-    4630: 4716,
-    4631: 131106,
-    4632: 0,
-    4633: 4407,
-    4634: 4728,
-    4635: 35,
-    4636: 1818,
-    4637: 3311,
-    4638: 4748,
-    4639: 36,
-    4640: 1872,
-    4641: 4011,
-    4642: 4756,
-    4643: 37,
-    4644: 1829,
-    4645: -1,
-    4646: 4770,
-    4647: 102,
-    4648: 0,
-    4649: -1,
-    4650: 4780,
-    4651: 41,
-    4652: 0,
-    4653: 3,
-    4654: 103,
-    4655: 93,
-    4656: 104,
-    4657: 11,
-    4658: 98,
-    4659: 99,
-    4660: 95,
-    4661: 102,
-    4662: 86,
-    4663: 94,
-    4664: 15,
-    4665: 90,
-    4666: 78,
-    4667: 98,
-    4668: 76,
-    4669: 4,
-    4670: 104,
-    4671: 106,
-    4672: 105,
-    4673: 102,
-    4674: 10,
-    4675: 91,
-    4676: 104,
-    4677: 87,
-    4678: 84,
-    4679: 98,
-    4680: 86,
-    4681: 16,
-    4682: 95,
-    4683: 93,
-    4684: 81,
-    4685: 3,
-    4686: 106,
-    4687: 113,
-    4688: 98,
-    4689: 13,
-    4690: 102,
-    4691: 98,
-    4692: 96,
-    4693: 95,
-    4694: 91,
-    4695: 14,
-    4696: 92,
-    4697: 82,
-    4698: 11,
-    4699: 77,
-    4700: 74,
-    4701: 92,
-    4702: 29,
-    4703: 12,
-    4704: 100,
-    4705: 101,
-    4706: 91,
-    4707: 94,
-    4708: 85,
-    4709: 15,
-    4710: 92,
-    4711: 98,
-    4712: 89,
-    4713: 77,
-    4714: 79,
-    4715: 91,
-    4716: 11,
-    4717: 91,
-    4718: 99,
-    4719: 98,
-    4720: 86,
-    4721: 17,
-    4722: 98,
-    4723: 80,
-    4724: 98,
-    4725: 86,
-    4726: 91,
-    4727: 89,
-    4728: 19,
-    4729: 84,
-    4730: 85,
-    4731: 76,
-    4732: 88,
-    4733: 93,
-    4734: 8,
-    4735: 76,
-    4736: 82,
-    4737: 74,
-    4738: 71,
-    4739: 87,
-    4740: 84,
-    4741: 80,
-    4742: 77,
-    4743: 64,
-    4744: 69,
-    4745: 75,
-    4746: 65,
-    4747: 79,
-    4748: 7,
-    4749: 105,
-    4750: 96,
-    4751: 102,
-    4752: 106,
-    4753: 100,
-    4754: 98,
-    4755: 102,
-    4756: 13,
-    4757: 92,
-    4758: 96,
-    4759: 87,
-    4760: 89,
-    4761: 93,
-    4762: 87,
-    4763: 97,
-    4764: 81,
-    4765: 11,
-    4766: 86,
-    4767: 88,
-    4768: 87,
-    4769: 87,
-    4770: 9,
-    4771: 93,
-    4772: 107,
-    4773: 90,
-    4774: 96,
-    4775: 19,
-    4776: 85,
-    4777: 86,
-    4778: 92,
-    4779: 91,
-    4780: 8,
-    4781: 101,
-    4782: 88,
-    4783: 100,
-    4784: 94,
-    4785: 90,
-    4786: 98,
-    4787: 94,
-    4788: 85,
-    4790: 166,
-    4789: 31,
-    4793: 0,
-    4792: 1993,
-    4795: 10,
-    4796: 2659,
-    4794: 10,
-    4798: 30,
-    4797: 3094,
-    4799: 1,
-    4801: 30,
-    4802: 1,
-    4803: 1162,
-    4800: 2706,
-    4804: 3123,
-    4805: 29,
-    4806: 13,
-    4808: 1162,
-    4807: 1,
-    4809: 4649,
-    4811: 1251,
-    4812: 77,
-    4813: 1256,
-    4810: 0,
-    4814: 4,
-    4791: 1251,
-    4815: 4,
-    4816: 1,
-    4818: 109,
-    4819: 3,
-    4820: 4,
-    4817: 1222,
-    4821: 116,
-    4822: 19,
-    4823: 116,
-}
@@ -1,12 +1,12 @@
 # prompt: https://adventofcode.com/2019/day/25
 
 import re
-from collections import defaultdict
 from itertools import combinations
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
-from ...base import slow
-from ..intcode import IntcodeComputer, IntcodeSolution
-from .mem_dump import STATE
+from ..intcode import IntcodeComputer, IntcodeSnapshot, IntcodeSolution
 
 # these are unique to my input
 ITEMS = (
@@ -22,52 +22,79 @@ ITEMS = (
 
 FAIL_STR = "ejected"  # if this is in the latest output, we didn't pass
 
+# a snapshot of my intcode computer standing at the entrance holding all the items.
+# kept in a separate file to keep the actual solution slim
+SNAPSHOT_FILE = Path(__file__).parent / "at_the_door.intcode"
 
-class Solution(IntcodeSolution):
-    _year = 2019
-    _day = 25
 
-    def reset_computer(self):
-        def fresh_state():
-            return defaultdict(
-                int,
-                # state where i'm standing at the door with all items
-                STATE,
-            )
+# each worker process loads the snapshot once, then restores it for every attempt
+_at_the_door: Optional[IntcodeSnapshot] = None
+_computer: Optional[IntcodeComputer] = None
+
+
+class _Ejected(Exception):
+    """
+    Raised by the output sink as soon as the failure message is printed, which stops the computer right there
+    """
+
+
+def _start_worker():
+    global _at_the_door, _computer  # noqa: PLW0603
+    _at_the_door = IntcodeSnapshot.load(SNAPSHOT_FILE)
+    _computer = IntcodeComputer.from_snapshot(_at_the_door, jit=True)
+
+
+def try_drops(drops: Tuple[str, ...]) -> Optional[str]:
+    """
+    Starting from the door, drops each item in `drops` and heads through. Returns everything printed after that if it worked, or `None` if we got ejected.
+    """
+    assert _computer and _at_the_door, "worker wasn't started"
+    computer = _computer
+    computer.restore(_at_the_door)
+
+    # watch for the failure message as it's printed, so a failed attempt stops there
+    # instead of running until the game asks for the next command
+    text: List[str] = []
 
-        computer = IntcodeComputer(self.input)
-        computer.program = fresh_state()
-        computer.pointer = 2663
-        computer.relative_base = 4796
+    def watch(value: int):
+        char = chr(value)
+        text.append(char)
+        # only look back once the message could have just finished
+        if char == FAIL_STR[-1] and "".join(text[-len(FAIL_STR) :]) == FAIL_STR:
+            raise _Ejected
 
-        return computer
+    computer.output_sink = watch
+    for drop in drops:
+        computer.add_input(f"drop {drop}")
+    computer.add_input("north")
+
+    try:
+        # runs until it's done with our commands and wants more
+        computer.run(wait_for_input=True)
+    except _Ejected:
+        # the computer is restored before every attempt, so stopping it mid-output is fine
+        return None
+    return "".join(text)
+
+
+def all_drops() -> Iterator[Tuple[str, ...]]:
+    for num_drops in range(1, len(ITEMS) + 1):
+        yield from combinations(ITEMS, num_drops)
+
+
+class Solution(IntcodeSolution):
+    _year = 2019
+    _day = 25
 
-    @slow
     def part_1(self):
-        found = False
-        computer = None
-        for num_drops in range(1, 9):
-            if found:
-                break
-            for drops in combinations(ITEMS, num_drops):
-                computer = self.reset_computer()
-
-                for drop in drops:
-                    computer.add_input(f"drop {drop}")
-                computer.add_input("north")
-
-                computer.run(num_inputs=computer.num_queued_inputs)
-                if FAIL_STR in "".join([chr(x) for x in computer.output]):
-                    continue
-
-                found = True
-                break
-
-        # computer is now inside the room! Dump the output
-        if computer and found:
-            res = computer.last_output_str()
-            computer.flush_output()
-            return re.search(r"\d{3,}", res).group()
+        # each attempt is independent, so they're spread across every core. Leaving
+        # the `with` block shuts down any workers that are still trying
+        with Pool(initializer=_start_worker) as pool:
+            for result in pool.imap(try_drops, all_drops()):
+                if result is not None:
+                    # we're inside the room! Dump the output
+                    print(result)
+                    return re.search(r"\d{3,}", result).group()
 
         print("no combination found")
         return None
@@ -1,7 +1,28 @@
-from collections import defaultdict
-from dataclasses import dataclass
+import asyncio
+import json
+import struct
+import sys
+from array import array
+from collections import Counter, deque
+from collections.abc import Buffer
+from dataclasses import dataclass, field
 from enum import Enum, IntEnum, auto
-from typing import List, Optional, Tuple, Union
+from functools import cache, partial
+from multiprocessing import Pool
+from pathlib import Path
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..base import BaseSolution, InputTypes
 
@@ -23,222 +44,964 @@ class STOP_REASON(Enum):
     HALTED = auto()
     NUM_OUTPUT = auto()
     NUM_INPUT = auto()
+    WAITING_FOR_INPUT = auto()
+
+
+NUM_PARAMETERS = {
+    OPCODES.ADDITION: 3,
+    OPCODES.MULTIPLICATION: 3,
+    OPCODES.INPUT: 1,
+    OPCODES.OUTPUT: 1,
+    OPCODES.TJMP: 2,
+    OPCODES.FJMP: 2,
+    OPCODES.LT: 3,
+    OPCODES.EQ: 3,
+    OPCODES.RELATIVE_BASE: 1,
+    OPCODES.HALT: 0,
+}
+
+# no instruction is longer than this, so a write can only ever land inside an
+# instruction that starts at most this many addresses earlier
+MAX_INSTRUCTION_LENGTH = 4
+
+
+class _Pause(Exception):
+    """
+    Raised by a handler when `run` should return (halting, or hitting an input/output limit)
+    """
+
+    def __init__(self, reason: STOP_REASON, pointer: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.pointer = pointer
+
+
+class _CallbackError(Exception):
+    """
+    Wraps an `IndexError` raised by an I/O callback (`input_provider`, `output_sink`, and so on), so `run` doesn't mistake it for the program reaching past the end of memory
+    """
+
+
+def _negative(address: int) -> int:
+    """
+    Called by generated code for a negative address, which a list would quietly wrap around to the end of memory
+    """
+    raise ValueError("negative address:", address)
+
+
+# a handler executes a single (already decoded) instruction and returns the new pointer.
+# it's called with the computer, its memory, the pointer, and the instruction's raw parameters
+Handler = Callable[["IntcodeComputer", List[int], int, int, int, int], int]
+DecodedInstruction = Tuple[Handler, int, int, int]
+# a compiled block runs a stretch of instructions and returns the new pointer
+Block = Callable[["IntcodeComputer", List[int]], int]
+# gets every value a program outputs, as it's output
+OutputSink = Callable[[int], None]
+
+# the value each of the "compute and store" opcodes writes
+_RESULTS = {
+    OPCODES.ADDITION: "{x} + {y}",
+    OPCODES.MULTIPLICATION: "{x} * {y}",
+    OPCODES.LT: "1 if {x} < {y} else 0",
+    OPCODES.EQ: "1 if {x} == {y} else 0",
+}
+
+# the most memory (in addresses) that gets compiled into a single block
+MAX_BLOCK_LENGTH = 64
+
+
+def _checked(address: str) -> str:
+    """
+    the python expression for an address that's only known at runtime, which fails if it's negative
+    """
+    return f"(i if (i := {address}) >= 0 else _negative(i))"
+
+
+def _read(mode: int, param: str, base="vm.relative_base") -> str:
+    """
+    the python expression for reading a parameter in a given mode. Position mode parameters are checked when they're decoded, but relative ones have to be checked every time
+    """
+    if mode == 0:  # position
+        return f"mem[{param}]"
+    if mode == 1:  # immediate
+        return param
+    if mode == 2:  # relative
+        return f"mem[{_checked(f'{base} + {param}')}]"
+    raise ValueError("invalid mode:", mode)
+
+
+def _write(mode: int, param: str, value: str) -> List[str]:
+    """
+    the python statements for writing to a parameter. writes never use immediate mode, so it's treated like position mode.
+
+    If the write lands on an address that's been decoded, the decoded instruction(s) are thrown out.
+    """
+    address = _checked(f"vm.relative_base + {param}") if mode == 2 else param
+    return [
+        f"dst = {address}",
+        f"mem[dst] = {value}",
+        "if dst in vm._code:",
+        "    vm._invalidate(dst)",
+    ]
+
+
+def tuple_sink(arity: int, callback: Callable[..., None]) -> OutputSink:
+    """
+    An output sink that groups outputs into chunks of `arity` values and calls `callback(*chunk)` as each one fills up. Great for programs that always output `(x, y, tile)` or similar.
+    """
+    chunk: List[int] = []
+
+    def sink(value: int):
+        chunk.append(value)
+        if len(chunk) == arity:
+            callback(*chunk)
+            chunk.clear()
+
+    return sink
+
+
+@cache
+def _handler(opcode: int, modes: Tuple[int, ...]) -> Handler:
+    """
+    Generates (and compiles) a function that runs a specific opcode with specific parameter modes, so none of that has to be checked at runtime.
+    """
+    x, y = (_read(mode, param) for mode, param in zip((*modes, 1, 1), "ab"))
+    write_mode = modes[-1] if modes else 0
+
+    if opcode in _RESULTS:
+        value = _RESULTS[opcode].format(x=x, y=y)
+        body = _write(write_mode, "c", value) + ["return ptr + 4"]
+    elif opcode == OPCODES.INPUT:
+        body = [
+            "if vm._inputs_left == 0:",
+            "    raise _Pause(STOP_REASON.NUM_INPUT, ptr)",
+            "if vm._wait_for_input and vm._would_wait():",
+            "    raise _Pause(STOP_REASON.WAITING_FOR_INPUT, ptr)",
+            # reading input can't be undone, so make sure the write will fit first
+            f"while {'vm.relative_base + a' if write_mode == 2 else 'a'} >= len(mem):",
+            "    vm._grow()",
+            "vm._inputs_left -= 1",
+            "if vm._flush:",
+            "    vm.flush_output()",
+            "try:",
+            "    value = vm.get_input()",
+            "except IndexError as e:",
+            "    raise _CallbackError from e",
+            *_write(write_mode, "a", "value"),
+            "return ptr + 2",
+        ]
+    elif opcode == OPCODES.OUTPUT:
+        body = [
+            f"value = {x}",
+            "try:",
+            "    vm._emit(value)",
+            "except IndexError as e:",
+            "    raise _CallbackError from e",
+            "vm._outputs_left -= 1",
+            "if vm._outputs_left == 0:",
+            "    raise _Pause(STOP_REASON.NUM_OUTPUT, ptr + 2)",
+            "return ptr + 2",
+        ]
+    elif opcode == OPCODES.TJMP:
+        body = [f"return {y} if {x} != 0 else ptr + 3"]
+    elif opcode == OPCODES.FJMP:
+        body = [f"return {y} if {x} == 0 else ptr + 3"]
+    elif opcode == OPCODES.RELATIVE_BASE:
+        body = [f"vm.relative_base += {x}", "return ptr + 2"]
+    elif opcode == OPCODES.HALT:
+        body = [
+            "if vm._flush:",
+            "    vm.flush_output()",
+            "raise _Pause(STOP_REASON.HALTED, ptr)",
+        ]
+    else:
+        raise ValueError("invalid opcode:", opcode)
+
+    source = "def handler(vm, mem, ptr, a, b, c):\n" + "\n".join(
+        f"    {line}" for line in body
+    )
+    namespace = {
+        "STOP_REASON": STOP_REASON,
+        "_Pause": _Pause,
+        "_CallbackError": _CallbackError,
+        "_negative": _negative,
+    }
+    exec(source, namespace)
+    return namespace["handler"]
+
+
+# superinstructions are a pair of instructions that run in a single handler. The
+# first can't be anything that might pause (I/O or halting) or move the pointer
+_FUSE_FIRST = {
+    OPCODES.ADDITION,
+    OPCODES.MULTIPLICATION,
+    OPCODES.LT,
+    OPCODES.EQ,
+    OPCODES.RELATIVE_BASE,
+}
+_FUSE_SECOND = _FUSE_FIRST | {OPCODES.TJMP, OPCODES.FJMP}
+
+
+@cache
+def _fused_handler(
+    first: int,
+    first_modes: Tuple[int, ...],
+    second: int,
+    second_modes: Tuple[int, ...],
+    reuse_result: bool,
+) -> Handler:
+    """
+    Generates a superinstruction: a handler that runs two instructions back to back, which covers common idioms like compare-then-jump, adjust-the-relative-base-then-return, and bump-a-counter-then-compare.
+
+    `a`, `b`, and `c` are the first instruction's parameters; the second's are read from memory (they can't change without this being thrown out). With `reuse_result`, the second instruction is a jump that checks the value the first just wrote, so it doesn't have to be read back.
+
+    If the first instruction writes over any decoded code, or the second one runs off the end of memory, the handler stops after the first, so the regular handlers can sort it out.
+    """
+    first_length = len(first_modes) + 1
+    length = first_length + len(second_modes) + 1
+
+    x, y = (_read(mode, param) for mode, param in zip((*first_modes, 1, 1), "ab"))
+    if first == OPCODES.RELATIVE_BASE:
+        body = [f"vm.relative_base += {x}"]
+    else:
+        body = [
+            f"v = {_RESULTS[first].format(x=x, y=y)}",
+            *_write(first_modes[2], "c", "v"),
+            f"    return ptr + {first_length}",
+        ]
+
+    d, e, f = (f"mem[ptr + {first_length + i}]" for i in range(1, 4))
+    x, y = (_read(mode, param) for mode, param in zip((*second_modes, 1, 1), (d, e)))
+    if second == OPCODES.RELATIVE_BASE:
+        second_body = [f"vm.relative_base += {x}", f"return ptr + {length}"]
+    elif second in _RESULTS:
+        second_body = [
+            *_write(second_modes[2], f, _RESULTS[second].format(x=x, y=y)),
+            f"return ptr + {length}",
+        ]
+    else:
+        test = "v" if reuse_result else x
+        check = "!=" if second == OPCODES.TJMP else "=="
+        second_body = [f"return {y} if {test} {check} 0 else ptr + {length}"]
+
+    body += [
+        "try:",
+        *(f"    {line}" for line in second_body),
+        "except IndexError:",
+        # the first instruction already happened, so it can't be run again
+        f"    return ptr + {first_length}",
+    ]
+
+    source = "def handler(vm, mem, ptr, a, b, c):\n" + "\n".join(
+        f"    {line}" for line in body
+    )
+    namespace: Dict[str, object] = {"_negative": _negative}
+    exec(source, namespace)
+    return namespace["handler"]  # type: ignore
+
+
+@cache
+def _compile_block(
+    source: str, handlers: Tuple[Tuple[int, Tuple[int, ...]], ...]
+) -> Block:
+    """
+    Compiles the source for a block, where `handler_i` is the handler for the `i`th (opcode, modes) pair in `handlers`.
+
+    Blocks only depend on their source, so computers running the same program (or the same computer after a `reset`) share them.
+    """
+    namespace: Dict[str, object] = {
+        f"handler_{i}": _handler(opcode, modes)
+        for i, (opcode, modes) in enumerate(handlers)
+    }
+    namespace["_negative"] = _negative
+    exec(source, namespace)
+    return namespace["block"]  # type: ignore
+
+
+@dataclass(frozen=True)
+class IntcodeSnapshot:
+    """
+    Everything needed to put an `IntcodeComputer` back exactly how it was (see `IntcodeComputer.snapshot`). Snapshots are immutable, so they can be restored any number of times.
+    """
+
+    memory: Tuple[int, ...]
+    pointer: int = 0
+    relative_base: int = 0
+    inputs: Tuple[int, ...] = ()
+    output: Tuple[int, ...] = ()
+    last_output: int = 0
+    idle: bool = False
+
+    def to_bytes(self) -> bytes:
+        """
+        A compact binary version of the snapshot: a fixed-size header, followed by memory, inputs, and output as little-endian signed 64-bit ints. Raises an `OverflowError` if any value doesn't fit.
+        """
+        values = array("q", self.memory + self.inputs + self.output)
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        header = _SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC,
+            self.pointer,
+            self.relative_base,
+            self.last_output,
+            self.idle,
+            len(self.memory),
+            len(self.inputs),
+            len(self.output),
+        )
+        return header + values.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "IntcodeSnapshot":
+        """
+        Reads a snapshot written by `to_bytes`. `data` can be any buffer, like an `mmap` of a saved file.
+        """
+        (
+            magic,
+            pointer,
+            relative_base,
+            last_output,
+            idle,
+            num_memory,
+            num_inputs,
+            num_output,
+        ) = _SNAPSHOT_HEADER.unpack_from(data)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError("not an Intcode snapshot")
+
+        values = array("q")
+        values.frombytes(memoryview(data)[_SNAPSHOT_HEADER.size :])
+        if sys.byteorder == "big":
+            values.byteswap()
+        if len(values) != num_memory + num_inputs + num_output:
+            raise ValueError("snapshot is the wrong size")
+
+        inputs_end = num_memory + num_inputs
+        return cls(
+            memory=tuple(values[:num_memory]),
+            pointer=pointer,
+            relative_base=relative_base,
+            inputs=tuple(values[num_memory:inputs_end]),
+            output=tuple(values[inputs_end:]),
+            last_output=last_output,
+            idle=idle,
+        )
+
+    def save(self, path: Union[str, Path]):
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IntcodeSnapshot":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+# the magic string (which includes the version), then pointer, relative base,
+# output cursor, idle, and how many values are in memory, inputs, and output
+_SNAPSHOT_MAGIC = b"INTC0001"
+_SNAPSHOT_HEADER = struct.Struct("<8sqqq?qqq")
 
 
 @dataclass
-class Instruction:
-    parameter: int
-    mode: int
+class IntcodeProfile:
+    """
+    Counts of everything a program did while running with `profile=True`, to find out where its time goes. Use `report` for a readable summary or `to_json` for the raw numbers.
+
+    A "block" is a stretch of instructions that's only ever entered at the top, so `block_entries` counts every jump by where it landed.
+    """
+
+    opcodes: Counter[int] = field(default_factory=Counter)
+    addresses: Counter[int] = field(default_factory=Counter)
+    block_entries: Counter[int] = field(default_factory=Counter)
+    taken: Counter[int] = field(default_factory=Counter)
+    not_taken: Counter[int] = field(default_factory=Counter)
+    pauses: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(self.opcodes.values())
+
+    def record(self, address: int, opcode: int, next_pointer: int):
+        """
+        Called after each instruction runs
+        """
+        self.opcodes[opcode] += 1
+        self.addresses[address] += 1
+
+        jumped = next_pointer != address + NUM_PARAMETERS[opcode] + 1
+        if jumped:
+            self.block_entries[next_pointer] += 1
+        if opcode in (OPCODES.TJMP, OPCODES.FJMP):
+            (self.taken if jumped else self.not_taken)[address] += 1
+
+    def paused(self, address: int, opcode: int, reason: STOP_REASON):
+        """
+        Called when an instruction stops the program. Outputs and halts happen before they stop it, but inputs are tried again once the program starts back up.
+        """
+        self.pauses[reason.name] += 1
+        if reason in (STOP_REASON.NUM_OUTPUT, STOP_REASON.HALTED):
+            self.record(address, opcode, address + NUM_PARAMETERS[opcode] + 1)
+
+    def as_dict(self) -> Dict[str, Union[int, Dict[str, int]]]:
+        def by_count(counter: Counter) -> Dict[str, int]:
+            return {str(k): v for k, v in counter.most_common()}
+
+        return {
+            "total": self.total,
+            "opcodes": {OPCODES(k).name: v for k, v in self.opcodes.most_common()},
+            "addresses": by_count(self.addresses),
+            "block_entries": by_count(self.block_entries),
+            "taken": by_count(self.taken),
+            "not_taken": by_count(self.not_taken),
+            "pauses": by_count(self.pauses),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def report(self, top=10) -> str:
+        """
+        The instruction mix, plus the `top` busiest addresses, blocks, and branches.
+        """
+        total = self.total or 1
+
+        lines = [f"{self.total:,} instructions"]
+        lines.append("by opcode:")
+        for opcode, count in self.opcodes.most_common():
+            lines.append(
+                f"  {OPCODES(opcode).name:<14} {count:>12,} ({count / total:.1%})"
+            )
+
+        lines.append("hottest addresses:")
+        for address, count in self.addresses.most_common(top):
+            lines.append(f"  {address:>6} {count:>12,} ({count / total:.1%})")
+
+        lines.append("hottest blocks (by times entered):")
+        for address, count in self.block_entries.most_common(top):
+            lines.append(f"  {address:>6} {count:>12,}")
+
+        lines.append("busiest branches (taken / not taken):")
+        branches = self.taken + self.not_taken
+        for address, _ in branches.most_common(top):
+            lines.append(
+                f"  {address:>6} {self.taken[address]:>12,} / {self.not_taken[address]:,}"
+            )
+
+        lines.append("pauses:")
+        for reason, count in self.pauses.most_common():
+            lines.append(f"  {reason:<17} {count:>9,}")
+
+        return "\n".join(lines)
 
 
 class IntcodeComputer:
     def __init__(
-        self, program, inputs: List[int] = None, debug=False, default_input=None
+        self,
+        program,
+        inputs: List[int] = None,
+        debug=False,
+        default_input=None,
+        input_provider: Optional[Callable[[], int]] = None,
+        jit=False,
+        output_sink: Optional[OutputSink] = None,
+        max_output: Optional[int] = None,
+        profile=False,
     ):
-        self.program = defaultdict(int)
-        # used to be a list, now it's default dict so I can read from anywhere
-        for index, i in enumerate(program):
-            self.program[index] = i
-        self.output = []
+        # reading or writing past the end grows this as needed (see `run`), so it
+        # acts like it's infinitely long and full of 0s
+        self.program: List[int] = list(program)
+        # with `max_output`, only the most recent outputs are kept (so long-running
+        # programs don't grow it forever), but it can't be sliced
+        self.output: Union[List[int], Deque[int]] = (
+            deque(maxlen=max_output) if max_output else []
+        )
+        self.output_sink = output_sink
         self.pointer = 0
         self.relative_base = 0
 
-        self.num_queued_inputs = 0
-        self.inputs = iter([])
+        self.inputs: Deque[int] = deque()
 
         self.add_input(inputs or [])
+        # called for the next input whenever the queue is empty, so inputs can be
+        # generated on the fly instead of queued up ahead of time
+        self.input_provider = input_provider
         # the default value when there's no input and we try to read
         self.default_input = default_input
 
         self.last_output = 0
 
         self.debug = debug
+        # with `profile`, everything the program does gets counted (see `IntcodeProfile`).
+        # it's much slower than normal (and skips the `jit`), so it's only for investigating
+        self.profile = IntcodeProfile() if profile else None
 
         self.idle = False
 
-    def copy(self):
-        res = IntcodeComputer([])
-        res.program = self.program.copy()
-        res.inputs = iter([*list(self.inputs)])
-        res.output = self.output.copy()
+        # decoded instructions, by the address they start at
+        self._decoded: Dict[int, DecodedInstruction] = {}
+        # every address that's part of a decoded instruction or compiled block
+        self._code: Set[int] = set()
+        # for addresses in the second half of a superinstruction (see `_decode`),
+        # where they start. Those can start too far back for `_forget` to find otherwise
+        self._fused_starts: Dict[int, Tuple[int, ...]] = {}
+
+        # with `jit`, straight-line runs of instructions get compiled into python
+        # functions (see `_compile`), by the address they start at
+        self.jit = jit
+        self._blocks: Dict[int, Block] = {}
+        # for each address, the starts of the blocks that include it
+        self._block_starts: Dict[int, Tuple[int, ...]] = {}
+        # code that was written over after it was decoded or compiled. Lots of
+        # programs patch their own parameters to index into arrays, so these get
+        # read from memory each time instead of baked into blocks (or superinstructions)
+        self._volatile: Set[int] = set()
+
+        # set by `run` for the handlers to check
+        self._inputs_left = -1
+        self._outputs_left = -1
+        self._flush = False
+        self._wait_for_input = False
+
+    def fork(self) -> "IntcodeComputer":
+        """
+        An independent copy of this computer, with all of its state (memory, pointers, queued inputs, output, settings, and anything it's decoded or compiled so far).
+
+        Like `snapshot`, this copies all of memory (plus the decode caches) rather than sharing pages, so it's O(memory + decoded code).
+        """
+        res = IntcodeComputer(
+            self.program,
+            debug=self.debug,
+            default_input=self.default_input,
+            input_provider=self.input_provider,
+            jit=self.jit,
+            output_sink=self.output_sink,
+            max_output=self.max_output,
+            profile=self.profile is not None,
+        )
         res.pointer = self.pointer
         res.relative_base = self.relative_base
-        res.debug = self.debug
-
-        # missing some copy properties that weren't relevant at the time
+        res.inputs.extend(self.inputs)
+        res.output.extend(self.output)
+        res.last_output = self.last_output
+        res.idle = self.idle
 
+        res._decoded = self._decoded.copy()
+        res._code = self._code.copy()
+        res._fused_starts = self._fused_starts.copy()
+        res._blocks = self._blocks.copy()
+        res._block_starts = self._block_starts.copy()
+        res._volatile = self._volatile.copy()
         return res
 
+    @classmethod
+    def from_snapshot(cls, snapshot: "IntcodeSnapshot", **kwargs) -> "IntcodeComputer":
+        """
+        A new computer that picks up where `snapshot` left off. `kwargs` are passed to the constructor.
+        """
+        computer = cls(snapshot.memory, **kwargs)
+        computer.restore(snapshot)
+        return computer
+
+    def snapshot(self) -> "IntcodeSnapshot":
+        """
+        Saves everything about the running program, so it can be picked back up later with `restore`.
+
+        Memory is a flat list (not copy-on-write pages), so this copies all of it. That's a single C-level copy, which takes microseconds for Intcode-sized programs, but it's O(memory), not O(1).
+        """
+        return IntcodeSnapshot(
+            memory=tuple(self.program),
+            pointer=self.pointer,
+            relative_base=self.relative_base,
+            inputs=tuple(self.inputs),
+            output=tuple(self.output),
+            last_output=self.last_output,
+            idle=self.idle,
+        )
+
+    def restore(self, snapshot: "IntcodeSnapshot"):
+        """
+        Go back to a `snapshot`. Anything decoded from memory that's the same in the snapshot is kept, so restoring the same snapshot over and over (to try different inputs from the same spot) doesn't have to decode or compile anything again.
+
+        This costs O(memory + decoded code): memory is copied back in place, and every decoded address is checked against the snapshot.
+        """
+        self._load_memory(snapshot.memory)
+        self.pointer = snapshot.pointer
+        self.relative_base = snapshot.relative_base
+        self.inputs.clear()
+        self.inputs.extend(snapshot.inputs)
+        self.output.clear()
+        self.output.extend(snapshot.output)
+        self.last_output = snapshot.last_output
+        self.idle = snapshot.idle
+
+    def _load_memory(self, values: Sequence[int]):
+        """
+        Replaces memory (in place), throwing out any decoded instructions or compiled blocks that don't match the new values.
+        """
+        memory = self.program
+        for address in [
+            a for a in self._code if a >= len(values) or memory[a] != values[a]
+        ]:
+            self._forget(address)
+
+        memory[:] = values
+
+    def reset(self, program: List[int]):
+        """
+        Load a new program and start over, reusing the existing memory. Much cheaper than making a whole new computer when running the same program many times.
+
+        Decoded instructions (and compiled blocks) are kept, unless the new program has something different at any of their addresses.
+        """
+        self.restore(IntcodeSnapshot(tuple(program)))
+
+    def _grow(self):
+        """
+        Doubles the size of memory (in place, so existing references to it stay valid).
+        """
+        self.program.extend([0] * max(len(self.program), 64))
+
+    @property
+    def output_sink(self) -> Optional[OutputSink]:
+        """
+        If set, every output is passed here (as it happens) instead of being added to `output`.
+        """
+        return self._output_sink
+
+    @output_sink.setter
+    def output_sink(self, sink: Optional[OutputSink]):
+        self._output_sink = sink
+        # what the OUTPUT handler actually calls
+        self._emit: OutputSink = sink or self.output.append
+
+    @property
+    def max_output(self) -> Optional[int]:
+        return self.output.maxlen if isinstance(self.output, deque) else None
+
+    @property
+    def num_queued_inputs(self) -> int:
+        return len(self.inputs)
+
     def get_input(self):
-        if self.num_queued_inputs == 0:
-            if self.default_input is None:
-                input_ = None
-                try:
-                    input_ = input("--> ")
-                    return int(input_)
-                except ValueError:
-                    # got ascii string input
-                    if input_ == "SELF_DUMP":
-                        print(self.pointer, self.relative_base)
-                    self.add_input([ord(c) for c in f"{input_}\n"])
-                    return self.get_input()
-            else:
-                self.idle = True
-                return self.default_input
+        if self.inputs:
+            self.idle = False
+            return self.inputs.popleft()
 
-        self.num_queued_inputs -= 1
-        self.idle = False
-        return next(self.inputs)
+        if self.input_provider:
+            self.idle = False
+            return self.input_provider()
+
+        if self.default_input is None:
+            input_ = None
+            try:
+                input_ = input("--> ")
+                return int(input_)
+            except ValueError:
+                # got ascii string input
+                if input_ == "SELF_DUMP":
+                    print(self.pointer, self.relative_base)
+                self.add_input(input_)
+                return self.get_input()
+
+        self.idle = True
+        return self.default_input
+
+    def _would_wait(self) -> bool:
+        """
+        Whether reading right now would wait for someone else to send input. That's true if nothing is queued up and either there's nothing to fall back on or the fallback (`default_input`) was already the last thing read.
+        """
+        return (
+            not self.inputs
+            and self.input_provider is None
+            and (self.idle or self.default_input is None)
+        )
 
     def add_input(self, val: Union[int, List[int], Tuple[int, ...], str]):
+        """
+        Queue up an int, a list/tuple of ints, or a line of ascii (which gets a trailing newline).
+        """
         self.idle = False
-        if isinstance(val, (list, tuple)):
-            for i in val:
-                self.add_input(i)
-        elif isinstance(val, int):
-            self.num_queued_inputs += 1
-            # adds whatever we had before, no data lost
-            self.inputs = iter([*list(self.inputs), val])
+        if isinstance(val, int):
+            self.inputs.append(val)
         elif isinstance(val, str):
-            self.add_input([ord(c) for c in f"{val}\n"])
+            self.inputs.extend(map(ord, f"{val}\n"))
+        elif isinstance(val, (list, tuple)):
+            self.inputs.extend(val)
         else:
             raise TypeError("Provide an int, an array of int, or a tuple of int")
 
-    def num_parameters(self, opcode: int):
-        if opcode == OPCODES.HALT:
-            return 0
-        if opcode in [OPCODES.ADDITION, OPCODES.MULTIPLICATION, OPCODES.LT, OPCODES.EQ]:
-            return 3
-        if opcode in [OPCODES.TJMP, OPCODES.FJMP]:
-            return 2
-        if opcode in [OPCODES.INPUT, OPCODES.OUTPUT, OPCODES.RELATIVE_BASE]:
-            return 1
-        raise ValueError("invalid opcode:", opcode)
-
     def parse_opcode(self, opcode: int) -> Tuple[int, int, int, int]:
         """
         Parse the 5-digit code
         Returns (opcode, mode, mode, mode)
         """
-        padded = str(opcode).zfill(5)
-        return (int(padded[3:]), int(padded[2]), int(padded[1]), int(padded[0]))
-
-    def slice_program(self, slice_range: range):
-        return [self.program[x] for x in slice_range]
-
-    def get_value(self, instruction: Instruction) -> int:
-        """
-        Dereferences an index based on mode
-        """
-        if instruction.mode == 0:  # position
-            return self.program[instruction.parameter]
-        if instruction.mode == 1:  # immediate
-            return instruction.parameter
-        if instruction.mode == 2:  # relative
-            return self.program[self.relative_base + instruction.parameter]
-        raise ValueError("invalid mode:", instruction)
-
-    def get_write_value(self, instruction: Instruction) -> int:
-        """
-        Like `get_value`, but accounts for write instructions never uing immediate mode
-        """
-        if instruction.mode == 2:  # relative
-            return instruction.parameter + self.relative_base
-        # default is position
-        return instruction.parameter
-
-    def execute_opcode(
-        self, opcode: int, params: List[Instruction], flush=None
-    ) -> Optional[bool]:
-        """
-        returns a boolean communicating whether the pointer should be incremented
-        (not all instructions increment the pointer)
-        flush prints all new output before each input
-        """
-        # we validate elsewhere, so we know we're good if we're here
-
-        if self.debug:
-            print("executing", opcode, params)
-
-        if opcode == OPCODES.ADDITION:
-            self.program[self.get_write_value(params[2])] = self.get_value(
-                params[0]
-            ) + self.get_value(params[1])
-        elif opcode == OPCODES.MULTIPLICATION:
-            self.program[self.get_write_value(params[2])] = self.get_value(
-                params[0]
-            ) * self.get_value(params[1])
-        elif opcode == OPCODES.INPUT:
-            if flush:
-                self.flush_output()
-            self.program[self.get_write_value(params[0])] = self.get_input()
-        elif opcode == OPCODES.OUTPUT:
-            self.output.append(self.get_value(params[0]))
-        elif opcode == OPCODES.TJMP:
-            if self.get_value(params[0]) != 0:
-                self.pointer = self.get_value(params[1])
-                return False
-        elif opcode == OPCODES.FJMP:
-            if self.get_value(params[0]) == 0:
-                self.pointer = self.get_value(params[1])
-                return False
-        elif opcode == OPCODES.LT:
-            res = 1 if self.get_value(params[0]) < self.get_value(params[1]) else 0
-            self.program[self.get_write_value(params[2])] = res
-        elif opcode == OPCODES.EQ:
-            res = 1 if self.get_value(params[0]) == self.get_value(params[1]) else 0
-            self.program[self.get_write_value(params[2])] = res
-        elif opcode == OPCODES.RELATIVE_BASE:
-            self.relative_base += self.get_value(params[0])
-
-        return True  # increment pointer
-
-    def run(self, num_outputs=None, num_inputs=None, flush=False) -> STOP_REASON:
+        modes, opcode = divmod(opcode, 100)
+        return (opcode, modes % 10, modes // 10 % 10, modes // 100)
+
+    def _parse_instruction(
+        self, pointer: int
+    ) -> Tuple[int, Tuple[int, ...], int, int, int]:
+        """
+        Returns the opcode at `pointer`, the modes of its parameters, and its (raw) parameters. Missing parameters are 0.
+        """
+        if pointer < 0:
+            raise ValueError("negative address:", pointer)
+        [opcode, *modes] = self.parse_opcode(self.program[pointer])
+        num_params = NUM_PARAMETERS[OPCODES(opcode)]  # throws for invalid opcodes
+
+        params = [self.program[pointer + i] for i in range(1, num_params + 1)]
+        a, b, c = params + [0] * (3 - num_params)
+        return opcode, tuple(modes[:num_params]), a, b, c
+
+    def _decode(self, pointer: int) -> DecodedInstruction:
+        """
+        Parses the instruction at `pointer` into its handler and parameters, which get cached until something writes over them.
+
+        If it's the start of a common pair of instructions (see `_fused_handler`), both are decoded together. That's skipped for code that's been written over before (which is likely to change again), and when debugging or profiling, which want to see every instruction.
+        """
+        opcode, modes, a, b, c = self._parse_instruction(pointer)
+        # the handler trusts position mode parameters, so they're checked here instead
+        for mode, param in zip(modes, (a, b, c)):
+            if mode == 0 and param < 0:
+                raise ValueError("negative address:", param)
+
+        handler = _handler(opcode, modes)
+        length = len(modes) + 1
+
+        if (
+            opcode in _FUSE_FIRST
+            and not self.debug
+            and self.profile is None
+            and self._volatile.isdisjoint(range(pointer, pointer + length))
+        ):
+            try:
+                second, second_modes, *second_params = self._parse_instruction(
+                    pointer + length
+                )
+            except (ValueError, IndexError):
+                second, second_modes, second_params = None, (), [0]
+            d = second_params[0]
+
+            end = pointer + length + len(second_modes) + 1
+            if (
+                second in _FUSE_SECOND
+                and self._volatile.isdisjoint(range(pointer + length, end))
+                # leave bad addresses for when (if) the second instruction is decoded
+                and all(
+                    mode != 0 or param >= 0
+                    for mode, param in zip(second_modes, second_params)
+                )
+            ):
+                # a jump that checks the (position or relative) address that was just written
+                reuse_result = (
+                    opcode != OPCODES.RELATIVE_BASE
+                    and second in (OPCODES.TJMP, OPCODES.FJMP)
+                    and second_modes[0] == modes[2] != 1
+                    and d == c
+                )
+                handler = _fused_handler(
+                    opcode, modes, second, second_modes, reuse_result
+                )
+                for address in range(pointer + length, end):
+                    self._fused_starts[address] = (
+                        *self._fused_starts.get(address, ()),
+                        pointer,
+                    )
+                length = end - pointer
+
+        instruction = (handler, a, b, c)
+        self._decoded[pointer] = instruction
+        self._code.update(range(pointer, pointer + length))
+        return instruction
+
+    def _compile(self, start: int) -> Block:
+        """
+        Compiles the instructions from `start` up to (and including) the next one that jumps, halts, or does I/O into a single python function. Parameter modes are baked in and `mem[...]` reads of constant addresses are written out directly, so running the block is just the arithmetic. The relative base lives in a local variable until the block ends.
+
+        I/O and halting are handed off to the regular handlers (so input/output limits still work), and jumps return their destination.
+
+        If a block writes over any compiled code (including itself), it's invalidated and the block returns right away, so self-modifying programs behave. Parameters that have been overwritten before are read from memory instead, so patching them doesn't need a recompile.
+        """
+        lines: List[str] = []
+        handlers: List[Tuple[int, Tuple[int, ...]]] = []
+        # every address whose value is baked into the block
+        fixed: List[int] = []
+        pointer = start
+
+        def param(address: int, value: int, mode: int) -> str:
+            if address in self._volatile:
+                source = f"mem[{address}]"
+                # a position could be patched to anything, so check it as it's used
+                return _checked(source) if mode == 0 else source
+            fixed.append(address)
+            # a bad address only fails if the instruction actually runs
+            return _checked(str(value)) if mode == 0 and value < 0 else str(value)
+
+        while True:
+            try:
+                opcode, modes, *params = self._parse_instruction(pointer)
+                a, b, c = (
+                    param(pointer + i, value, modes[i - 1])
+                    if i <= len(modes)
+                    else str(value)
+                    for i, value in enumerate(params, start=1)
+                )
+                x, y = (_read(mode, p, "rb") for mode, p in zip((*modes, 1, 1), (a, b)))
+            except ValueError:
+                if pointer == start:
+                    raise
+                # invalid instructions might never run, so only complain if they do
+                lines += ["vm.relative_base = rb", f"return {pointer}"]
+                break
+
+            fixed.append(pointer)
+            next_pointer = pointer + len(modes) + 1
+            # which instruction we're on, in case it needs to be retried
+            lines.append(f"p = {pointer}")
+
+            if opcode == OPCODES.RELATIVE_BASE:
+                lines.append(f"rb += {x}")
+            elif opcode in _RESULTS:
+                lines += [
+                    f"dst = {_checked(f'rb + {c}') if modes[2] == 2 else c}",
+                    f"mem[dst] = {_RESULTS[opcode].format(x=x, y=y)}",
+                    "if dst in code:",
+                    "    vm._invalidate(dst)",
+                    "    vm.relative_base = rb",
+                    f"    return {next_pointer}",
+                ]
+            else:
+                lines.append("vm.relative_base = rb")
+                if opcode == OPCODES.TJMP:
+                    lines.append(f"return {y} if {x} != 0 else {next_pointer}")
+                elif opcode == OPCODES.FJMP:
+                    lines.append(f"return {y} if {x} == 0 else {next_pointer}")
+                else:
+                    lines.append(
+                        f"return handler_{len(handlers)}(vm, mem, {pointer}, {a}, {b}, {c})"
+                    )
+                    handlers.append((opcode, modes))
+                pointer = next_pointer
+                break
+
+            pointer = next_pointer
+            if pointer - start >= MAX_BLOCK_LENGTH:
+                lines += ["vm.relative_base = rb", f"return {pointer}"]
+                break
+
+        source = "\n".join(
+            [
+                "def block(vm, mem):",
+                "    code = vm._code",
+                "    rb = vm.relative_base",
+                "    try:",
+                *(f"        {line}" for line in lines),
+                "    except IndexError:",
+                # a read or write went past the end of memory. nothing in the
+                # current instruction has happened yet, so make room and pick up there
+                "        vm.relative_base = rb",
+                "        vm._grow()",
+                "        return p",
+            ]
+        )
+        block = _compile_block(source, tuple(handlers))
+
+        self._blocks[start] = block
+        for address in fixed:
+            self._code.add(address)
+            self._block_starts[address] = (*self._block_starts.get(address, ()), start)
+        return block
+
+    def _forget(self, address: int):
+        """
+        Throws out every decoded instruction or compiled block that could include `address`.
+        """
+        for pointer in range(address - MAX_INSTRUCTION_LENGTH + 1, address + 1):
+            self._decoded.pop(pointer, None)
+
+        # nothing that was decoded from this address is left, so later writes to it
+        # don't need to come through here (until it's decoded again)
+        self._code.discard(address)
+
+        for start in self._fused_starts.pop(address, ()):
+            self._decoded.pop(start, None)
+
+        for start in self._block_starts.pop(address, ()):
+            self._blocks.pop(start, None)
+
+    def _invalidate(self, address: int):
+        """
+        Called when the program writes to `address`, which was part of a decoded instruction. Any instruction that could contain it has to be decoded again.
+        """
+        self._forget(address)
+        self._volatile.add(address)
+
+    def run(
+        self, num_outputs=None, num_inputs=None, flush=False, wait_for_input=False
+    ) -> STOP_REASON:
         """
         * num_output pauses execution after a certain number of outputs has been generated
         * num_inputs pauses after a certain number of input instructions has happened
             helpful for syncinc up many vms
+        * wait_for_input pauses (before reading) when there's no input to read. If there's a `default_input`, it's read once first, so the program gets a chance to notice it's idle
         """
-        limit_outputs = bool(num_outputs)
-        original_num_outputs = len(self.output)  # track how many we've gotten
+        # counting down from -1 never hits 0, so there's no limit
+        self._outputs_left = num_outputs or -1
+        self._inputs_left = num_inputs or -1
+        self._flush = flush
+        self._wait_for_input = wait_for_input
 
-        limit_inputs = bool(num_inputs)
-        inputs_count = 0
+        memory = self.program
+        decoded = self._decoded
+        pointer = self.pointer
 
         while True:
-            [opcode, *modes] = self.parse_opcode(self.program[self.pointer])
-            OPCODES(opcode)  # throws for invalid opcodes
-            if opcode == OPCODES.HALT:
-                if flush:
-                    self.flush_output()
-                return STOP_REASON.HALTED
-
-            num_params = self.num_parameters(opcode)
-
-            params = [
-                Instruction(param, modes[index])
-                for index, param in enumerate(
-                    self.slice_program(
-                        range(self.pointer + 1, self.pointer + 1 + num_params)
-                    )
-                )
-            ]
+            try:
+                if (profile := self.profile) is not None:
+                    # same as below, but counting everything that happens
+                    while True:
+                        if (instruction := decoded.get(pointer)) is None:
+                            instruction = self._decode(pointer)
 
-            if self.debug:
-                print(self)
+                        handler, a, b, c = instruction
+                        opcode = memory[pointer] % 100
+                        try:
+                            next_pointer = handler(self, memory, pointer, a, b, c)
+                        except _Pause as pause:
+                            profile.paused(pointer, opcode, pause.reason)
+                            raise
+                        profile.record(pointer, opcode, next_pointer)
+                        pointer = next_pointer
 
-            if opcode == OPCODES.INPUT and limit_inputs:
-                if inputs_count == num_inputs:
-                    return STOP_REASON.NUM_INPUT
-                inputs_count += 1
+                if self.jit and not self.debug:
+                    blocks = self._blocks
+                    while True:
+                        if (block := blocks.get(pointer)) is None:
+                            block = self._compile(pointer)
+                        pointer = block(self, memory)
 
-            should_increment_pointer = self.execute_opcode(opcode, params, flush=flush)
+                while True:
+                    if (instruction := decoded.get(pointer)) is None:
+                        instruction = self._decode(pointer)
 
-            if should_increment_pointer:
-                self.pointer += num_params + 1
+                    if self.debug:
+                        self.pointer = pointer
+                        print(self)
 
-            if limit_outputs and len(self.output) - original_num_outputs == num_outputs:
-                return STOP_REASON.NUM_OUTPUT  # not yet halted
+                    handler, a, b, c = instruction
+                    pointer = handler(self, memory, pointer, a, b, c)
+            except _Pause as pause:  # noqa: PERF203
+                self.pointer = pause.pointer
+                return pause.reason
+            except _CallbackError as error:
+                # an input or output callback failed, which has nothing to do with
+                # memory, so pass along exactly what it raised
+                raise error.__cause__ from None
+            except IndexError:
+                # something read or wrote past the end of memory (callbacks can't
+                # get here, see above). Handlers don't change anything until every
+                # read has succeeded (and writes are last), so it's safe to make
+                # room and run the same instruction again
+                self._grow()
 
     def last_output_str(self):
         return "".join([chr(x) for x in self.output[self.last_output :]])
@@ -256,8 +1019,242 @@ class IntcodeComputer:
         return self.output[-1]
 
     def __str__(self):
-        max_index = max(self.program)  # so empty items in the middle are accounted for
-        return f"=======\nprogram: {[self.program[x] for x in range(max_index + 1)]}\npointer: {self.pointer}\nrelative_base: {self.relative_base}\noutput: {self.output}\n"
+        return f"=======\nprogram: {self.program}\npointer: {self.pointer}\nrelative_base: {self.relative_base}\noutput: {self.output}\n"
+
+
+class IntcodeFunction:
+    """
+    Treats a program that reads some inputs, runs until it halts, and outputs its answer like a regular function. Calling it (`f(*args) -> outputs`) restores a single computer to a pristine copy of the program instead of building a new one, so anything decoded or compiled on earlier calls is reused.
+
+    The first `len(memory_args)` args are written straight into memory at those addresses (like day 2's noun and verb). Any others are queued as input. The result is every output, or the values at the `returns` addresses if that's set.
+
+    For big batches of calls, `map` and `imap` spread them over a process pool.
+    """
+
+    def __init__(
+        self,
+        program: Sequence[int],
+        memory_args: Sequence[int] = (),
+        returns: Optional[Sequence[int]] = None,
+        jit=True,
+    ):
+        self.program = tuple(program)
+        self.memory_args = tuple(memory_args)
+        self.returns = None if returns is None else tuple(returns)
+        self.jit = jit
+
+        self._pristine = IntcodeSnapshot(self.program)
+        self._computer = IntcodeComputer(self.program, jit=jit)
+
+    def __call__(self, *args: int) -> Tuple[int, ...]:
+        computer = self._computer
+        computer.restore(self._pristine)
+
+        memory = computer.program
+        for address, value in zip(self.memory_args, args):
+            memory[address] = value
+            # anything decoded on an earlier call has that call's args baked in. This
+            # also marks the address volatile, so jit blocks read it from memory
+            # instead of being recompiled every call
+            if address in computer._code:
+                computer._invalidate(address)
+        computer.add_input(list(args[len(self.memory_args) :]))
+
+        computer.run()
+
+        if self.returns is None:
+            return tuple(computer.output)
+        return tuple(memory[address] for address in self.returns)
+
+    def __getstate__(self):
+        # generated code can't be pickled, so workers build their own computer
+        return self.program, self.memory_args, self.returns, self.jit
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def imap(
+        self,
+        batch: Iterable[Sequence[int]],
+        processes: Optional[int] = None,
+        chunksize=256,
+    ) -> Iterator[Tuple[int, ...]]:
+        """
+        Lazily calls the function with each set of args in `batch`, in a process pool. Results come back in order. Each worker process gets its own copy of the function, so its caches stay warm across calls.
+
+        Stopping early (say, once the answer turns up) shuts the pool down.
+        """
+        with Pool(processes, _start_worker, (self,)) as pool:
+            yield from pool.imap(_call_in_worker, batch, chunksize)
+
+    def map(
+        self,
+        batch: Iterable[Sequence[int]],
+        processes: Optional[int] = None,
+        chunksize=256,
+    ) -> List[Tuple[int, ...]]:
+        """
+        Like `imap`, but waits for every result.
+        """
+        return list(self.imap(batch, processes, chunksize))
+
+
+# the function each worker process runs calls on (see `IntcodeFunction.imap`)
+_worker_function: Optional[IntcodeFunction] = None
+
+
+def _start_worker(function: IntcodeFunction):
+    global _worker_function  # noqa: PLW0603
+    _worker_function = function
+
+
+def _call_in_worker(args: Sequence[int]) -> Tuple[int, ...]:
+    assert _worker_function, "worker wasn't started"
+    return _worker_function(*args)
+
+
+Packet = Tuple[int, ...]
+# decides where a packet goes, given the network, the address of the computer that sent it, and the packet itself
+Router = Callable[["IntcodeNetwork", int, Packet], None]
+
+
+def route_by_address(network: "IntcodeNetwork", _source: int, packet: Packet):
+    """
+    The first value of each packet is the address to deliver the rest of it to.
+    """
+    network.send(packet[0], packet[1:])
+
+
+def pipeline(network: "IntcodeNetwork", source: int, packet: Packet):
+    """
+    Each computer sends everything to the next one, and the last one loops back around to the first.
+    """
+    network.send((source + 1) % len(network.computers), packet)
+
+
+class IntcodeNetwork:
+    """
+    Runs a group of computers that talk to each other. Every `packet_size` outputs from a computer make a packet, which is handed to `router` as soon as it's complete (to deliver with `send`). The network takes over each computer's `output_sink` to do this.
+
+    Computers only run when there's something for them to do. Once one is waiting for input (see `IntcodeComputer.run`), it's set aside until a packet is sent to it, so the network is idle exactly when no computers are ready to run.
+    """
+
+    def __init__(
+        self, computers: List[IntcodeComputer], router: Router, packet_size: int = 1
+    ):
+        self.computers = computers
+        self.router = router
+        self.packet_size = packet_size
+
+        # addresses of computers that have something to do, in the order they'll run.
+        # everyone starts out here, since they haven't had a chance to read anything
+        self._ready: Deque[int] = deque(range(len(computers)))
+        self._is_ready = [True] * len(computers)
+        self.halted: Set[int] = set()
+        self.last_packet: Dict[int, Packet] = {}
+
+        for address, computer in enumerate(computers):
+            computer.output_sink = tuple_sink(
+                packet_size, partial(self._route, address)
+            )
+
+        self._stopped = False
+
+    @property
+    def is_idle(self) -> bool:
+        return not self._ready
+
+    def send(self, address: int, values: Sequence[int]):
+        """
+        Queue up input for a computer and wake it up, if needed.
+        """
+        self.computers[address].add_input(list(values))
+        self._wake(address)
+
+    def _wake(self, address: int):
+        if not self._is_ready[address] and address not in self.halted:
+            self._is_ready[address] = True
+            self._ready.append(address)
+
+    def _route(self, source: int, *packet: int):
+        self.last_packet[source] = packet
+        self.router(self, source, packet)
+
+    def stop(self):
+        """
+        Makes `run` return after the current packet. Useful for routers that find what they're looking for.
+        """
+        self._stopped = True
+
+    def run(self):
+        """
+        Runs computers (one packet at a time each, so they take turns) until the network is idle, every computer has halted, or the router calls `stop`.
+        """
+        self._stopped = False
+        while self._ready and not self._stopped:
+            address = self._ready.popleft()
+            self._is_ready[address] = False
+            computer = self.computers[address]
+
+            reason = computer.run(num_outputs=self.packet_size, wait_for_input=True)
+
+            if reason == STOP_REASON.HALTED:
+                self.halted.add(address)
+            elif reason == STOP_REASON.NUM_OUTPUT:
+                # it just sent a packet (which has already been routed) and isn't
+                # waiting on anything, so it goes to the back of the line
+                self._wake(address)
+
+
+class AsyncIntcodeComputer:
+    """
+    Runs a program as an asyncio task, reading input from one `asyncio.Queue` and putting output on another. Computers can share queues, so any pipeline or network can be wired together and run concurrently with `asyncio.gather`:
+
+    ```
+    a = AsyncIntcodeComputer(program)
+    b = AsyncIntcodeComputer(program, inputs=a.outputs)
+    await a.inputs.put(0)
+    await asyncio.gather(a.run(), b.run())
+    ```
+
+    It runs as far as it can between awaits (until it needs input that isn't there yet, or it's output `batch_size` values), so the event loop only gets involved when computers actually have to wait on each other. Output queues should be unbounded, since outputs are added without waiting.
+    """
+
+    def __init__(
+        self,
+        program: Sequence[int],
+        inputs: Optional["asyncio.Queue[int]"] = None,
+        outputs: Optional["asyncio.Queue[int]"] = None,
+        batch_size=1024,
+        jit=True,
+    ):
+        self.inputs: asyncio.Queue[int] = asyncio.Queue() if inputs is None else inputs
+        self.outputs: asyncio.Queue[int] = (
+            asyncio.Queue() if outputs is None else outputs
+        )
+        self.batch_size = batch_size
+        self.computer = IntcodeComputer(
+            program, jit=jit, output_sink=self.outputs.put_nowait
+        )
+
+    async def run(self) -> IntcodeComputer:
+        """
+        Runs until the program halts and returns the underlying computer, for inspecting its memory.
+        """
+        computer = self.computer
+        while True:
+            reason = computer.run(num_outputs=self.batch_size, wait_for_input=True)
+            if reason == STOP_REASON.HALTED:
+                return computer
+
+            if reason == STOP_REASON.WAITING_FOR_INPUT:
+                computer.add_input(await self.inputs.get())
+                # take everything else that's ready, so there's no need to come back here right away
+                while not self.inputs.empty():
+                    computer.add_input(self.inputs.get_nowait())
+            else:
+                # it's been outputting for a while; let everyone else catch up
+                await asyncio.sleep(0)
 
 
 class IntcodeSolution(BaseSolution):
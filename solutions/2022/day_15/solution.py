@@ -1,12 +1,12 @@
 # prompt: https://adventofcode.com/2022/day/15
 
-from dataclasses import InitVar, dataclass
-from operator import itemgetter
+from dataclasses import dataclass
 from re import findall
 from typing import Iterable, cast
 
 from ...base import StrSplitSolution, answer, slow
 from ...utils.graphs import GridPoint
+from ...utils.intervals import IntervalSet
 
 TUNING_MULTIPLIER = 4_000_000
 
@@ -15,10 +15,10 @@ TUNING_MULTIPLIER = 4_000_000
 class Sensor:
     x: int
     y: int
-    beacon: InitVar[GridPoint]
+    beacon: GridPoint
 
-    def __post_init__(self, beacon):
-        self.reach = self.distance_to(beacon)
+    def __post_init__(self):
+        self.reach = self.distance_to(self.beacon)
 
     def distance_to(self, point: GridPoint) -> int:
         return abs(self.x - point[0]) + abs(self.y - point[1])
@@ -32,10 +32,11 @@ class Sensor:
 
         num_on_row = self.reach - abs(self.y - target_row)
 
-        res = range(self.x - num_on_row, self.x + num_on_row)
+        # both ends are covered, so `stop` is one past the right edge
+        res = range(self.x - num_on_row, self.x + num_on_row + 1)
 
         if clamp_at:
-            return range(max(res.start, 0), min(res.stop, clamp_at))
+            return range(max(res.start, 0), min(res.stop, clamp_at + 1))
         return res
 
     def enlarged_border_points(self, clamp_at: int) -> Iterable[GridPoint]:
@@ -97,19 +98,18 @@ class Solution(StrSplitSolution):
     def get_ranges(
         self, sensors: list[Sensor], target_row: int, clamp_at: int = 0
     ) -> list[range]:
-        return sorted(
-            (r for s in sensors if (r := s.range_on_row(target_row, clamp_at))),
-            key=itemgetter(0),
-        )
+        return [r for s in sensors if (r := s.range_on_row(target_row, clamp_at))]
 
     @answer(5335787)
     def part_1(self) -> int:
         sensors = self.parse_sensors()
         target_row = 10 if self.use_test_data else 2000000
 
-        ranges = self.get_ranges(sensors, target_row)
+        covered = IntervalSet(self.get_ranges(sensors, target_row))
+        # a spot with a beacon in it is one where a beacon _can_ be
+        beacons_on_row = {s.beacon[0] for s in sensors if s.beacon[1] == target_row}
 
-        return ranges[-1].stop - ranges[0].start
+        return len(covered) - sum(x in covered for x in beacons_on_row)
 
     @slow
     @answer(13673971349056)
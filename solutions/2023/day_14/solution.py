@@ -1,76 +1,27 @@
 # prompt: https://adventofcode.com/2023/day/14
 
-from typing import Callable, cast
-
-from solutions.utils.graphs import GridPoint, parse_grid
+from solutions.utils.bitgrid import BitGrid
+from solutions.utils.cycles import fast_forward
+from solutions.utils.graphs import Direction, scan_grid
 
 from ...base import StrSplitSolution, answer
 
-Points = set[GridPoint]
-RangeGen = Callable[[int], range]
-
-
-def _roll(
-    rocks: Points,
-    walls: Points,
-    reverse_sort: bool,
-    range_builder: RangeGen,
-    index_to_replace: int,
-):
-    for rock in sorted(rocks, reverse=reverse_sort):
-        new_rock = None
-
-        for potential_new_value in range_builder(rock[index_to_replace]):
-            _new_rock = list(rock)
-            _new_rock[index_to_replace] = potential_new_value
-            potential_new_rock = tuple(_new_rock)
-
-            if potential_new_rock in walls or potential_new_rock in rocks:
-                break
-            new_rock = potential_new_rock
-
-        if new_rock is not None:
-            rocks.remove(rock)
-            rocks.add(cast(GridPoint, new_rock))
-
-
-def roll_up(rocks: Points, walls: Points) -> None:
-    _roll(
-        rocks,
-        walls,
-        reverse_sort=False,
-        range_builder=lambda row: range(row - 1, -1, -1),
-        index_to_replace=0,
-    )
-
+SPIN_CYCLE = (Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT)
 
-def roll_down(rocks: Points, walls: Points, grid_size: int) -> None:
-    _roll(
-        rocks,
-        walls,
-        reverse_sort=True,
-        range_builder=lambda row: range(row + 1, grid_size),
-        index_to_replace=0,
-    )
 
+def roll(rocks: BitGrid, walls: BitGrid, facing: Direction) -> BitGrid:
+    """
+    every rock with an open space in front of it moves at once; repeat until nothing can move
+    """
+    d_row, d_col = Direction.offset(facing)
+    while moved := rocks.shift_by(d_row, d_col) - rocks - walls:
+        rocks = rocks - moved.shift_by(-d_row, -d_col) | moved
+    return rocks
 
-def roll_left(rocks: Points, walls: Points) -> None:
-    _roll(
-        rocks,
-        walls,
-        reverse_sort=False,
-        range_builder=lambda col: range(col - 1, -1, -1),
-        index_to_replace=1,
-    )
 
-
-def roll_right(rocks: Points, walls: Points, grid_size: int) -> None:
-    _roll(
-        rocks,
-        walls,
-        reverse_sort=True,
-        range_builder=lambda col: range(col + 1, grid_size),
-        index_to_replace=1,
+def load(rocks: BitGrid) -> int:
+    return sum(
+        (rocks.height - row) * count for row, count in enumerate(rocks.row_counts())
     )
 
 
@@ -80,38 +31,21 @@ class Solution(StrSplitSolution):
 
     @answer(110565)
     def part_1(self) -> int:
-        rocks = set(parse_grid(self.input, ignore_chars=".#"))
-        walls = set(parse_grid(self.input, ignore_chars=".O"))
-        grid_height = len(self.input)
-
-        roll_up(rocks, walls)
+        scan = scan_grid(self.input)
+        rocks = BitGrid.from_scan(scan, "O")
+        walls = BitGrid.from_scan(scan, "#")
 
-        return sum(grid_height - row for row, _ in rocks)
+        return load(roll(rocks, walls, Direction.UP))
 
     @answer(89845)
     def part_2(self) -> int:
-        rocks = set(parse_grid(self.input, ignore_chars=".#"))
-        walls = set(parse_grid(self.input, ignore_chars=".O"))
-        grid_size = len(self.input)
-        NUM_CYCLES = 1_000_000_000
-
-        states: dict[frozenset[GridPoint], int] = {}
-
-        i = 0
-        while i < NUM_CYCLES:
-            roll_up(rocks, walls)
-            roll_left(rocks, walls)
-            roll_down(rocks, walls, grid_size)
-            roll_right(rocks, walls, grid_size)
-
-            state = frozenset(rocks)
-
-            if state in states and i < 500:
-                distance_to_goal = NUM_CYCLES - i
-                loop_length = i - states[state]
-                i = NUM_CYCLES - distance_to_goal % loop_length
+        scan = scan_grid(self.input)
+        rocks = BitGrid.from_scan(scan, "O")
+        walls = BitGrid.from_scan(scan, "#")
 
-            states[state] = i
-            i += 1
+        def spin(rocks: BitGrid) -> BitGrid:
+            for facing in SPIN_CYCLE:
+                rocks = roll(rocks, walls, facing)
+            return rocks
 
-        return sum(grid_size - row for row, _ in rocks)
+        return load(fast_forward(rocks, spin, 1_000_000_000))
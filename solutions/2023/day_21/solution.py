@@ -4,7 +4,7 @@ from collections import deque
 from typing import Callable
 
 from ...base import StrSplitSolution, answer
-from ...utils.graphs import GridPoint, neighbors, parse_grid
+from ...utils.graphs import PackedPoint, scan_grid
 
 
 class Solution(StrSplitSolution):
@@ -14,13 +14,11 @@ class Solution(StrSplitSolution):
     @answer((3729, 621289922886149))
     def solve(self) -> tuple[int, int]:
         grid_size = len(self.input)
-        grid = parse_grid(self.input, ignore_chars="#")
-        plot_locations = set(grid)
+        scan = scan_grid(self.input, markers="S")
+        text, offsets = scan.text, scan.offsets
 
-        visited: dict[GridPoint, int] = {}
-        queue: deque[tuple[int, GridPoint]] = deque(
-            [(0, next(k for k, v in grid.items() if v == "S"))]
-        )
+        visited: dict[PackedPoint, int] = {}
+        queue: deque[tuple[int, PackedPoint]] = deque([(0, scan.find("S"))])
 
         def num_points_where(f: Callable[[int], bool]) -> int:
             return sum(f(v) for v in visited.values())
@@ -33,8 +31,9 @@ class Solution(StrSplitSolution):
 
             visited[point] = distance
 
-            for n in neighbors(point, num_directions=4):
-                if n in visited or n not in plot_locations:
+            for offset in offsets:
+                n = point + offset
+                if n in visited or not scan.in_bounds(n) or text[n] == "#":
                     continue
 
                 queue.append((distance + 1, n))
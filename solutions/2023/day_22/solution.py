@@ -4,6 +4,7 @@
 from dataclasses import dataclass
 
 from ...base import StrSplitSolution, answer
+from ...utils.voxels import HeightMap
 
 type Cube = tuple[int, int, int]
 
@@ -38,23 +39,13 @@ class Brick:
 
         return Brick(id_, cubes, lowest_z)
 
-    def intersects(self, other: "Brick") -> bool:
-        return bool(self.cubes & other.cubes)
-
-    def fall(self) -> "Brick":
-        # refuse to fall if on the ground
-        if self.on_ground:
-            return self
-
-        return Brick(
-            self.id_,
-            {(x, y, z - 1) for x, y, z in self.cubes},
-            self.lowest_z - 1,
-        )
+    @property
+    def footprint(self) -> set[tuple[int, int]]:
+        return {(x, y) for x, y, _ in self.cubes}
 
     @property
-    def on_ground(self) -> bool:
-        return self.lowest_z == 1
+    def height(self) -> int:
+        return len({z for _, _, z in self.cubes})
 
     def __lt__(self, other: "Brick") -> bool:
         return self.lowest_z < other.lowest_z
@@ -68,30 +59,14 @@ class Solution(StrSplitSolution):
     def solve(self) -> tuple[int, int]:
         bricks = sorted(Brick.parse(idx, l) for idx, l in enumerate(self.input))
 
-        settled_bricks: list[Brick] = []
-        settled_cubes: set[Cube] = set()
-
-        for brick in bricks:
-            cur_pos = brick
-            while not (
-                cur_pos.on_ground or (next_pos := cur_pos.fall()).cubes & settled_cubes
-            ):
-                cur_pos = next_pos
-
-            settled_bricks.append(cur_pos)
-            settled_cubes |= cur_pos.cubes
-
+        # bricks only ever land on whatever's highest in the columns below them,
+        # so there's no need to move them down 1 step at a time
+        pile = HeightMap[int]()
         supported_by: dict[int, set[int]] = {}
-        for settled_brick in settled_bricks:
-            if settled_brick.on_ground:
-                continue
-
-            below = settled_brick.fall()
-            supported_by[settled_brick.id_] = {
-                other.id_
-                for other in settled_bricks
-                if settled_brick.id_ != other.id_ and below.intersects(other)
-            }
+        for brick in bricks:
+            _, below = pile.drop(brick.id_, brick.footprint, brick.height)
+            if below:
+                supported_by[brick.id_] = below
 
         num_bricks = len(self.input)
         num_load_bearing = len(
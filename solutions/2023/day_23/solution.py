@@ -1,9 +1,13 @@
 # prompt: https://adventofcode.com/2023/day/23
 
-from collections import defaultdict
-
 from ...base import StrSplitSolution, answer, slow
-from ...utils.graphs import GridPoint, add_points, neighbors, parse_grid
+from ...utils.graphs import (
+    GridPoint,
+    add_points,
+    contract_grid,
+    neighbors,
+    parse_grid,
+)
 
 OFFSETS = {
     ">": (0, 1),
@@ -65,59 +69,25 @@ class Solution(StrSplitSolution):
         start = next(p for p in grid if p[0] == 0)
         target = next(p for p in grid if p[0] == len(self.input) - 1)
 
-        # build the grid as
-        # { intersection => { other_intersection => distance } }
-
-        # build graph
-
-        paths: list[tuple[GridPoint, GridPoint]] = [(start, start)]
-        graph: defaultdict[GridPoint, dict[GridPoint, int]] = defaultdict(dict)
-
-        while paths:
-            starting_point, cur = paths.pop()
-            seen = {starting_point}
-
-            while True:
-                if cur == target:
-                    graph[starting_point][cur] = len(seen)
-                    break
+        # this is a longest-path search, so parallel corridors should keep their longest
+        graph = contract_grid(grid, keep=(start, target), prefer=max)
+        target_id = graph.ids[target]
 
-                seen.add(cur)
-
-                moves = [
-                    n
-                    for n in neighbors(cur, num_directions=4)
-                    if n in grid and n not in seen
-                ]
-
-                if not moves:
-                    break
-                if len(moves) == 1:
-                    cur = moves[0]
-                    continue
-
-                if cur not in graph[starting_point]:
-                    # we started on the first step, so we have to offset by 1
-                    graph[starting_point][cur] = len(seen) - 1
-                    paths += [(cur, n) for n in moves]
-
-                break
-
-        # explore the grid
-        stack: list[tuple[GridPoint, int, set[GridPoint]]] = [(start, 0, set())]
+        # explore the much smaller graph of intersections, tracking seen nodes as bits
+        stack: list[tuple[int, int, int]] = [
+            (graph.ids[start], 0, 1 << graph.ids[start])
+        ]
         distances: list[int] = []
 
         while stack:
             cur, distance, seen = stack.pop()
 
-            if cur == target:
+            if cur == target_id:
                 distances.append(distance)
                 continue
 
-            seen.add(cur)
-
-            for intersection, d in graph[cur].items():
-                if intersection not in seen:
-                    stack.append((intersection, distance + d, seen.copy()))
+            for intersection, d in graph.edges[cur]:
+                if not seen >> intersection & 1:
+                    stack.append((intersection, distance + d, seen | 1 << intersection))
 
         return max(distances)
@@ -1,29 +1,30 @@
 # prompt: https://adventofcode.com/2024/day/6
 
 
-from itertools import cycle
-
 from ...base import StrSplitSolution, answer
-from ...utils.graphs import Grid, GridPoint, add_points, parse_grid
+from ...utils.graphs import PackedPoint, scan_grid
 
 
-def track_guard(grid: Grid) -> tuple[bool, set[GridPoint]]:
-    OFFSETS = cycle([(-1, 0), (0, 1), (1, 0), (0, -1)])
-    offset = next(OFFSETS)
+def track_guard(
+    grid: list[str], offsets: tuple[int, ...], start: PackedPoint
+) -> tuple[bool, set[PackedPoint]]:
+    # packed points and a (loc, facing) state squashed into one int keep this
+    # loop free of tuples, which matters since it runs once per obstacle
+    facing = 0  # up
 
-    loc = next(k for k, v in grid.items() if v == "^")
-    visited: set[tuple[GridPoint, GridPoint]] = {(loc, offset)}
+    loc = start
+    visited: set[int] = {loc << 2 | facing}
 
     while True:
-        next_loc = add_points(loc, offset)
-        if next_loc not in grid:
+        next_loc = loc + offsets[facing]
+        if not 0 <= next_loc < len(grid) or grid[next_loc] == "\n":
             break
 
         if grid[next_loc] == "#":
-            offset = next(OFFSETS)
-            visited.add((loc, offset))
+            facing = (facing + 1) % 4
+            visited.add(loc << 2 | facing)
         else:
-            to_add = next_loc, offset
+            to_add = next_loc << 2 | facing
             if to_add in visited:
                 # loop!
                 return False, set()
@@ -31,7 +32,7 @@ def track_guard(grid: Grid) -> tuple[bool, set[GridPoint]]:
             visited.add(to_add)
             loc = next_loc
 
-    return True, {l for l, _ in visited}
+    return True, {state >> 2 for state in visited}
 
 
 class Solution(StrSplitSolution):
@@ -40,9 +41,12 @@ class Solution(StrSplitSolution):
 
     @answer((5239, 1753))
     def solve(self) -> tuple[int, int]:
-        grid = parse_grid(self.input)
+        scan = scan_grid(self.input, markers="^")
+        # the scanned text is already a dense grid, so copy it somewhere mutable
+        grid, offsets = list(scan.text), scan.offsets
+        start = scan.find("^")
 
-        exited, path = track_guard(grid)
+        exited, path = track_guard(grid, offsets, start)
         assert exited
         initial_path_size = len(path)
 
@@ -53,7 +57,7 @@ class Solution(StrSplitSolution):
                 continue
 
             grid[loc] = "#"
-            exited, _ = track_guard(grid)
+            exited, _ = track_guard(grid, offsets, start)
             if not exited:
                 possible_obstacle_locations += 1
             grid[loc] = "."
@@ -4,6 +4,7 @@
 from itertools import product
 
 from ...base import StrSplitSolution, answer
+from ...utils.components import label_grid
 from ...utils.graphs import GridPoint, neighbors, parse_grid
 
 
@@ -14,36 +15,13 @@ class Solution(StrSplitSolution):
     @answer((1483212, 897062))
     def solve(self) -> tuple[int, int]:
         grid = parse_grid(self.input)
-        regions: list[set[GridPoint]] = []
-
-        # every plant should show up in exactly one set so we track them globally
-        all_points: set[GridPoint] = set()
+        regions = [set(group) for group in label_grid(self.input).groups()]
 
         def matching_neighbors(point: GridPoint):
             yield from filter(
                 lambda n: grid.get(n) == grid[point], neighbors(point, num_directions=4)
             )
 
-        for point in grid:
-            if point in all_points:
-                continue
-
-            # now we're standing on a new region
-            region = set()
-
-            queue = [point]
-            while queue:
-                cur = queue.pop()
-                if cur in region:
-                    continue
-
-                region.add(cur)
-
-                queue.extend(matching_neighbors(cur))
-
-            all_points |= region
-            regions.append(region)
-
         perimeter_price = 0
         side_price = 0
         for region in regions:
@@ -2,7 +2,7 @@
 
 
 from ...base import StrSplitSolution, answer
-from ...utils.graphs import GridPoint, add_points, parse_grid
+from ...utils.graphs import PackedPoint, pack, scan_grid
 
 OFFSETS = {
     "<": (0, -1),
@@ -13,12 +13,24 @@ OFFSETS = {
     "]": (0, -1),
 }
 
+
 SWAPS = {
     "[": "]",
     "]": "[",
 }
 
 
+def packed_moves(stride: int) -> dict[str, int]:
+    return {k: pack(v, stride) for k, v in OFFSETS.items()}
+
+
+def gps_sum(grid: list[str], stride: int, char: str) -> int:
+    return sum(
+        100 * row + col
+        for row, col in (divmod(loc, stride) for loc, c in enumerate(grid) if c == char)
+    )
+
+
 class Solution(StrSplitSolution):
     _year = 2024
     _day = 15
@@ -26,22 +38,25 @@ class Solution(StrSplitSolution):
 
     @answer(1457740)
     def part_1(self) -> int:
-        grid = parse_grid(self.input[0].splitlines(), ignore_chars="#")
+        scan = scan_grid(self.input[0].splitlines(), markers="@")
+        # walls surround the whole warehouse, so every step lands inside the text
+        grid = list(scan.text)
+        offsets = packed_moves(scan.stride)
         moves = self.input[1].replace("\n", "")
 
-        loc = next(k for k, v in grid.items() if v == "@")
+        loc = scan.find("@")
 
         for move in moves:
-            offset = OFFSETS[move]
-            if (next_loc := add_points(loc, offset)) not in grid:
+            offset = offsets[move]
+            if grid[next_loc := loc + offset] == "#":
                 continue
 
             if grid[next_loc] == "O":
                 next_block = next_loc
-                while grid.get(next_block) == "O":
-                    next_block = add_points(next_block, offset)
+                while grid[next_block] == "O":
+                    next_block += offset
 
-                if grid.get(next_block) == ".":
+                if grid[next_block] == ".":
                     grid[next_block] = "O"
                 else:
                     continue
@@ -50,7 +65,7 @@ class Solution(StrSplitSolution):
             grid[loc] = "."
             loc = next_loc
 
-        return sum(100 * row + col for (row, col), c in grid.items() if c == "O")
+        return gps_sum(grid, scan.stride, "O")
 
     @answer(1467145)
     def part_2(self) -> int:
@@ -61,7 +76,10 @@ class Solution(StrSplitSolution):
             .replace("O", "[]")
             for s in self.input[0].splitlines()
         ]
-        grid = parse_grid(raw_wide_grid, ignore_chars="#")
+        scan = scan_grid(raw_wide_grid, markers="@")
+        # walls surround the whole warehouse, so every step lands inside the text
+        grid = list(scan.text)
+        offsets = packed_moves(scan.stride)
 
         # num_rows = len(raw_wide_grid)
         # num_cols = len(raw_wide_grid[0])
@@ -83,7 +101,7 @@ class Solution(StrSplitSolution):
 
         # print_grid()
 
-        loc = next(k for k, v in grid.items() if v == "@")
+        loc = scan.find("@")
         moves = self.input[1].replace("\n", "")
 
         for move in moves:
@@ -93,25 +111,23 @@ class Solution(StrSplitSolution):
             # os.system("clear")
             # print(f"{move} from {loc}")
             # print_grid()
-            offset = OFFSETS[move]
-            if (next_loc := add_points(loc, offset)) not in grid:
+            offset = offsets[move]
+            if grid[next_loc := loc + offset] == "#":
                 continue
 
             if grid[next_loc] in "[]":
                 if move in "v^":
-                    rows: list[list[GridPoint]] = [
-                        [next_loc, add_points(next_loc, OFFSETS[grid[next_loc]])]
+                    rows: list[list[PackedPoint]] = [
+                        [next_loc, next_loc + offsets[grid[next_loc]]]
                     ]
                     can_move = True
                     while True:
-                        next_row = {add_points(offset, p) for p in rows[-1]}
+                        next_row = {offset + p for p in rows[-1]}
                         next_row |= {
-                            add_points(p, OFFSETS[grid[p]])
-                            for p in next_row
-                            if grid.get(p, "x") in "[]"
+                            p + offsets[grid[p]] for p in next_row if grid[p] in "[]"
                         }
 
-                        if any(p not in grid for p in next_row):
+                        if any(grid[p] == "#" for p in next_row):
                             can_move = False
                             break
 
@@ -126,18 +142,18 @@ class Solution(StrSplitSolution):
 
                     for row in reversed(rows):
                         for p in row:
-                            dest = add_points(p, offset)
+                            dest = p + offset
                             grid[dest] = grid[p]
                             grid[p] = "."
 
                 else:
                     target_loc = next_loc
                     blocks = [target_loc]
-                    while grid.get(target_loc, "x") in "[]":
-                        target_loc = add_points(target_loc, offset)
+                    while grid[target_loc] in "[]":
+                        target_loc += offset
                         blocks.append(target_loc)
 
-                    if grid.get(target_loc) == ".":
+                    if grid[target_loc] == ".":
                         grid[target_loc] = SWAPS[grid[blocks[0]]]
                         for b in blocks[:-1]:
                             grid[b] = SWAPS[grid[b]]
@@ -148,4 +164,4 @@ class Solution(StrSplitSolution):
             grid[loc] = "."
             loc = next_loc
 
-        return sum(100 * row + col for (row, col), c in grid.items() if c == "[")
+        return gps_sum(grid, scan.stride, "[")
@@ -4,9 +4,17 @@ from heapq import heappop, heappush
 from math import inf
 
 from ...base import StrSplitSolution, answer
-from ...utils.graphs import Direction, GridPoint, Position, parse_grid
+from ...utils.graphs import (
+    NO_STATE,
+    Direction,
+    PackedPoint,
+    PackedState,
+    StateTable,
+    pack_state,
+    scan_grid,
+)
 
-type State = tuple[int, Position, tuple[GridPoint, ...]]
+type State = tuple[int, PackedState, tuple[PackedPoint, ...]]
 
 
 class Solution(StrSplitSolution):
@@ -15,33 +23,37 @@ class Solution(StrSplitSolution):
 
     @answer((98520, 609))
     def solve(self) -> tuple[int, int]:
-        visited: set[Position] = set()
-        best_seats: set[GridPoint] = set()
+        visited: set[PackedState] = set()
+        best_seats: set[PackedPoint] = set()
         lowest_cost = inf
 
-        grid = parse_grid(self.input, ignore_chars="#")
-        start = Position(next(k for k, v in grid.items() if v == "S"), Direction.RIGHT)
-        queue: list[State] = [(0, start, (start.loc,))]
+        scan = scan_grid(self.input, markers="SE")
+        moves = StateTable.for_scan(scan, ignore_chars="#")
+
+        start, end = scan.find("S"), scan.find("E")
+        queue: list[State] = [(0, pack_state(start, Direction.RIGHT), (start,))]
 
         while queue:
-            cost, position, path = heappop(queue)
+            cost, state, path = heappop(queue)
+            loc = state >> 2
 
-            if grid[position.loc] == "E" and cost <= lowest_cost:
+            if loc == end and cost <= lowest_cost:
                 lowest_cost = cost
-                best_seats |= set(path) | {position.loc}
+                best_seats |= set(path) | {loc}
                 continue
 
             if lowest_cost < inf:
                 break
 
-            visited.add(position)
+            visited.add(state)
 
-            next_pos = position.step()
-            if next_pos.loc in grid and next_pos not in visited:
-                heappush(queue, (cost + 1, next_pos, path + (position.loc,)))
+            if (next_state := moves.step[state]) != NO_STATE and (
+                next_state not in visited
+            ):
+                heappush(queue, (cost + 1, next_state, path + (loc,)))
 
-            for direction in "CW", "CCW":
-                if (next_pos := position.rotate(direction)) not in visited:
-                    heappush(queue, (cost + 1000, next_pos, path))
+            for next_state in moves.turn_cw[state], moves.turn_ccw[state]:
+                if next_state not in visited:
+                    heappush(queue, (cost + 1000, next_state, path))
 
         return int(lowest_cost), len(best_seats)
@@ -0,0 +1,169 @@
+from functools import cache
+from typing import Iterable, Iterator
+
+from .graphs import Direction, GridPoint, ScannedGrid, packed_offsets, scan_grid
+
+
+@cache
+def _board_mask(height: int, stride: int) -> int:
+    """
+    every bit that's a real cell, skipping the padding column at the end of each row
+    """
+    row = (1 << (stride - 1)) - 1
+    return sum(row << (r * stride) for r in range(height))
+
+
+class BitGrid:
+    """
+    A set of points on a fixed-size `(row, col)` grid, stored as the bits of a single (arbitrarily large) int. Bit `row * stride + col` is set if that point is in the grid, which is the same number `pack` would give that point.
+
+    Because the whole board is one int, a simulation step that would normally loop over every point becomes a handful of big-int operations:
+
+    ```
+    rocks = BitGrid.from_lines(raw, "O")
+    walls = BitGrid.from_lines(raw, "#")
+    # every rock that has room to move up, in its new position
+    moving = rocks.shift(Direction.UP) - rocks - walls
+    len(moving) # number of rocks that moved
+    ```
+
+    Like with packed points, each row has an extra (always empty) bit at the end, so shifting left or right can't wrap a point onto the next row. Shifting only works one step at a time in each dimension for that reason.
+
+    Instances are immutable (and hashable), so they're safe to use as `dict` keys when looking for cycles.
+    """
+
+    def __init__(self, height: int, width: int, bits: int = 0) -> None:
+        self.height = height
+        self.width = width
+        self.stride = width + 1
+        self.mask = _board_mask(height, self.stride)
+        self.bits = bits & self.mask
+
+    @classmethod
+    def from_points(
+        cls, points: Iterable[GridPoint], height: int, width: int
+    ) -> "BitGrid":
+        stride = width + 1
+        bits = 0
+        for row, col in points:
+            bits |= 1 << (row * stride + col)
+        return cls(height, width, bits)
+
+    @classmethod
+    def from_lines(cls, raw_grid: list[str], chars: str) -> "BitGrid":
+        """
+        Build a grid straight from puzzle input, where every character in `chars` is a set bit.
+        """
+        return cls.from_scan(scan_grid(raw_grid), chars)
+
+    @classmethod
+    def from_scan(cls, scan: ScannedGrid, chars: str) -> "BitGrid":
+        """
+        Like `from_lines`, but reuses a grid that's already been scanned. Since a scan's text lines up with the bits of a `BitGrid`, this is a single `translate` over the whole grid.
+        """
+        table = str.maketrans({c: "1" if c in chars else "0" for c in set(scan.text)})
+        # bit 0 is the top left, so read the text backwards
+        bits = int(scan.text.translate(table)[::-1] or "0", 2)
+        height = len(scan.text) // scan.stride
+        return cls(height, scan.stride - 1, bits)
+
+    def _new(self, bits: int) -> "BitGrid":
+        return BitGrid(self.height, self.width, bits)
+
+    def shift_by(self, d_row: int, d_col: int) -> "BitGrid":
+        """
+        Move every point by the given offset, dropping any that fall off the board. Each delta must be between -1 and 1.
+        """
+        assert -1 <= d_row <= 1 and -1 <= d_col <= 1, "can only shift 1 step at a time"
+        offset = d_row * self.stride + d_col
+        if offset >= 0:
+            return self._new(self.bits << offset)
+        return self._new(self.bits >> -offset)
+
+    def shift(self, facing: Direction) -> "BitGrid":
+        """
+        Move every point one step in a direction.
+        """
+        return self.shift_by(*Direction.offset(facing))
+
+    def spread(self, num_directions=4) -> "BitGrid":
+        """
+        Every point that's a neighbor of a point in this grid. Doesn't include the original points (unless they neighbor each other).
+        """
+        assert num_directions in {4, 8}
+        bits = 0
+        for offset in packed_offsets(self.stride, num_directions):
+            bits |= self.bits << offset if offset > 0 else self.bits >> -offset
+        return self._new(bits)
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return self._new(self.bits & other.bits)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return self._new(self.bits | other.bits)
+
+    def __xor__(self, other: "BitGrid") -> "BitGrid":
+        return self._new(self.bits ^ other.bits)
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        return self._new(self.bits & ~other.bits)
+
+    def __invert__(self) -> "BitGrid":
+        return self._new(~self.bits)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, point: GridPoint) -> bool:
+        row, col = point
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            return False
+        return bool(self.bits >> (row * self.stride + col) & 1)
+
+    def __iter__(self) -> Iterator[GridPoint]:
+        """
+        Yields set points in row-major order.
+        """
+        # scanning a string is linear, which peeling off bits one at a time is not
+        digits = bin(self.bits)[:1:-1]
+        index = digits.find("1")
+        while index != -1:
+            yield divmod(index, self.stride)
+            index = digits.find("1", index + 1)
+
+    def row_counts(self) -> list[int]:
+        """
+        The number of set points in each row.
+        """
+        row_mask = (1 << self.width) - 1
+        return [
+            (self.bits >> (row * self.stride) & row_mask).bit_count()
+            for row in range(self.height)
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return (self.height, self.width, self.bits) == (
+            other.height,
+            other.width,
+            other.bits,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.height, self.width, self.bits))
+
+    def __repr__(self) -> str:
+        return f"BitGrid(height={self.height}, width={self.width}, points={len(self)})"
+
+    def __str__(self) -> str:
+        return "\n".join(
+            "".join(
+                "#" if self.bits >> (row * self.stride + col) & 1 else "."
+                for col in range(self.width)
+            )
+            for row in range(self.height)
+        )
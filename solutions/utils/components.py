@@ -0,0 +1,204 @@
+from operator import eq
+from typing import Callable, NamedTuple, Optional, Sequence
+
+from .graphs import GridPoint
+
+
+class DisjointSet:
+    """
+    A union-find over the ints `[0, size)`, backed by flat lists. `find` compresses paths as it goes and `union` attaches the shallower tree under the deeper one, so both are effectively constant time.
+
+    ```
+    ds = DisjointSet(4)
+    ds.union(0, 1)
+    ds.union(2, 3)
+    ds.connected(0, 1) # True
+    ds.connected(1, 2) # False
+    ds.num_components # 2
+    ds.component_size(0) # 2
+    ```
+    """
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+        self.rank = [0] * size
+        self.size = [1] * size
+        self.num_components = size
+
+    def add(self) -> int:
+        """
+        Add a new element in its own component and return its id.
+        """
+        new_id = len(self.parent)
+        self.parent.append(new_id)
+        self.rank.append(0)
+        self.size.append(1)
+        self.num_components += 1
+        return new_id
+
+    def find(self, x: int) -> int:
+        """
+        The representative element of `x`'s component.
+        """
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        # point everything we walked past straight at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the components containing `a` and `b`. Returns `False` if they were already connected.
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        elif self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.num_components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def groups(self) -> list[list[int]]:
+        """
+        Every component's members, in order of their smallest element.
+        """
+        by_root: dict[int, list[int]] = {}
+        for x in range(len(self.parent)):
+            by_root.setdefault(self.find(x), []).append(x)
+        return list(by_root.values())
+
+
+class Component(NamedTuple):
+    """
+    Summary info about a single connected region of a grid.
+    """
+
+    label: int
+    size: int
+    min_row: int
+    min_col: int
+    max_row: int
+    max_col: int
+
+    @property
+    def height(self) -> int:
+        return self.max_row - self.min_row + 1
+
+    @property
+    def width(self) -> int:
+        return self.max_col - self.min_col + 1
+
+
+class GridComponents(NamedTuple):
+    labels: list[list[int]]
+    """
+    The component label for each `(row, col)`, or `-1` for cells that weren't included.
+    """
+    components: list[Component]
+    """
+    Summary info for each component, indexed by label.
+    """
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def groups(self) -> list[list[GridPoint]]:
+        """
+        The points in each component, indexed by label.
+        """
+        result: list[list[GridPoint]] = [[] for _ in self.components]
+        for row, labels in enumerate(self.labels):
+            for col, label in enumerate(labels):
+                if label != -1:
+                    result[label].append((row, col))
+        return result
+
+
+def label_grid[T](
+    rows: Sequence[Sequence[T]],
+    num_directions=4,
+    *,
+    include: Optional[Callable[[T], bool]] = None,
+    connects: Callable[[T, T], bool] = eq,
+) -> GridComponents:
+    """
+    Finds the connected regions of a dense (list-of-rows) grid in a single scan.
+
+    Two neighboring cells are in the same region if both are included and `connects(a, b)` is truthy; by default, that means they have the same value. To group every included cell regardless of value (like "everything that isn't a wall"), pass `connects=lambda a, b: True`.
+
+    * `num_directions`: 4 for cardinal neighbors, 8 to also connect diagonals
+    * `include`: if given, cells where this is falsy aren't part of any region
+
+    Labels are assigned in reading order of each region's first cell.
+    """
+    assert num_directions in {4, 8}
+    height = len(rows)
+    width = max(map(len, rows), default=0)
+
+    # only look at neighbors we've already scanned; the rest will look back at us
+    previous = [(0, -1), (-1, 0)]
+    if num_directions == 8:
+        previous += [(-1, -1), (-1, 1)]
+
+    ds = DisjointSet(height * width)
+    included = [[False] * width for _ in range(height)]
+
+    for row, line in enumerate(rows):
+        for col, value in enumerate(line):
+            if include and not include(value):
+                continue
+            included[row][col] = True
+
+            for d_row, d_col in previous:
+                n_row, n_col = row + d_row, col + d_col
+                if (
+                    n_row >= 0
+                    and 0 <= n_col < len(rows[n_row])
+                    and included[n_row][n_col]
+                    and connects(rows[n_row][n_col], value)
+                ):
+                    ds.union(row * width + col, n_row * width + n_col)
+
+    labels = [[-1] * width for _ in range(height)]
+    root_labels: dict[int, int] = {}
+    bounds: list[list[int]] = []
+    for row in range(height):
+        for col in range(width):
+            if not included[row][col]:
+                continue
+
+            root = ds.find(row * width + col)
+            if (label := root_labels.get(root)) is None:
+                label = root_labels[root] = len(bounds)
+                bounds.append([row, col, row, col])
+            else:
+                box = bounds[label]
+                box[1] = min(box[1], col)
+                box[2] = row
+                box[3] = max(box[3], col)
+
+            labels[row][col] = label
+
+    components = [
+        Component(label, ds.component_size(root), *bounds[label])
+        for root, label in root_labels.items()
+    ]
+
+    return GridComponents(labels, components)
@@ -0,0 +1,137 @@
+from typing import Callable, Hashable, NamedTuple, Optional
+
+
+class Cycle(NamedTuple):
+    """
+    Describes a sequence of states that eventually loops.
+
+    ```
+    a -> b -> c -> d -> e
+              ^         |
+              +---------+
+    ```
+
+    The above has `start=2` (c is the first state that repeats) and `length=3`.
+    """
+
+    start: int
+    """
+    The number of steps before the loop begins (often called mu).
+    """
+    length: int
+    """
+    The number of steps it takes to get back to a state once inside the loop (often called lambda).
+    """
+
+    def index_for(self, num_steps: int) -> int:
+        """
+        The earliest step whose state matches the state after `num_steps` steps.
+        """
+        if num_steps < self.start:
+            return num_steps
+        return self.start + (num_steps - self.start) % self.length
+
+
+def find_cycle[S](
+    initial: S,
+    step: Callable[[S], S],
+    key: Optional[Callable[[S], Hashable]] = None,
+    *,
+    max_steps: Optional[int] = None,
+) -> Cycle:
+    """
+    Repeatedly calls `step` (starting from `initial`) until a state repeats, remembering every state's key in a dict.
+
+    `key` turns a state into something hashable. It defaults to the state itself, but anything that uniquely identifies a state works and is cheaper to store: a tuple of a mutable list, a packed int, or even a `hash()` if you're willing to risk a collision to keep memory flat on huge states.
+
+    Raises a `ValueError` if no repeat happens within `max_steps`.
+    """
+    seen: dict[Hashable, int] = {}
+    state = initial
+    i = 0
+    while (k := key(state) if key else state) not in seen:
+        if max_steps is not None and i >= max_steps:
+            raise ValueError(f"no cycle found in {max_steps} steps")
+        seen[k] = i
+        state = step(state)
+        i += 1
+
+    return Cycle(seen[k], i - seen[k])
+
+
+def brent[S](
+    initial: S,
+    step: Callable[[S], S],
+    key: Optional[Callable[[S], Hashable]] = None,
+) -> Cycle:
+    """
+    Finds the same `Cycle` as `find_cycle`, but with Brent's algorithm, which only ever holds a couple of states at a time (rather than every key seen so far). The tradeoff is that it calls `step` about 2-3x as often.
+
+    Since it re-walks the sequence from `initial`, `step` must return a new state rather than modifying the one it's given.
+    """
+
+    def same(a: S, b: S) -> bool:
+        return key(a) == key(b) if key else a == b
+
+    # find the cycle length by teleporting the tortoise to the hare at every power of 2
+    power = length = 1
+    tortoise = initial
+    hare = step(initial)
+    while not same(tortoise, hare):
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+
+    # then walk two pointers, `length` apart, until they meet at the start of the loop
+    tortoise = hare = initial
+    for _ in range(length):
+        hare = step(hare)
+
+    start = 0
+    while not same(tortoise, hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    return Cycle(start, length)
+
+
+def fast_forward[S](
+    initial: S,
+    step: Callable[[S], S],
+    num_steps: int,
+    key: Optional[Callable[[S], Hashable]] = None,
+    *,
+    use_brent=False,
+) -> S:
+    """
+    Returns the state after calling `step` `num_steps` times, skipping over as many trips around a loop as possible. Great for "now do that a billion times" puzzles.
+
+    By default, this hashes each state's `key` (see `find_cycle`) and only steps once per state until the loop is found. With `use_brent=True`, memory use is constant, but `step` is called more often and must not modify its input.
+    """
+    if use_brent:
+        cycle = brent(initial, step, key)
+        state = initial
+        for _ in range(cycle.index_for(num_steps)):
+            state = step(state)
+        return state
+
+    seen: dict[Hashable, int] = {}
+    state = initial
+    i = 0
+    while i < num_steps:
+        k = key(state) if key else state
+        if (loop_start := seen.get(k)) is not None:
+            # we're back to a state we saw at `loop_start`; skip every full lap that's left
+            for _ in range((num_steps - i) % (i - loop_start)):
+                state = step(state)
+            return state
+
+        seen[k] = i
+        state = step(state)
+        i += 1
+
+    return state
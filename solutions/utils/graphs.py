@@ -1,11 +1,23 @@
+from collections import deque
 from enum import IntEnum
+from heapq import heappop, heappush
 from itertools import product
 from operator import itemgetter
-from typing import Iterator, Literal, NamedTuple, Optional, overload
+from typing import (
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    overload,
+)
 
 type GridPoint = tuple[int, int]
 type Grid = dict[GridPoint, str]
 type IntGrid = dict[GridPoint, int]
+type PackedPoint = int
 
 OFFSETS = sorted(product((-1, 0, 1), repeat=2), key=itemgetter(1))
 
@@ -84,16 +96,34 @@ def parse_grid(
 def parse_grid(
     raw_grid: list[str], *, int_vals: Literal[False], ignore_chars: str = ""
 ) -> Grid: ...
+@overload
+def parse_grid(
+    raw_grid: list[str], *, packed: Literal[True], ignore_chars: str = ""
+) -> "PackedGrid[str]": ...
+@overload
+def parse_grid(
+    raw_grid: list[str],
+    *,
+    int_vals: Literal[True],
+    packed: Literal[True],
+    ignore_chars: str = "",
+) -> "PackedGrid[int]": ...
 
 
 def parse_grid(
-    raw_grid: list[str], *, int_vals: bool = False, ignore_chars: str = ""
-) -> Grid | IntGrid:
+    raw_grid: list[str],
+    *,
+    int_vals: bool = False,
+    ignore_chars: str = "",
+    packed: bool = False,
+) -> "Grid | IntGrid | PackedGrid":
     """
     returns 2-tuples of (row, col) with their value. Values are `str` by default, but can be ints with `int_vals=True`.
 
     `ignore_chars` is for grid characters that aren't valid landing spots, like walls.
 
+    `packed=True` returns a `PackedGrid` instead, whose keys are single ints (see `pack`). Use it in hot loops that would otherwise create and hash millions of tuples.
+
     ```
     (0, 0) ------> (0, 9)
       |              |
@@ -104,9 +134,23 @@ def parse_grid(
     (9, 0) ------> (9, 9)
     ```
     """
-    result = {}
     ignore = set(ignore_chars)
 
+    if packed:
+        stride = packed_stride(raw_grid)
+        packed_result = PackedGrid(stride)
+        for row, line in enumerate(raw_grid):
+            base = row * stride
+            for col, c in enumerate(line):
+                if c in ignore:
+                    continue
+
+                packed_result[base + col] = int(c) if int_vals else c
+
+        return packed_result
+
+    result = {}
+
     for row, line in enumerate(raw_grid):
         for col, c in enumerate(line):
             if c in ignore:
@@ -137,6 +181,166 @@ def taxicab_distance(a: GridPoint, b: GridPoint) -> int:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
+def bfs_distances(
+    start: GridPoint, open_cells: Container[GridPoint]
+) -> dict[GridPoint, int]:
+    """
+    The fewest 4-directional steps it takes to get from `start` to every point in `open_cells` that it can reach. Great for mazes and anything that spreads out one step at a time.
+    """
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        cur = queue.popleft()
+        for n in neighbors(cur, num_directions=4):
+            if n in open_cells and n not in distances:
+                distances[n] = distances[cur] + 1
+                queue.append(n)
+    return distances
+
+
+def packed_stride(raw_grid: list[str]) -> int:
+    """
+    the row width to use when packing points from this grid. It's one wider than the grid itself, so there's an empty column between the end of one row and the start of the next. That way, stepping off the left or right edge lands on a key that's never in the grid (instead of wrapping around onto a real cell).
+    """
+    return max(map(len, raw_grid), default=0) + 1
+
+
+def pack(point: GridPoint, stride: int) -> PackedPoint:
+    """
+    squash a `(row, col)` point into a single int (`row * stride + col`). Ints are cheaper to hash and compare than tuples and stepping is a single addition.
+    """
+    return point[0] * stride + point[1]
+
+
+def unpack(point: PackedPoint, stride: int) -> GridPoint:
+    """
+    the inverse of `pack`; only meaningful for points that are on the grid.
+    """
+    return divmod(point, stride)
+
+
+def packed_offsets(stride: int, num_directions=4) -> tuple[int, ...]:
+    """
+    the integer deltas that step a packed point to its neighbors.
+
+    With `num_directions=4`, they're ordered to match `Direction` (up, right, down, left), so `packed_offsets(stride)[facing]` works. With `num_directions=8`, they go top left to bottom right like `neighbors`.
+    """
+    assert num_directions in {4, 8}
+    if num_directions == 4:
+        return (-stride, 1, stride, -1)
+
+    return tuple(r * stride + c for r, c in OFFSETS if r or c)
+
+
+class PackedGrid[T](dict[PackedPoint, T]):
+    """
+    A regular grid dict, but keyed by packed ints instead of `(row, col)` tuples. It remembers its `stride`, so it can convert points back and forth. Build one with `parse_grid(..., packed=True)`.
+
+    ```
+    grid = parse_grid(["#.", ".."], packed=True)
+    grid.stride # 3
+    grid[grid.pack((1, 1))] # "."
+    grid.unpack(4) # (1, 1)
+    [grid.unpack(n) for n in grid.neighbors(0) if n in grid] # [(0, 1), (1, 0)]
+    ```
+    """
+
+    stride: int
+    """
+    The packed width of a row (see `packed_stride`).
+    """
+    offsets: tuple[int, ...]
+    """
+    Steps in each `Direction`, so `loc + grid.offsets[facing]` moves once.
+    """
+
+    def __init__(self, stride: int):
+        super().__init__()
+        self.stride = stride
+        self.offsets = packed_offsets(stride)
+
+    def pack(self, point: GridPoint) -> PackedPoint:
+        return pack(point, self.stride)
+
+    def unpack(self, point: PackedPoint) -> GridPoint:
+        return unpack(point, self.stride)
+
+    def neighbors(self, center: PackedPoint) -> list[PackedPoint]:
+        """
+        The 4 cardinal neighbors of a point, which may not be in the grid.
+        """
+        return [center + o for o in self.offsets]
+
+
+class ScannedGrid(NamedTuple):
+    """
+    A grid that's kept as its raw text, plus the locations of any characters you asked for. Build one with `scan_grid`.
+
+    Each row of `text` is padded to the same width and ends in a newline, so a character's index in `text` is its packed point (see `pack`). That makes `text[loc]` a lookup into a dense grid, without building a dict first.
+    """
+
+    text: str
+    stride: int
+    markers: dict[str, list[PackedPoint]]
+    """
+    Every location of each character in `markers`, in reading order.
+    """
+    sets: dict[str, set[PackedPoint]]
+    """
+    Every location of each character in `sets`.
+    """
+    offsets: tuple[int, ...]
+    """
+    Steps in each `Direction`, so `loc + scan.offsets[facing]` moves once.
+    """
+
+    def find(self, char: str) -> PackedPoint:
+        """
+        The location of a character that shows up exactly once, like a start or end marker.
+        """
+        locs = self.markers[char]
+        assert len(locs) == 1, f"expected exactly 1 {char!r}, found {len(locs)}"
+        return locs[0]
+
+    def in_bounds(self, loc: PackedPoint) -> bool:
+        return 0 <= loc < len(self.text) and self.text[loc] != "\n"
+
+
+def scan_grid(raw_grid: list[str], *, markers: str = "", sets: str = "") -> ScannedGrid:
+    """
+    A faster alternative to `parse_grid` for big grids where you mostly care where a few characters are. It joins the grid into a single string, then runs a `str.find` scan for each requested character. The scanning happens in C, so Python only ever touches the cells that matched. Index into `text` for everything else instead of building a dict of the whole grid.
+
+    Each character in `markers` gets a list of its locations and each character in `sets` gets a set of them (handy for walls or obstacles). Locations are packed points.
+
+    ```
+    scan = scan_grid(["#S.", ".#E"], markers="SE", sets="#")
+    scan.find("S") # 1
+    scan.sets["#"] # {0, 5}
+    scan.text[scan.find("E")] # "E"
+    ```
+    """
+    stride = packed_stride(raw_grid)
+    # ragged rows are padded with more newlines, which are never in the grid
+    text = "".join(line + "\n" * (stride - len(line)) for line in raw_grid)
+
+    found_markers: dict[str, list[PackedPoint]] = {c: [] for c in markers}
+    found_sets: dict[str, set[PackedPoint]] = {c: set() for c in sets}
+
+    for c in set(markers) | set(sets):
+        locs: list[PackedPoint] = []
+        loc = text.find(c)
+        while loc != -1:
+            locs.append(loc)
+            loc = text.find(c, loc + 1)
+
+        if c in found_markers:
+            found_markers[c] = locs
+        if c in found_sets:
+            found_sets[c] = set(locs)
+
+    return ScannedGrid(text, stride, found_markers, found_sets, packed_offsets(stride))
+
+
 Rotation = Literal["CCW", "CW"]
 
 
@@ -162,24 +366,31 @@ class Direction(IntEnum):
 
     @staticmethod
     def rotate(facing: "Direction", towards: Rotation) -> "Direction":
-        offset = 1 if towards == "CW" else -1
-        # cheaper to use singletons than recalculate dynamically every time
-        return _DIRECTIONS[(facing.value + offset) % 4]
+        # cheaper to look up singletons than recalculate dynamically every time
+        return _ROTATIONS[towards][facing]
 
     @staticmethod
     def offset(facing: "Direction") -> GridPoint:
         return _ROW_COLL_OFFSETS[facing]
 
+    @staticmethod
+    def packed_offset(facing: "Direction", stride: int) -> int:
+        """
+        Like `offset`, but for packed points (see `pack`).
+        """
+        return pack(_ROW_COLL_OFFSETS[facing], stride)
+
 
 _DIRECTIONS = [Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT]
 
-_ROW_COLL_OFFSETS: dict[Direction, GridPoint] = {
-    Direction.UP: (-1, 0),
-    Direction.RIGHT: (0, 1),
-    Direction.DOWN: (1, 0),
-    Direction.LEFT: (0, -1),
+_ROTATIONS: dict[Rotation, tuple[Direction, ...]] = {
+    "CW": (*_DIRECTIONS[1:], _DIRECTIONS[0]),
+    "CCW": (_DIRECTIONS[-1], *_DIRECTIONS[:-1]),
 }
 
+# indexed by `Direction`, which is an int
+_ROW_COLL_OFFSETS: tuple[GridPoint, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
 
 class Position(NamedTuple):
     """
@@ -217,3 +428,198 @@ class Position(NamedTuple):
 
     def rotate(self, towards: Rotation) -> "Position":
         return Position(self.loc, Direction.rotate(self.facing, towards))
+
+
+class PackedPosition(NamedTuple):
+    """
+    Like `Position`, but with a packed `loc`. Since a packed point doesn't know how wide its grid is, stepping needs the `stride`.
+
+    ```
+    grid = parse_grid(raw, packed=True)
+    cur = PackedPosition(grid.pack((0, 0)), Direction.DOWN)
+    cur.step(grid.stride) # PackedPosition(grid.pack((1, 0)), Direction.DOWN)
+    ```
+    """
+
+    loc: PackedPoint
+    facing: Direction
+
+    def next_loc(self, stride: int) -> PackedPoint:
+        """
+        Where you'd land, if you stepped.
+        """
+        return self.loc + Direction.packed_offset(self.facing, stride)
+
+    def step(self, stride: int) -> "PackedPosition":
+        return PackedPosition(self.next_loc(stride), self.facing)
+
+    def rotate(self, towards: Rotation) -> "PackedPosition":
+        return PackedPosition(self.loc, Direction.rotate(self.facing, towards))
+
+
+type PackedState = int
+"""
+A packed point and the `Direction` you're facing, squashed into a single int (see `pack_state`).
+"""
+
+NO_STATE: PackedState = -1
+"""
+What a `StateTable` returns for a move that would leave the grid.
+"""
+
+
+def pack_state(loc: PackedPoint, facing: Direction) -> PackedState:
+    """
+    Since there are only 4 directions, they fit in the bottom 2 bits: `loc << 2 | facing`. States are cheaper to hash, compare, and store than `PackedPosition`s.
+    """
+    return loc << 2 | facing
+
+
+def unpack_state(state: PackedState) -> tuple[PackedPoint, Direction]:
+    return state >> 2, _DIRECTIONS[state & 3]
+
+
+class StateTable(NamedTuple):
+    """
+    Every move you can make from every `PackedState` in a grid, worked out once up front. Each list is indexed by state, so a search can move with a single list lookup instead of building new `Position`s and checking them against the grid.
+
+    Moves that would leave the grid (or land on a cell that was left out of it with `ignore_chars`) are `NO_STATE`.
+
+    ```
+    grid = parse_grid(raw, ignore_chars="#", packed=True)
+    moves = StateTable.for_grid(grid)
+    state = pack_state(grid.pack((1, 1)), Direction.RIGHT)
+    if (forward := moves.step[state]) != NO_STATE:
+        ...
+    moves.turn_cw[state] # same loc, facing DOWN
+    ```
+    """
+
+    step: list[PackedState]
+    turn_cw: list[PackedState]
+    turn_ccw: list[PackedState]
+
+    @classmethod
+    def for_grid(cls, grid: PackedGrid) -> "StateTable":
+        num_states = (max(grid) + 1) << 2 if grid else 0
+
+        step = [NO_STATE] * num_states
+        for loc in grid:
+            for facing, offset in enumerate(grid.offsets):
+                if (next_loc := loc + offset) in grid:
+                    step[loc << 2 | facing] = next_loc << 2 | facing
+
+        # turning never leaves the grid, so these are just bit twiddling
+        turn_cw = [s & ~3 | (s + 1) & 3 for s in range(num_states)]
+        turn_ccw = [s & ~3 | (s - 1) & 3 for s in range(num_states)]
+
+        return cls(step, turn_cw, turn_ccw)
+
+    @classmethod
+    def for_scan(cls, scan: ScannedGrid, ignore_chars: str = "") -> "StateTable":
+        """
+        Like `for_grid`, but reads cells straight out of a scan's `text`, so there's no need to build a `PackedGrid` first.
+        """
+        text, offsets = scan.text, scan.offsets
+        blocked = set(ignore_chars) | {"\n"}
+        num_states = len(text) << 2
+
+        step = [NO_STATE] * num_states
+        for loc, c in enumerate(text):
+            if c in blocked:
+                continue
+            for facing, offset in enumerate(offsets):
+                next_loc = loc + offset
+                if 0 <= next_loc < len(text) and text[next_loc] not in blocked:
+                    step[loc << 2 | facing] = next_loc << 2 | facing
+
+        turn_cw = [s & ~3 | (s + 1) & 3 for s in range(num_states)]
+        turn_ccw = [s & ~3 | (s - 1) & 3 for s in range(num_states)]
+
+        return cls(step, turn_cw, turn_ccw)
+
+
+class ContractedGraph(NamedTuple):
+    """
+    A grid boiled down to just its interesting points (junctions, dead ends, and anything explicitly kept), connected by weighted edges. Built by `contract_grid`.
+
+    Nodes are referred to by small int ids, so search states can track visited nodes as a bitmask (`seen | 1 << node`) instead of copying sets of points around.
+    """
+
+    nodes: list[GridPoint]
+    """
+    The grid location of each node, indexed by id.
+    """
+    ids: dict[GridPoint, int]
+    """
+    The id for each node's location.
+    """
+    edges: list[list[tuple[int, int]]]
+    """
+    For each node id, a list of `(other_id, distance)` pairs for the nodes it's directly connected to by a corridor.
+    """
+
+    def shortest_distances(self, source: int) -> dict[int, int]:
+        """
+        Dijkstra from `source` to every reachable node. Unreachable nodes are left out.
+        """
+        best = {source: 0}
+        queue = [(0, source)]
+        while queue:
+            distance, cur = heappop(queue)
+            if distance > best[cur]:
+                continue
+            for other, d in self.edges[cur]:
+                if (new_distance := distance + d) < best.get(other, new_distance + 1):
+                    best[other] = new_distance
+                    heappush(queue, (new_distance, other))
+        return best
+
+    def all_pairs_distances(self) -> list[dict[int, int]]:
+        """
+        Shortest distances between every pair of nodes, indexed as `result[from_id][to_id]`.
+        """
+        return [self.shortest_distances(i) for i in range(len(self.nodes))]
+
+
+def contract_grid(
+    grid: Grid,
+    passable: Optional[Callable[[str], bool]] = None,
+    *,
+    keep: Iterable[GridPoint] = (),
+    prefer: Callable[[int, int], int] = min,
+) -> ContractedGraph:
+    """
+    Collapses every corridor (a run of passable cells with exactly 2 passable neighbors) in a grid into a single weighted edge. What's left are the junctions and dead ends, plus any points in `keep` (like a start or target in the middle of a corridor).
+
+    `passable` decides which cell values can be walked on. If omitted, every point in `grid` is passable, which suits grids parsed with walls in `ignore_chars`.
+
+    Movement is 4-directional and edges are undirected. If two nodes are connected by more than one corridor, `prefer` picks which length to keep: the shortest by default (for shortest-path searches), or pass `max` for longest-path ones.
+    """
+    open_cells = {p for p, v in grid.items() if passable(v)} if passable else set(grid)
+
+    def open_neighbors(point: GridPoint) -> list[GridPoint]:
+        return [n for n in neighbors(point, num_directions=4) if n in open_cells]
+
+    kept = {p for p in keep if p in open_cells}
+    nodes = sorted(kept | {p for p in open_cells if len(open_neighbors(p)) != 2})
+    ids = {p: i for i, p in enumerate(nodes)}
+
+    weights: list[dict[int, int]] = [{} for _ in nodes]
+    for node_id, node in enumerate(nodes):
+        for first_step in open_neighbors(node):
+            prev, cur, distance = node, first_step, 1
+            # every non-node cell has exactly 2 open neighbors, so there's only ever one way forward
+            while cur not in ids:
+                prev, cur = cur, next(n for n in open_neighbors(cur) if n != prev)
+                distance += 1
+
+            other_id = ids[cur]
+            if other_id == node_id:
+                continue
+            if (existing := weights[node_id].get(other_id)) is not None:
+                distance = prefer(existing, distance)
+            weights[node_id][other_id] = distance
+            weights[other_id][node_id] = distance
+
+    return ContractedGraph(nodes, ids, [list(w.items()) for w in weights])
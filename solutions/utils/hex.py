@@ -0,0 +1,132 @@
+import re
+from collections import Counter
+from itertools import accumulate
+from typing import Iterable
+
+type HexPoint = int
+"""
+Axial `(q, r)` hex coordinates, packed into a single int (see `pack`).
+"""
+
+# half of this is the max distance from the origin in the `r` direction.
+# plenty for any puzzle, but small enough that points stay (cheap) small ints
+_STRIDE = 1 << 24
+_HALF = _STRIDE // 2
+
+ORIGIN: HexPoint = 0
+
+
+def pack(q: int, r: int) -> HexPoint:
+    """
+    Squash axial coordinates into a single int. Packing is linear, so packed points (and offsets) can be added and subtracted directly: `pack(1, 2) + pack(3, 4) == pack(4, 6)`.
+    """
+    return q * _STRIDE + r
+
+
+def unpack(point: HexPoint) -> tuple[int, int]:
+    """
+    The axial `(q, r)` coordinates of a packed point.
+    """
+    q, r = divmod(point + _HALF, _STRIDE)
+    return q, r - _HALF
+
+
+def to_cube(point: HexPoint) -> tuple[int, int, int]:
+    """
+    The cube `(q, r, s)` coordinates of a packed point, where `q + r + s == 0`.
+    """
+    q, r = unpack(point)
+    return q, r, -q - r
+
+
+def distance(a: HexPoint, b: HexPoint = ORIGIN) -> int:
+    """
+    The fewest steps it takes to walk between two hexes.
+    """
+    q, r = unpack(a - b)
+    return (abs(q) + abs(r) + abs(q + r)) // 2
+
+
+POINTY_DIRECTIONS: dict[str, HexPoint] = {
+    "e": pack(1, 0),
+    "w": pack(-1, 0),
+    "ne": pack(1, -1),
+    "nw": pack(0, -1),
+    "se": pack(0, 1),
+    "sw": pack(-1, 1),
+}
+"""
+Steps on a grid where hexes have a point at the top (so they have east and west neighbors).
+"""
+
+FLAT_DIRECTIONS: dict[str, HexPoint] = {
+    "n": pack(0, -1),
+    "s": pack(0, 1),
+    "ne": pack(1, -1),
+    "nw": pack(-1, 0),
+    "se": pack(1, 0),
+    "sw": pack(-1, 1),
+}
+"""
+Steps on a grid where hexes have a flat top (so they have north and south neighbors).
+"""
+
+NEIGHBOR_OFFSETS: tuple[HexPoint, ...] = tuple(POINTY_DIRECTIONS.values())
+"""
+Every step to an adjacent hex. These are the same regardless of orientation; only their names change.
+"""
+
+# longest match first, so `ne` is never read as `n` followed by `e`
+_DIRECTION_TOKEN = re.compile(r"[ns][ew]?|[ew]")
+
+
+def parse_steps(
+    line: str, directions: dict[str, HexPoint] = POINTY_DIRECTIONS
+) -> list[HexPoint]:
+    """
+    Tokenizes a whole line of directions (like `esenee` or `ne,ne,s`) with a single regex pass and returns each step's offset.
+    """
+    return [directions[token] for token in _DIRECTION_TOKEN.findall(line)]
+
+
+def walk(line: str, directions: dict[str, HexPoint] = POINTY_DIRECTIONS) -> HexPoint:
+    """
+    Where you end up after following every step in `line`, starting from the origin.
+    """
+    return sum(parse_steps(line, directions))
+
+
+def path(
+    line: str, directions: dict[str, HexPoint] = POINTY_DIRECTIONS
+) -> list[HexPoint]:
+    """
+    Every point visited while following `line` (not including the origin).
+    """
+    return list(accumulate(parse_steps(line, directions)))
+
+
+def neighbor_counts(tiles: Iterable[HexPoint]) -> Counter[HexPoint]:
+    """
+    How many of `tiles` each hex is adjacent to. Hexes with no neighbors in `tiles` are left out.
+    """
+    tiles = list(tiles)
+    counts: Counter[HexPoint] = Counter()
+    # one pass per direction, each of which is a single comprehension over plain ints
+    for offset in NEIGHBOR_OFFSETS:
+        counts.update([t + offset for t in tiles])
+    return counts
+
+
+def step_automaton(
+    tiles: set[HexPoint],
+    born: frozenset[int] = frozenset({2}),
+    survives: frozenset[int] = frozenset({1, 2}),
+) -> set[HexPoint]:
+    """
+    Runs one generation of a hex cellular automaton. An empty hex becomes active if its number of active neighbors is in `born`, and an active hex stays active if its count is in `survives`.
+    """
+    return {
+        tile
+        for tile, count in neighbor_counts(tiles).items()
+        if count in (survives if tile in tiles else born)
+    }
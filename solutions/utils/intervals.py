@@ -0,0 +1,310 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain, product
+from operator import and_, or_, xor
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+type Interval = tuple[int, int] | range
+
+
+class IntervalSet:
+    """
+    An immutable set of ints, stored as sorted, non-overlapping, half-open `[start, stop)` intervals (the same as `range`). Internally, it's a flat list of boundaries: `[start_0, stop_0, start_1, stop_1, ...]`, so a value is in the set if an odd number of boundaries are `<=` it. That makes lookups a single `bisect`, and combining two sets a single merge of their boundaries; neither cares how big the intervals are.
+
+    ```
+    a = IntervalSet([range(0, 10), (20, 30)])
+    b = IntervalSet([(5, 25)])
+    list(a | b) # [range(0, 30)]
+    list(a & b) # [range(5, 10), range(20, 25)]
+    list(a - b) # [range(0, 5), range(25, 30)]
+    len(a) # 20
+    15 in a # False
+    ```
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        bounds: list[int] = []
+        for start, stop in sorted(_as_pair(i) for i in intervals):
+            if start >= stop:
+                continue
+            if bounds and start <= bounds[-1]:
+                # overlaps or touches the previous interval, so extend it
+                bounds[-1] = max(bounds[-1], stop)
+            else:
+                bounds += [start, stop]
+
+        self.bounds = bounds
+
+    @classmethod
+    def _from_bounds(cls, bounds: list[int]) -> "IntervalSet":
+        result = cls()
+        result.bounds = bounds
+        return result
+
+    @classmethod
+    def union_all(cls, sets: Iterable["IntervalSet"]) -> "IntervalSet":
+        return cls(chain.from_iterable(s.pairs() for s in sets))
+
+    def pairs(self) -> Iterator[tuple[int, int]]:
+        """
+        Each interval as a `(start, stop)` tuple.
+        """
+        bounds = self.bounds
+        return zip(bounds[::2], bounds[1::2])
+
+    def __iter__(self) -> Iterator[range]:
+        return (range(start, stop) for start, stop in self.pairs())
+
+    def __len__(self) -> int:
+        """
+        The number of values in the set (not the number of intervals).
+        """
+        return sum(stop - start for start, stop in self.pairs())
+
+    @property
+    def num_intervals(self) -> int:
+        return len(self.bounds) // 2
+
+    def __bool__(self) -> bool:
+        return bool(self.bounds)
+
+    def __contains__(self, value: int) -> bool:
+        return bisect_right(self.bounds, value) % 2 == 1
+
+    @property
+    def start(self) -> int:
+        """
+        The smallest value in the set.
+        """
+        return self.bounds[0]
+
+    @property
+    def stop(self) -> int:
+        """
+        One more than the largest value in the set.
+        """
+        return self.bounds[-1]
+
+    def clip(self, start: int, stop: int) -> "IntervalSet":
+        """
+        Only the parts of this set between `start` and `stop`. Much cheaper than `&` when you're intersecting with a single interval.
+        """
+        if start >= stop:
+            return IntervalSet()
+
+        bounds = self.bounds
+        lo = bisect_right(bounds, start)
+        hi = bisect_left(bounds, stop)
+
+        # if either end lands inside an interval, cut that interval short
+        return IntervalSet._from_bounds(
+            ([start] if lo % 2 else []) + bounds[lo:hi] + ([stop] if hi % 2 else [])
+        )
+
+    def overlaps(self, start: int, stop: int) -> bool:
+        """
+        Whether any value in `[start, stop)` is in this set.
+        """
+        lo = bisect_right(self.bounds, start)
+        return start < stop and (lo % 2 == 1 or lo < bisect_left(self.bounds, stop))
+
+    def shift(self, offset: int) -> "IntervalSet":
+        return IntervalSet._from_bounds([b + offset for b in self.bounds])
+
+    def _combine(
+        self, other: "IntervalSet", keep: Callable[[bool, bool], bool]
+    ) -> "IntervalSet":
+        """
+        Sweeps over both sets of boundaries at once, emitting a boundary every time `keep(in_self, in_other)` changes.
+        """
+        a, b = self.bounds, other.bounds
+        i = j = 0
+        in_a = in_b = False
+        inside = False
+        result: list[int] = []
+
+        while i < len(a) or j < len(b):
+            # the next boundary from either set
+            point = a[i] if j == len(b) or (i < len(a) and a[i] <= b[j]) else b[j]
+            while i < len(a) and a[i] == point:
+                in_a = not in_a
+                i += 1
+            while j < len(b) and b[j] == point:
+                in_b = not in_b
+                j += 1
+
+            if bool(keep(in_a, in_b)) != inside:
+                inside = not inside
+                result.append(point)
+
+        return IntervalSet._from_bounds(result)
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, or_)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, and_)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, lambda x, y: x and not y)
+
+    def __xor__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, xor)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.bounds == other.bounds
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.bounds))
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self.pairs())})"
+
+
+def _as_pair(interval: Interval) -> tuple[int, int]:
+    if isinstance(interval, range):
+        assert interval.step == 1, "only contiguous ranges are supported"
+        return interval.start, interval.stop
+    return interval
+
+
+class OffsetMap:
+    """
+    A piecewise mapping of ints: each `(start, stop, offset)` piece adds `offset` to values in `[start, stop)`. Values that aren't covered by any piece map to themselves. Pieces can't overlap.
+
+    It can map single values (a `bisect`) or whole `IntervalSet`s at once, which splits intervals wherever they cross a piece boundary.
+
+    ```
+    m = OffsetMap([(10, 20, 100)])
+    m[15] # 115
+    m[25] # 25
+    list(m.apply(IntervalSet([(5, 15)]))) # [range(5, 10), range(110, 115)]
+    ```
+    """
+
+    def __init__(self, pieces: Iterable[tuple[int, int, int]]) -> None:
+        self.pieces = sorted(pieces)
+        self.starts = [start for start, _, _ in self.pieces]
+        self.sources = IntervalSet((start, stop) for start, stop, _ in self.pieces)
+        assert len(self.sources) == sum(
+            stop - start for start, stop, _ in self.pieces
+        ), "pieces can't overlap"
+
+    def __getitem__(self, value: int) -> int:
+        i = bisect_right(self.starts, value) - 1
+        if i >= 0:
+            _, stop, offset = self.pieces[i]
+            if value < stop:
+                return value + offset
+        return value
+
+    def apply(self, values: IntervalSet) -> IntervalSet:
+        """
+        Map every value in `values` at once.
+        """
+        if not values:
+            return values
+
+        # only pieces that could possibly overlap `values` are worth clipping
+        first = max(bisect_right(self.starts, values.start) - 1, 0)
+        last = bisect_left(self.starts, values.stop)
+
+        moved = [
+            values.clip(start, stop).shift(offset)
+            for start, stop, offset in self.pieces[first:last]
+        ]
+        return IntervalSet.union_all([values - self.sources, *moved])
+
+
+class Box(NamedTuple):
+    """
+    An N-dimensional, axis-aligned box, with a half-open `[start, stop)` interval for each dimension.
+
+    ```
+    a = Box(((0, 10), (0, 10)))
+    b = Box(((5, 15), (5, 15)))
+    (a & b).volume # 25
+    sum(piece.volume for piece in a - b) # 75
+    ```
+    """
+
+    bounds: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def from_ranges(cls, *ranges: Interval) -> "Box":
+        return cls(tuple(_as_pair(r) for r in ranges))
+
+    @property
+    def volume(self) -> int:
+        result = 1
+        for start, stop in self.bounds:
+            result *= max(stop - start, 0)
+        return result
+
+    def __bool__(self) -> bool:
+        return self.volume > 0
+
+    def __contains__(self, point: tuple[int, ...]) -> bool:
+        return all(
+            start <= p < stop
+            for p, (start, stop) in zip(point, self.bounds, strict=True)
+        )
+
+    def __and__(self, other: "Box") -> Optional["Box"]:
+        """
+        The overlapping part of both boxes, if any.
+        """
+        result = Box(
+            tuple(
+                (max(a_start, b_start), min(a_stop, b_stop))
+                for (a_start, a_stop), (b_start, b_stop) in zip(
+                    self.bounds, other.bounds, strict=True
+                )
+            )
+        )
+        return result if result else None
+
+    def __sub__(self, other: "Box") -> list["Box"]:
+        """
+        The parts of this box that aren't in `other`, as non-overlapping boxes.
+        """
+        if not (overlap := self & other):
+            return [self]
+
+        # split each dimension into (up to) 3 pieces: before, during, and after the overlap.
+        # every combination other than "during" in every dimension is outside `other`
+        splits = [
+            [
+                piece
+                for piece in ((start, o_start), (o_start, o_stop), (o_stop, stop))
+                if piece[0] < piece[1]
+            ]
+            for (start, stop), (o_start, o_stop) in zip(self.bounds, overlap.bounds)
+        ]
+        return [Box(pieces) for pieces in product(*splits) if pieces != overlap.bounds]
+
+
+class BoxSet:
+    """
+    A union of N-dimensional boxes, stored as a list of non-overlapping `Box`es so the total volume is easy to compute. Adding or removing a box only splits the boxes it actually touches.
+    """
+
+    def __init__(self, boxes: Iterable[Box] = ()) -> None:
+        self.boxes: list[Box] = []
+        for box in boxes:
+            self.add(box)
+
+    def remove(self, box: Box) -> None:
+        self.boxes = list(chain.from_iterable(b - box for b in self.boxes))
+
+    def add(self, box: Box) -> None:
+        self.remove(box)
+        self.boxes.append(box)
+
+    @property
+    def volume(self) -> int:
+        return sum(b.volume for b in self.boxes)
+
+    def __contains__(self, point: tuple[int, ...]) -> bool:
+        return any(point in b for b in self.boxes)
@@ -0,0 +1,150 @@
+from typing import Iterator, Optional
+
+from .graphs import GridPoint
+
+CHUNK_BITS = 6
+CHUNK_SIZE = 1 << CHUNK_BITS  # 64
+_CHUNK_MASK = CHUNK_SIZE - 1
+
+type ChunkKey = tuple[int, int]
+
+# maps every non-zero byte to 1, so `find(1)` locates any set cell
+_NONZERO = bytes([0] + [1] * 255)
+
+
+class ChunkedGrid:
+    """
+    An unbounded `(row, col)` grid of small ints (0-255) for simulations that keep spreading outwards. Instead of one giant dict, it's made of fixed-size, 64x64 `bytearray` tiles that are only allocated once something is written in them (and dropped again once they're empty).
+
+    Cells default to 0, which also means "not in the grid" for membership checks. Since everything is grouped into chunks, finding the bounding box only needs to look inside the outermost chunks instead of every point.
+
+    ```
+    grid = ChunkedGrid()
+    grid.add((0, 0))
+    grid[(-100, 500)] = 2
+    (0, 0) in grid # True
+    grid[(5, 5)] # 0
+    grid.bounds() # (-100, 0, 0, 500)
+    len(grid) # 2
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.chunks: dict[ChunkKey, bytearray] = {}
+        # number of non-zero cells in each chunk, so empty ones can be dropped
+        self._counts: dict[ChunkKey, int] = {}
+
+    def __getitem__(self, point: GridPoint) -> int:
+        row, col = point
+        chunk = self.chunks.get((row >> CHUNK_BITS, col >> CHUNK_BITS))
+        if chunk is None:
+            return 0
+        return chunk[(row & _CHUNK_MASK) << CHUNK_BITS | (col & _CHUNK_MASK)]
+
+    def __setitem__(self, point: GridPoint, value: int) -> None:
+        row, col = point
+        key = (row >> CHUNK_BITS, col >> CHUNK_BITS)
+        index = (row & _CHUNK_MASK) << CHUNK_BITS | (col & _CHUNK_MASK)
+
+        if (chunk := self.chunks.get(key)) is None:
+            if not value:
+                return
+            chunk = self.chunks[key] = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+            self._counts[key] = 0
+
+        was_set = chunk[index] != 0
+        chunk[index] = value
+
+        if was_set != bool(value):
+            self._counts[key] += 1 if value else -1
+            if not self._counts[key]:
+                del self.chunks[key]
+                del self._counts[key]
+
+    def __contains__(self, point: GridPoint) -> bool:
+        return self[point] != 0
+
+    def add(self, point: GridPoint) -> None:
+        self[point] = 1
+
+    def discard(self, point: GridPoint) -> None:
+        self[point] = 0
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.chunks)
+
+    def iter_chunks(self) -> Iterator[tuple[GridPoint, bytearray]]:
+        """
+        Yields the `(row, col)` of the top left corner of each non-empty chunk, plus its data (row-major, `CHUNK_SIZE` cells per row). Empty regions are skipped entirely.
+        """
+        for (chunk_row, chunk_col), chunk in self.chunks.items():
+            yield (chunk_row << CHUNK_BITS, chunk_col << CHUNK_BITS), chunk
+
+    def __iter__(self) -> Iterator[GridPoint]:
+        """
+        Yields every non-zero point, chunk by chunk.
+        """
+        for (top, left), chunk in self.iter_chunks():
+            flags = chunk.translate(_NONZERO)
+            i = flags.find(1)
+            while i != -1:
+                yield top + (i >> CHUNK_BITS), left + (i & _CHUNK_MASK)
+                i = flags.find(1, i + 1)
+
+    def items(self) -> Iterator[tuple[GridPoint, int]]:
+        for point in self:
+            yield point, self[point]
+
+    def bounds(self) -> Optional[tuple[int, int, int, int]]:
+        """
+        The `(min_row, min_col, max_row, max_col)` of every non-zero cell (inclusive), or `None` if the grid is empty. Only the chunks along each edge get scanned.
+        """
+        if not self.chunks:
+            return None
+
+        chunk_rows = [r for r, _ in self.chunks]
+        chunk_cols = [c for _, c in self.chunks]
+        top, bottom = min(chunk_rows), max(chunk_rows)
+        left, right = min(chunk_cols), max(chunk_cols)
+
+        def rows_in(key: ChunkKey) -> list[int]:
+            flags = self.chunks[key].translate(_NONZERO)
+            return [flags.find(1) >> CHUNK_BITS, flags.rfind(1) >> CHUNK_BITS]
+
+        def cols_in(key: ChunkKey) -> list[int]:
+            flags = self.chunks[key].translate(_NONZERO)
+            cols = [
+                i
+                for i in range(CHUNK_SIZE)
+                if 1 in flags[i::CHUNK_SIZE]  # every cell in column `i`
+            ]
+            return [cols[0], cols[-1]]
+
+        return (
+            (top << CHUNK_BITS)
+            + min(rows_in(k)[0] for k in self.chunks if k[0] == top),
+            (left << CHUNK_BITS)
+            + min(cols_in(k)[0] for k in self.chunks if k[1] == left),
+            (bottom << CHUNK_BITS)
+            + max(rows_in(k)[1] for k in self.chunks if k[0] == bottom),
+            (right << CHUNK_BITS)
+            + max(cols_in(k)[1] for k in self.chunks if k[1] == right),
+        )
+
+    def render(self, chars: str = ".#", padding: int = 0) -> str:
+        """
+        Draws the grid (within its bounds), using `chars[value]` for each cell.
+        """
+        if not (corners := self.bounds()):
+            return ""
+        min_row, min_col, max_row, max_col = corners
+        return "\n".join(
+            "".join(
+                chars[self[row, col]]
+                for col in range(min_col - padding, max_col + padding + 1)
+            )
+            for row in range(min_row - padding, max_row + padding + 1)
+        )
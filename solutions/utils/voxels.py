@@ -0,0 +1,272 @@
+from itertools import product
+from typing import Iterable, Iterator, Optional
+
+type Point3D = tuple[int, int, int]
+
+NEIGHBORS_26: tuple[Point3D, ...] = tuple(
+    p for p in product((-1, 0, 1), repeat=3) if p != (0, 0, 0)
+)
+"""
+Offsets to every point in the surrounding 3x3x3 cube, including diagonals.
+"""
+NEIGHBORS_6: tuple[Point3D, ...] = tuple(
+    p for p in NEIGHBORS_26 if sum(map(abs, p)) == 1
+)
+"""
+Offsets to the 6 points that share a face.
+"""
+
+# both tables only ever map 0/1 bytes to and from ascii digits
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def add_points_3d(a: Point3D, b: Point3D) -> Point3D:
+    return a[0] + b[0], a[1] + b[1], a[2] + b[2]
+
+
+def neighbors_3d(center: Point3D, num_directions=6) -> list[Point3D]:
+    """
+    Every point that shares a face (6) or any corner (26) with `center`. Uses precomputed offsets, so it's just additions.
+    """
+    assert num_directions in {6, 26}
+    x, y, z = center
+    return [
+        (x + dx, y + dy, z + dz)
+        for dx, dy, dz in (NEIGHBORS_6 if num_directions == 6 else NEIGHBORS_26)
+    ]
+
+
+class VoxelGrid:
+    """
+    A dense, fixed-size 3D grid of filled/empty cells, backed by a `bytearray` (one byte per cell) over the box from `min_corner` to `max_corner` (inclusive).
+
+    Whole-grid operations (`surface_area`, `flood_fill`) convert the grid to a single big int with one bit per cell and work with shifts and popcounts, so they don't loop over cells in Python.
+
+    Internally, each row (and each layer) has one extra, never-filled cell at the end, so shifting along the `y` or `z` axis can't wrap from one row into the next. The public API only ever deals in real points.
+
+    ```
+    grid = VoxelGrid.from_points([(1, 1, 1), (2, 1, 1)])
+    grid.surface_area() # 10
+    (1, 1, 1) in grid # True
+    ```
+    """
+
+    def __init__(self, min_corner: Point3D, max_corner: Point3D) -> None:
+        self.min_corner = min_corner
+        self.max_corner = max_corner
+        self.shape: Point3D = (
+            max_corner[0] - min_corner[0] + 1,
+            max_corner[1] - min_corner[1] + 1,
+            max_corner[2] - min_corner[2] + 1,
+        )
+        assert all(s > 0 for s in self.shape), "max_corner must be >= min_corner"
+
+        _, size_y, size_z = self.shape
+        row = size_z + 1
+        layer = (size_y + 1) * row
+        self.strides: Point3D = (layer, row, 1)
+        self.cells = bytearray(self.shape[0] * layer)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point3D], padding=1) -> "VoxelGrid":
+        """
+        Build the smallest grid that holds all `points` (plus `padding` empty cells on every side) and fill them in. The padding leaves room to `flood_fill` around the outside of the shape.
+        """
+        points = list(points)
+        assert points, "need at least one point"
+        grid = cls(
+            tuple(min(p[i] for p in points) - padding for i in range(3)),  # type: ignore
+            tuple(max(p[i] for p in points) + padding for i in range(3)),  # type: ignore
+        )
+        for p in points:
+            grid.add(p)
+        return grid
+
+    def in_bounds(self, point: Point3D) -> bool:
+        return all(
+            lo <= p <= hi for p, lo, hi in zip(point, self.min_corner, self.max_corner)
+        )
+
+    def index(self, point: Point3D) -> int:
+        x, y, z = point
+        min_x, min_y, min_z = self.min_corner
+        stride_x, stride_y, _ = self.strides
+        return (x - min_x) * stride_x + (y - min_y) * stride_y + (z - min_z)
+
+    def point(self, index: int) -> Point3D:
+        stride_x, stride_y, _ = self.strides
+        x, rest = divmod(index, stride_x)
+        y, z = divmod(rest, stride_y)
+        min_x, min_y, min_z = self.min_corner
+        return x + min_x, y + min_y, z + min_z
+
+    def add(self, point: Point3D) -> None:
+        if not self.in_bounds(point):
+            raise IndexError(f"{point} is outside of the grid")
+        self.cells[self.index(point)] = 1
+
+    def discard(self, point: Point3D) -> None:
+        if self.in_bounds(point):
+            self.cells[self.index(point)] = 0
+
+    def __contains__(self, point: Point3D) -> bool:
+        return self.in_bounds(point) and self.cells[self.index(point)] == 1
+
+    def __len__(self) -> int:
+        return self.cells.count(1)
+
+    def __iter__(self) -> Iterator[Point3D]:
+        cells = self.cells
+        i = cells.find(1)
+        while i != -1:
+            yield self.point(i)
+            i = cells.find(1, i + 1)
+
+    def filled_bounds(self) -> Optional[tuple[Point3D, Point3D]]:
+        """
+        The (inclusive) corners of the smallest box that holds every filled cell, if there are any.
+        """
+        points = list(self)
+        if not points:
+            return None
+        return (
+            tuple(min(p[i] for p in points) for i in range(3)),  # type: ignore
+            tuple(max(p[i] for p in points) for i in range(3)),  # type: ignore
+        )
+
+    # whole-grid operations
+
+    def _bits(self) -> int:
+        """
+        The grid as a single int, where bit `i` is `self.cells[i]`.
+        """
+        return int(self.cells.translate(_TO_DIGITS)[::-1] or b"0", 2)
+
+    def _from_bits(self, bits: int) -> "VoxelGrid":
+        result = VoxelGrid(self.min_corner, self.max_corner)
+        digits = bin(bits)[2:].zfill(len(self.cells))[::-1].encode()
+        result.cells = bytearray(digits.translate(_FROM_DIGITS))
+        return result
+
+    def _repeat(self, bits: int, count: int, stride: int) -> int:
+        """
+        `count` copies of `bits`, each `stride` further along than the last.
+        """
+        return sum(bits << (i * stride) for i in range(count))
+
+    def _real_cells(self) -> int:
+        """
+        A mask of every cell that isn't row or layer padding.
+        """
+        size_x, size_y, size_z = self.shape
+        stride_x, stride_y, _ = self.strides
+        row = (1 << size_z) - 1
+        return self._repeat(self._repeat(row, size_y, stride_y), size_x, stride_x)
+
+    def _boundary_cells(self) -> int:
+        """
+        A mask of every cell on the outside faces of the grid.
+        """
+        size_x, size_y, size_z = self.shape
+        stride_x, stride_y, _ = self.strides
+        row = (1 << size_z) - 1
+        layer = self._repeat(row, size_y, stride_y)
+        row_ends = 1 | 1 << (size_z - 1)
+
+        return (
+            layer
+            | layer << ((size_x - 1) * stride_x)
+            | self._repeat(row | row << ((size_y - 1) * stride_y), size_x, stride_x)
+            | self._repeat(self._repeat(row_ends, size_y, stride_y), size_x, stride_x)
+        )
+
+    def _spread(self, bits: int) -> int:
+        """
+        Every cell that shares a face with a set cell (including the set cells themselves).
+        """
+        result = bits
+        for stride in self.strides:
+            result |= bits << stride | bits >> stride
+        return result
+
+    def _faces_between(self, a: int, b: int) -> int:
+        """
+        The number of faces where a cell in `a` touches a cell in `b`.
+        """
+        return sum(
+            ((a & (b >> stride)) | (b & (a >> stride))).bit_count()
+            for stride in self.strides
+        )
+
+    def surface_area(self) -> int:
+        """
+        The number of faces of filled cells that aren't touching another filled cell.
+        """
+        bits = self._bits()
+        # pad a layer of empty cells at the bottom so faces on the `min_corner` edges get counted too
+        padded = bits << self.strides[0]
+        return sum((padded ^ (padded >> stride)).bit_count() for stride in self.strides)
+
+    def flood_fill(self, start: Point3D) -> "VoxelGrid":
+        """
+        Every empty cell reachable from `start` by stepping between empty cells that share a face. Expands the whole frontier at once, so it takes one big-int step per unit of distance rather than one Python step per cell.
+        """
+        assert start not in self, "can't flood from a filled cell"
+        return self._from_bits(self._flood(1 << self.index(start)))
+
+    def _flood(self, seed: int) -> int:
+        open_cells = self._real_cells() & ~self._bits()
+        reached = seed & open_cells
+        while (expanded := self._spread(reached) & open_cells) != reached:
+            reached = expanded
+        return reached
+
+    def exterior_surface_area(self) -> int:
+        """
+        Like `surface_area`, but skips faces that touch an air pocket that's fully enclosed by filled cells. Everything past the edges of the grid counts as outside.
+        """
+        filled = self._bits()
+        outside = self._flood(self._boundary_cells())
+        pockets = self._real_cells() & ~filled & ~outside
+        return self.surface_area() - self._faces_between(filled, pockets)
+
+
+class HeightMap[T]:
+    """
+    Tracks the top of a pile of objects that are dropped straight down (along `z`), like bricks or falling rocks. For each `(x, y)` column it remembers the height of the highest object and which object that is.
+
+    ```
+    pile = HeightMap[str]()
+    pile.drop("a", [(0, 0), (1, 0)], height=1) # (0, set())
+    pile.drop("b", [(1, 0)], height=2) # (1, {"a"})
+    ```
+    """
+
+    def __init__(self, floor=0) -> None:
+        self.floor = floor
+        self.heights: dict[tuple[int, int], int] = {}
+        self.tops: dict[tuple[int, int], T] = {}
+
+    def height_at(self, column: tuple[int, int]) -> int:
+        return self.heights.get(column, self.floor)
+
+    def drop(
+        self, id_: T, footprint: Iterable[tuple[int, int]], height: int
+    ) -> tuple[int, set[T]]:
+        """
+        Drop an object covering the `(x, y)` cells in `footprint` that's `height` tall. Returns the height it came to rest on (its bottom is the level above that) and the ids of every object it's resting on.
+        """
+        footprint = list(footprint)
+        rest_on = max(self.height_at(c) for c in footprint)
+        supported_by = {
+            self.tops[c]
+            for c in footprint
+            if c in self.tops and self.heights[c] == rest_on
+        }
+
+        for c in footprint:
+            self.heights[c] = rest_on + height
+            self.tops[c] = id_
+
+        return rest_on, supported_by
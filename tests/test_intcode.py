@@ -0,0 +1,75 @@
+import unittest
+from importlib import import_module
+
+intcode = import_module("solutions.2019.intcode")
+
+
+class TestIntcodeComputer(unittest.TestCase):
+    def test_callback_index_errors_propagate(self):
+        def bad_sink(_value: int):
+            raise IndexError("from the sink")
+
+        for jit in (False, True):
+            with self.subTest(jit=jit):
+                computer = intcode.IntcodeComputer(
+                    [3, 0, 4, 0, 99], input_provider=[].pop, jit=jit
+                )
+                with self.assertRaisesRegex(IndexError, "empty list"):
+                    computer.run()
+                self.assertEqual(len(computer.program), 5)
+
+                computer = intcode.IntcodeComputer(
+                    [104, 1, 99], output_sink=bad_sink, jit=jit
+                )
+                with self.assertRaisesRegex(IndexError, "from the sink"):
+                    computer.run()
+                self.assertEqual(len(computer.program), 3)
+
+    def test_memory_grows_past_the_end(self):
+        for jit in (False, True):
+            with self.subTest(jit=jit):
+                # position and relative writes well past the end of the program
+                computer = intcode.IntcodeComputer(
+                    [1101, 5, 6, 1000, 109, 2000, 21101, 1, 2, 0, 4, 1000, 204, 0, 99],
+                    jit=jit,
+                )
+                computer.run()
+                self.assertEqual(computer.output, [11, 3])
+
+    def test_negative_addresses_are_rejected(self):
+        programs = {
+            "position read": [1, -1, 0, 0, 99],
+            "position write": [1101, 1, 1, -3, 99],
+            "relative read": [204, -1, 99],
+            "relative write": [21101, 1, 1, -1, 99],
+            "jump": [1105, 1, -4, 99],
+            # outputs once, then patches its own parameter to -1
+            "patched parameter": [4, 9, 1101, 0, -1, 1, 1105, 1, 0, 99],
+        }
+        for jit in (False, True):
+            for name, program in programs.items():
+                with self.subTest(name, jit=jit):
+                    computer = intcode.IntcodeComputer(program, jit=jit)
+                    with self.assertRaisesRegex(ValueError, "negative address"):
+                        computer.run()
+
+
+class TestIntcodeFunction(unittest.TestCase):
+    def test_memory_args_change_between_calls(self):
+        # adds the values at addresses 1 and 2 (the args) and stores it in 5
+        program = [1, 0, 0, 5, 99, 0]
+        for jit in (False, True):
+            with self.subTest(jit=jit):
+                add = intcode.IntcodeFunction(
+                    program, memory_args=(1, 2), returns=(5,), jit=jit
+                )
+                # mem[0] + mem[0]
+                self.assertEqual(add(0, 0), (2,))
+                # mem[0] + mem[1]
+                self.assertEqual(add(0, 1), (1,))
+                self.assertEqual(add(4, 4), (198,))
+                self.assertEqual(add(0, 0), (2,))
+
+
+if __name__ == "__main__":
+    unittest.main()
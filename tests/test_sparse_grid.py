@@ -0,0 +1,47 @@
+import unittest
+
+from solutions.utils.sparse_grid import ChunkedGrid
+
+
+class TestChunkedGrid(unittest.TestCase):
+    def test_bounds_across_chunks(self):
+        points = {(0, 0), (-100, 500), (63, -1), (64, 64), (-1, 7)}
+        grid = ChunkedGrid()
+        for point in points:
+            grid.add(point)
+
+        self.assertEqual(set(grid), points)
+        self.assertEqual(len(grid), len(points))
+        self.assertEqual(
+            grid.bounds(),
+            (
+                min(r for r, _ in points),
+                min(c for _, c in points),
+                max(r for r, _ in points),
+                max(c for _, c in points),
+            ),
+        )
+
+    def test_empty_chunks_are_dropped(self):
+        grid = ChunkedGrid()
+        grid[5, 5] = 2
+        grid[200, 200] = 1
+        grid.discard((200, 200))
+
+        self.assertEqual(len(grid.chunks), 1)
+        self.assertEqual(grid.bounds(), (5, 5, 5, 5))
+        self.assertEqual(list(grid.items()), [((5, 5), 2)])
+
+        grid.discard((5, 5))
+        self.assertFalse(grid)
+        self.assertIsNone(grid.bounds())
+
+    def test_render(self):
+        grid = ChunkedGrid()
+        grid[0, 0] = 1
+        grid[1, 2] = 2
+        self.assertEqual(grid.render(".#o"), "#..\n..o")
+
+
+if __name__ == "__main__":
+    unittest.main()